@@ -7,9 +7,40 @@ import unittest
 import time
 import sys
 import os
+import json
+import tempfile
+import io
+import random
+import math
+import itertools
+import threading
+import asyncio
+import queue
+import bisect
+import tracemalloc
+from collections import deque
 
 # Importar las clases del simulador
-from proyecto import LanSimulator, LanNode, Emergency
+from proyecto import LanSimulator, LanNode, Emergency, create_example_topology_file
+from event_journal import EventJournal
+from topology_binary import MappedTopology
+from topology_loader import iter_topology
+from metrics_exporter import MetricsExporter
+from centrality import betweenness_centrality
+from validador_parentesis import validar_flujo, validar_texto
+from cola_circular import ColaCircular, VACIA
+from cola_concurrente import ColaAcotada
+from arbol_binario import ArbolBinario
+from arbol_avl import ArbolAVL
+from arbol_b import ArbolB
+from busquedas import (busqueda_lineal, busqueda_binaria, busqueda_interpolacion,
+                        busqueda_exponencial, busqueda_bisect)
+from benchmark_busquedas import tamaños_geometricos, ajustar_exponente, correr_barrido
+from sudoku import EJEMPLO, resolver, leer_tablero, a_texto, resolver_lote, resolver_archivo, MIN_POR_PROCESO
+from combinatoria import (permutaciones_heap, siguiente_permutacion, permutaciones_lexicograficas,
+                          combinaciones, combinaciones_con_repeticion, posicion_permutacion,
+                          permutacion_en_posicion, bloque_permutaciones, posicion_combinacion,
+                          combinacion_en_posicion, bloque_combinaciones)
 
 class TestLanSimulator(unittest.TestCase):
     """Clase de pruebas unitarias para el simulador LAN"""
@@ -329,6 +360,1298 @@ class TestCase7_RecuperacionFallos(TestLanSimulator):
         
         print(f"✓ Sistema se recuperó exitosamente de {len(failed_nodes)} fallos")
 
+class TestCase8_DiarioEventos(TestLanSimulator):
+    #Caso de Prueba 8: Recuperación desde snapshot + diario de eventos
+    
+    def test_recuperacion_desde_diario(self):
+        print("\n=== CASO 8: RECUPERACIÓN DESDE DIARIO DE EVENTOS ===")
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            snapshot_file = os.path.join(tmp_dir, "snapshot.json")
+            journal_file = os.path.join(tmp_dir, "eventos.journal")
+            
+            # Snapshot inicial y diario con las mutaciones posteriores
+            self.simulator.save_snapshot(snapshot_file)
+            journal = EventJournal(journal_file)
+            self.simulator.attach_journal(journal)
+            
+            self.simulator.add_emergency(Emergency("E1", "INCENDIO", (25, 85), 1000.0))
+            self.simulator.add_emergency(Emergency("E2", "ROBO", (60, 60), 1001.0))
+            self.simulator.simulate_node_failure("N4")
+            self.simulator.process_next_emergency()
+            journal.close()
+            
+            # "Caída": un simulador nuevo se reconstruye desde disco
+            recovered = LanSimulator()
+            replayed = recovered.recover_from_journal(snapshot_file, journal_file)
+            print(f"Eventos reproducidos: {replayed}")
+            
+            self.assertEqual(replayed, 4)
+            self.assertFalse(recovered.nodes["N4"].active)
+            self.assertEqual(recovered.emergency_registry["E1"].status, "COMPLETADA")
+            self.assertEqual([e.emergency_id for e in recovered.emergencies], ["E2"])
+            self.assertEqual(recovered.stats["completed_emergencies"], 1)
+            assigned = self.simulator.emergency_registry["E1"].assigned_node
+            self.assertEqual(recovered.emergency_registry["E1"].assigned_node, assigned)
+            self.assertEqual(recovered.nodes[assigned].stats["incidents_handled"], 1)
+            
+            # Un despacho repetido (caída entre el snapshot y la rotación) no aborta la recuperación
+            journal = EventJournal(journal_file)
+            journal.log_dispatch("E1", assigned, 1.0)
+            journal.close()
+            recovered = LanSimulator()
+            self.assertEqual(recovered.recover_from_journal(snapshot_file, journal_file), 5)
+            self.assertEqual(recovered.nodes[assigned].stats["incidents_handled"], 1)
+            self.assertEqual([e.emergency_id for e in recovered.emergencies], ["E2"])
+    
+    def test_compactacion_en_segundo_plano(self):
+        print("\n=== CASO 8b: COMPACTACIÓN DEL DIARIO ===")
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            snapshot_file = os.path.join(tmp_dir, "snapshot.json")
+            journal_file = os.path.join(tmp_dir, "eventos.journal")
+            
+            journal = EventJournal(journal_file, snapshot_file=snapshot_file)
+            self.simulator.attach_journal(journal)
+            for i in range(5):
+                self.simulator.add_emergency(Emergency(f"E{i}", "ROBO", (30, 30), 1000.0 + i))
+            
+            # Se compacta al registrar el siguiente evento
+            journal.compact()
+            self.simulator.add_emergency(Emergency("E5", "ROBO", (30, 30), 1005.0))
+            self.assertTrue(journal.wait_for_compaction())
+            self.simulator.add_emergency(Emergency("E6", "ROBO", (30, 30), 1006.0))
+            journal.close()
+            
+            recovered = LanSimulator()
+            replayed = recovered.recover_from_journal(snapshot_file, journal_file)
+            print(f"Eventos reproducidos tras compactar: {replayed}")
+            
+            self.assertEqual(replayed, 1)
+            self.assertEqual(len(recovered.emergencies), 7)
+    
+    def test_compactacion_con_snapshot_fallido(self):
+        import event_journal
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            snapshot_file = os.path.join(tmp_dir, "snapshot.json")
+            journal_file = os.path.join(tmp_dir, "eventos.journal")
+            self.simulator.save_snapshot(snapshot_file)
+            journal = EventJournal(journal_file, snapshot_file=snapshot_file)
+            self.simulator.attach_journal(journal)
+            
+            def failing_snapshot(filename, state):
+                raise OSError("disco lleno")
+            
+            # Dos compactaciones seguidas fallan: la segunda no debe pisar el .old de la primera
+            original_write_snapshot = event_journal.write_snapshot
+            original_excepthook = threading.excepthook
+            event_journal.write_snapshot = failing_snapshot
+            threading.excepthook = lambda args: None
+            try:
+                for i in range(4):
+                    journal.compact()
+                    self.simulator.add_emergency(Emergency(f"E{i}", "ROBO", (30, 30), 1000.0 + i))
+                    self.assertTrue(journal.wait_for_compaction())
+            finally:
+                event_journal.write_snapshot = original_write_snapshot
+                threading.excepthook = original_excepthook
+            self.assertTrue(os.path.exists(journal_file + ".old"))
+            journal.commit()
+            
+            recovered = LanSimulator()
+            self.assertEqual(recovered.recover_from_journal(snapshot_file, journal_file), 4)
+            self.assertEqual([e.emergency_id for e in recovered.emergencies], ["E0", "E1", "E2", "E3"])
+            
+            # Con el snapshot otra vez disponible, la compactación descarta el .old
+            journal.compact()
+            self.simulator.add_emergency(Emergency("E4", "ROBO", (30, 30), 1004.0))
+            self.assertTrue(journal.wait_for_compaction())
+            journal.close()
+            self.assertFalse(os.path.exists(journal_file + ".old"))
+            recovered = LanSimulator()
+            self.assertEqual(recovered.recover_from_journal(snapshot_file, journal_file), 0)
+            self.assertEqual(len(recovered.emergencies), 5)
+    
+    def test_identificadores_largos(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            snapshot_file = os.path.join(tmp_dir, "snapshot.json")
+            journal_file = os.path.join(tmp_dir, "eventos.journal")
+            self.simulator.save_snapshot(snapshot_file)
+            self.simulator.attach_journal(EventJournal(journal_file))
+            long_id = "E-" + "ñ" * 300  # Más de 255 bytes en UTF-8
+            self.simulator.add_emergency(Emergency(long_id, "INCENDIO", (25, 85), 1000.0))
+            self.simulator.process_next_emergency()
+            self.simulator.journal.close()
+            
+            recovered = LanSimulator()
+            self.assertEqual(recovered.recover_from_journal(snapshot_file, journal_file), 2)
+            self.assertEqual(recovered.emergency_registry[long_id].status, "COMPLETADA")
+
+class TestCase9_CargaIncremental(unittest.TestCase):
+    #Caso de Prueba 9: Carga incremental (streaming) de topologías
+    
+    def test_carga_incremental(self):
+        print("\n=== CASO 9: CARGA INCREMENTAL DE TOPOLOGÍA ===")
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filename = os.path.join(tmp_dir, "topologia.json")
+            create_example_topology_file(filename)
+            
+            # Comparar contra la carga completa con json.load
+            with open(filename) as file:
+                data = json.load(file)
+            
+            simulator = LanSimulator()
+            reports = []
+            num_nodes, num_connections = simulator.load_topology_streaming(
+                filename, progress=lambda *args: reports.append(args))
+            
+            self.assertEqual(num_nodes, len(data["nodes"]))
+            self.assertEqual(num_connections, len(data["connections"]))
+            self.assertEqual(simulator.nodes["N1"].location, (50, 50))
+            self.assertTrue(simulator.nodes["N3"].has_resource("PROTECCION_CIVIL"))
+            self.assertEqual(simulator.connections["N2"]["N5"], 2.0)
+            self.assertEqual(reports[-1][0], reports[-1][1])  # Termina en 100%
+            print(f"✓ {num_nodes} nodos y {num_connections} conexiones cargados")
+    
+    def test_errores_de_carga(self):
+        print("\n=== CASO 9b: ERRORES DE CARGA ===")
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filename = os.path.join(tmp_dir, "topologia.json")
+            with open(filename, "w") as file:
+                json.dump({"nodes": [{"id": "A", "name": "A", "type": "ROUTER", "location": [0, 0]}],
+                           "connections": [{"node1": "A", "node2": "B", "weight": 1.0}]}, file)
+            with self.assertRaises(ValueError):
+                LanSimulator().load_topology_streaming(filename)
+            
+            with open(filename, "w") as file:
+                file.write('{"nodes": [{"id": "A"}, ')
+            with self.assertRaises((ValueError, KeyError)):
+                LanSimulator().load_topology_streaming(filename)
+            
+            # Un error de sintaxis temprano se informa en su posición, sin leer el resto del archivo
+            nodes = [{"id": f"N{i}", "name": f"Nodo {i}", "type": "ROUTER", "location": [i, i]}
+                     for i in range(20000)]
+            text = json.dumps({"nodes": nodes, "connections": []})
+            typo = text.index('"name": "Nodo 3"') + len('"name"')
+            with open(filename, "w") as file:
+                file.write(text[:typo] + ";" + text[typo + 1:])  # "name"; en vez de "name":
+            tracemalloc.start()
+            try:
+                with self.assertRaises(ValueError) as context:
+                    for _ in iter_topology(filename, chunk_size=4096):
+                        pass
+                peak = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+            position = int(context.exception.args[0].split("byte ")[1].split(":")[0])
+            print(f"✓ {context.exception} (pico de {peak} bytes para {len(text)} de texto)")
+            self.assertEqual(position, typo)
+            self.assertLess(peak, len(text) // 10)
+
+class TestCase10_TopologiaBinaria(TestLanSimulator):
+    #Caso de Prueba 10: Exportación/importación de topología binaria (mmap)
+    
+    def test_ida_y_vuelta_binaria(self):
+        print("\n=== CASO 10: TOPOLOGÍA BINARIA MAPEADA EN MEMORIA ===")
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filename = os.path.join(tmp_dir, "topologia.lantopo")
+            self.simulator.simulate_node_failure("N4")
+            self.simulator.export_topology_binary(filename)
+            
+            # Enrutar directamente sobre el archivo mapeado
+            topology = MappedTopology(filename)
+            self.assertEqual(len(topology), 5)
+            self.assertEqual(topology.find_shortest_path("N2", "N3"),
+                             self.simulator.find_shortest_path("N2", "N3"))
+            self.assertIsNone(topology.index_of("N99"))
+            self.assertEqual(topology.find_shortest_path("N2", "N4"), (int, []))  # Mismo valor sin ruta
+            self.assertEqual(self.simulator.find_shortest_path("N2", "N4"), (int, []))
+            topology.close()
+            
+            # Cargar en un simulador nuevo (load_topology_from_file detecta el formato)
+            loaded = LanSimulator()
+            loaded.load_topology_from_file(filename)
+            self.assertEqual(list(loaded.nodes), list(self.simulator.nodes))
+            self.assertFalse(loaded.nodes["N4"].active)
+            self.assertEqual(loaded.nodes["N1"].resources, self.simulator.nodes["N1"].resources)
+            self.assertEqual(dict(loaded.connections), dict(self.simulator.connections))
+            print("✓ Topología binaria idéntica a la original")
+    
+    def test_conteo_con_lazos(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filename = os.path.join(tmp_dir, "lazos.lantopo")
+            simulator = LanSimulator()
+            for i in range(3):
+                simulator.add_node(LanNode(f"n{i}", f"Nodo {i}", "ROUTER", (i, i)))
+            simulator.add_connections([("n0", "n1", 1.0), ("n1", "n1", 2.0), ("n1", "n2", 3.0)])
+            
+            self.assertEqual(simulator.export_topology_binary(filename), (3, 3))
+            loaded = LanSimulator()
+            self.assertEqual(loaded.load_topology_binary(filename), (3, 3))
+            self.assertEqual(dict(loaded.connections), dict(simulator.connections))
+
+class TestCase11_ExportacionSubgrafos(TestLanSimulator):
+    #Caso de Prueba 11: Exportación incremental y por subgrafos
+    
+    def test_exportacion_subgrafos(self):
+        print("\n=== CASO 11: EXPORTACIÓN DE SUBGRAFOS ===")
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filename = os.path.join(tmp_dir, "red.txt")
+            
+            # Cada conexión no dirigida aparece una sola vez
+            self.simulator.export_topology_to_graphviz(filename, fmt="edgelist")
+            with open(filename) as file:
+                edges = [line.split()[:2] for line in file]
+            self.assertEqual(len(edges), 6)
+            self.assertEqual(len({frozenset(edge) for edge in edges}), 6)
+            
+            # Vecindad de un salto alrededor de N3: N1, N3 y N4
+            self.simulator.export_topology_to_graphviz(filename, center="N3", hops=1)
+            with open(filename) as file:
+                dot = file.read()
+            self.assertIn('"N3" -- "N4"', dot)
+            self.assertIn('"N1" -- "N3"', dot)
+            self.assertNotIn('"N2"', dot)
+            
+            # Vecindario de los nodos caídos en GraphML
+            self.simulator.simulate_node_failure("N5")
+            self.simulator.export_topology_to_graphviz(filename, failed_only=True, fmt="graphml")
+            with open(filename) as file:
+                graphml = file.read()
+            self.assertEqual(graphml.count("<node "), 3)  # N5, N1 y N2
+            self.assertEqual(graphml.count("<edge "), 3)
+            
+            # Los lazos (conexión de un nodo consigo mismo) también se exportan
+            self.simulator.add_connection("N2", "N2", 1.0)
+            self.simulator.export_topology_to_graphviz(filename, fmt="edgelist")
+            with open(filename) as file:
+                self.assertIn("N2 N2 1.0\n", file.read())
+            
+            with self.assertRaises(ValueError):
+                self.simulator.export_topology_to_graphviz(filename, fmt="svg")
+            print("✓ Subgrafos exportados correctamente")
+
+class TestCase12_EstadisticasIncrementales(TestLanSimulator):
+    #Caso de Prueba 12: Estadísticas mantenidas incrementalmente y métricas
+    
+    def test_estadisticas_incrementales(self):
+        print("\n=== CASO 12: ESTADÍSTICAS INCREMENTALES ===")
+        
+        for i in range(6):
+            self.simulator.generate_random_emergency()
+        self.simulator.simulate_node_failure("N4")
+        self.simulator.simulate_node_failure("N4")  # Fallar dos veces no descuenta dos
+        while self.simulator.emergencies:
+            emergency, node, path = self.simulator.process_next_emergency()
+            if emergency is None:
+                break
+        
+        # Comparar con el cálculo recorriendo todos los nodos
+        nodes = self.simulator.nodes.values()
+        times = [t for node in nodes for t in node.stats["response_times"]]
+        stats = self.simulator.get_network_statistics()
+        self.assertEqual(stats["active_nodes"], sum(1 for node in nodes if node.active))
+        self.assertEqual(stats["total_data_transmitted"], sum(node.stats["data_transmitted"] for node in nodes))
+        self.assertAlmostEqual(stats["avg_response_time"], sum(times) / len(times) if times else 0)
+        
+        # Reemplazar un nodo descuenta su contribución anterior
+        self.simulator.add_node(LanNode("N4", "Router Este", "ROUTER", (90, 50)))
+        self.assertEqual(self.simulator.get_network_statistics()["active_nodes"], 5)
+        self.assertEqual(self.simulator.get_network_statistics()["total_nodes"], 5)
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filename = os.path.join(tmp_dir, "metrics.prom")
+            MetricsExporter(self.simulator, filename).write_once()
+            with open(filename) as file:
+                self.assertIn("lan_nodes_active 5", file.read())
+        print("✓ Estadísticas incrementales coinciden con el recorrido completo")
+
+class TestCase13_Instrumentacion(TestLanSimulator):
+    #Caso de Prueba 13: Instrumentación de las fases de despacho
+    
+    def test_instrumentacion_despacho(self):
+        print("\n=== CASO 13: INSTRUMENTACIÓN DE DESPACHO ===")
+        
+        self.assertIsNone(self.simulator.get_profile_report())
+        self.simulator.enable_profiling()
+        
+        self.simulator.add_emergency(Emergency("E1", "INCENDIO", (25, 85)))
+        self.simulator.add_emergency(Emergency("E2", "ROBO", (80, 20)))
+        self.simulator.process_next_emergency()
+        self.simulator.process_next_emergency()
+        
+        report = self.simulator.get_profile_report()
+        for phase in ("dispatch", "candidate_filter", "nearest_node", "dijkstra", "stats_update"):
+            self.assertEqual(report["phases_ns"][phase]["count"], 2)
+        self.assertGreater(report["route"]["heap_pops"]["total"], 0)
+        self.assertGreater(report["route"]["edges_scanned"]["total"], 0)
+        print(self.simulator.profiler.format_report())
+        
+        self.simulator.disable_profiling()
+        self.assertIsNone(self.simulator.get_profile_report())
+
+class TestCase14_ReporteMemoria(TestLanSimulator):
+    #Caso de Prueba 14: Reporte de memoria por estructura
+    
+    def test_reporte_memoria(self):
+        print("\n=== CASO 14: REPORTE DE MEMORIA ===")
+        
+        before = self.simulator.memory_report()
+        for i in range(20):
+            self.simulator.generate_random_emergency()
+        after = self.simulator.memory_report()
+        
+        self.assertEqual(after["counts"], {"nodes": 5, "edges": 6, "emergencies": 20})
+        self.assertEqual(after["total_bytes"], sum(after["structures"].values()))
+        self.assertGreater(after["structures"]["emergency_registry"], before["structures"]["emergency_registry"])
+        self.assertGreater(after["bytes_per_emergency"], 0)
+        self.assertIn("LanNode", after["types"])
+        self.assertEqual(after["types"]["Emergency"]["count"], 20)
+        print(f"Bytes por nodo: {after['bytes_per_node']:.0f}, por conexión: {after['bytes_per_edge']:.0f}")
+
+class TestCase15_PuntosArticulacion(TestLanSimulator):
+    #Caso de Prueba 15: Puntos de articulación, puentes e impacto de fallas
+    
+    def test_impacto_de_fallas(self):
+        print("\n=== CASO 15: PUNTOS DE ARTICULACIÓN Y PUENTES ===")
+        
+        # Topología base: N1-N2-N5 forman un ciclo; N1-N3-N4 forman otro
+        connectivity = self.simulator.connectivity
+        self.assertEqual(connectivity.articulation_points(), ["N1"])
+        self.assertFalse(connectivity.is_bridge("N1", "N2"))
+        self.assertEqual(sorted(map(sorted, connectivity.biconnected_components())),
+                         [["N1", "N2", "N5"], ["N1", "N3", "N4"]])
+        
+        # Agregar una hoja: su conexión es un puente y N3 pasa a ser de articulación
+        self.simulator.add_node(LanNode("N6", "Router Sur", "ROUTER", (85, 10)))
+        self.simulator.add_connection("N3", "N6", 1.0)
+        self.assertTrue(connectivity.is_bridge("N6", "N3"))
+        self.assertTrue(connectivity.is_articulation_point("N3"))
+        
+        impact = self.simulator.get_failure_impact("N1")
+        self.assertTrue(impact["articulation"])
+        # Sin referencia se conserva la parte más grande (N3, N4, N6)
+        self.assertEqual(sorted(impact["unreachable"]), ["N2", "N5"])
+        self.assertEqual(sorted(connectivity.unreachable_if_failed("N1", "N2")), ["N3", "N4", "N6"])
+        self.assertEqual(self.simulator.get_failure_impact("N5")["unreachable"], [])
+        
+        isolated = self.simulator.simulate_node_failure("N3")
+        self.assertEqual(isolated, ["N6"])
+        self.assertFalse(connectivity.is_articulation_point("N3"))
+        print(f"✓ Falla de N3 aisló: {isolated}")
+    
+    def test_fallas_en_cascada(self):
+        # Varias fallas seguidas no recalculan el índice completo en cada una
+        connectivity = self.simulator.connectivity
+        builds = []
+        original_build = connectivity._build
+        connectivity._build = lambda: (builds.append(1), original_build())
+        
+        self.assertTrue(connectivity.is_articulation_point("N1"))
+        self.assertEqual(len(builds), 1)
+        self.assertEqual(len(self.simulator.simulate_node_failure("N1")), 2)  # Una de las dos mitades
+        self.assertIsNone(self.simulator.simulate_node_failure("N2"))
+        self.assertIsNone(self.simulator.simulate_node_failure("N4"))
+        self.assertEqual(len(builds), 1)
+        
+        # El impacto sigue disponible bajo demanda (un solo recálculo)
+        self.assertEqual(self.simulator.get_failure_impact("N3")["unreachable"], [])
+        self.assertEqual(connectivity.component_nodes("N3"), ["N3"])
+        self.assertEqual(len(builds), 2)
+
+class TestCase16_OraculoAlcanzabilidad(TestLanSimulator):
+    #Caso de Prueba 16: Oráculo de alcanzabilidad (union-find)
+    
+    def test_oraculo_alcanzabilidad(self):
+        print("\n=== CASO 16: ORÁCULO DE ALCANZABILIDAD ===")
+        
+        reachability = self.simulator.reachability
+        self.assertTrue(reachability.reachable("N2", "N4"))
+        
+        # Isla con una estación de bomberos cercana, pero sin conexión al resto
+        isla = LanNode("N6", "Estación Isla", "ESTACION", (24, 84))
+        isla.add_resource("BOMBEROS", 2)
+        self.simulator.add_node(isla)
+        self.assertFalse(reachability.reachable("N6", "N2"))
+        self.assertEqual(self.simulator.find_shortest_path("N6", "N2"), (int, []))
+        
+        # La estación inalcanzable más cercana se descarta sin buscar la ruta
+        self.simulator.add_emergency(Emergency("E1", "INCENDIO", (20, 80)))
+        emergency, node, path = self.simulator.process_next_emergency()
+        self.assertIsNotNone(node)
+        self.assertNotEqual(node.node_id, "N6")
+        
+        # Una falla divide la red; restaurar y conectar vuelve a unirla
+        self.simulator.simulate_node_failure("N1")
+        self.assertFalse(reachability.reachable("N2", "N3"))
+        self.simulator.restore_node("N1")
+        self.assertTrue(reachability.reachable("N2", "N3"))
+        self.simulator.add_connection("N6", "N5", 1.0)
+        self.assertTrue(reachability.reachable("N6", "N4"))
+        print("✓ Alcanzabilidad consistente tras fallas, restauraciones y conexiones")
+
+class TestCase17_MapaCobertura(TestLanSimulator):
+    #Caso de Prueba 17: Mapa de cobertura (Voronoi de red) por recurso
+    
+    def test_mapa_cobertura(self):
+        print("\n=== CASO 17: MAPA DE COBERTURA ===")
+        
+        coverage = self.simulator.coverage
+        # Bomberos: N1 y N3 son las estaciones; N4 queda en la celda de N3
+        self.assertEqual(coverage.nearest_station(["BOMBEROS"], "N2"), ("N1", 5.0))
+        self.assertEqual(coverage.nearest_station(["BOMBEROS"], "N4"), ("N3", 2.5))
+        self.assertEqual(coverage.nearest_station(["POLICIA", "AMBULANCIA"], "N5"), ("N2", 2.0))
+        
+        # La falla de N3 solo reasigna su celda
+        self.simulator.simulate_node_failure("N3")
+        self.assertEqual(coverage.nearest_station(["BOMBEROS"], "N4"), ("N1", 3.0))
+        self.assertEqual(coverage.nearest_station(["BOMBEROS"], "N3"), (None, float("inf")))
+        
+        # N1 se queda sin bomberos: ya no hay estación que cubra la red
+        central = self.simulator.nodes["N1"]
+        while central.use_resource("BOMBEROS"):
+            pass
+        self.simulator.notify_resources_changed("N1")
+        self.assertEqual(coverage.nearest_station(["BOMBEROS"], "N2")[0], None)
+        
+        # Al restaurar N3 su celda vuelve a crecer hasta cubrir toda la red
+        self.simulator.restore_node("N3")
+        self.assertEqual(coverage.nearest_station(["BOMBEROS"], "N2"), ("N3", 9.5))
+        self.simulator.add_emergency(Emergency("E1", "INCENDIO", (25, 85)))
+        emergency, node, path = self.simulator.process_next_emergency()
+        self.assertEqual(node.node_id, "N3")
+        self.assertEqual(path, ["N3", "N1", "N2"])
+        print(f"✓ Incendio en la zona norte atendido por {node.name} vía {path}")
+
+class TestCase18_LatenciaDinamica(TestLanSimulator):
+    #Caso de Prueba 18: Cambios de latencia y eliminación de conexiones
+    
+    def test_latencia_dinamica(self):
+        print("\n=== CASO 18: LATENCIA DINÁMICA ===")
+        
+        coverage = self.simulator.coverage
+        self.assertEqual(coverage.nearest_station(["BOMBEROS"], "N4"), ("N3", 2.5))
+        
+        # Alargar la conexión del árbol: N4 pasa a la celda de N1
+        self.simulator.update_connection_weight("N3", "N4", 10.0)
+        self.assertEqual(self.simulator.connections["N4"]["N3"], 10.0)
+        self.assertEqual(coverage.nearest_station(["BOMBEROS"], "N4"), ("N1", 3.0))
+        
+        # Acortar otra conexión propaga la mejora
+        self.simulator.update_connection_weight("N4", "N1", 0.5)
+        self.assertEqual(coverage.nearest_station(["BOMBEROS"], "N4"), ("N1", 0.5))
+        self.assertEqual(self.simulator.find_shortest_path("N4", "N2"), (5.5, ["N4", "N1", "N2"]))
+        
+        # Eliminar la conexión: vuelve a la ruta por N3 con el nuevo peso
+        self.simulator.remove_connection("N1", "N4")
+        self.assertFalse(self.simulator.has_connection("N1", "N4"))
+        self.assertEqual(coverage.nearest_station(["BOMBEROS"], "N4"), ("N3", 10.0))
+        self.assertTrue(self.simulator.connectivity.is_bridge("N3", "N4"))
+        
+        with self.assertRaises(ValueError):
+            self.simulator.remove_connection("N1", "N4")
+        with self.assertRaises(ValueError):
+            self.simulator.update_connection_weight("N2", "N4", 1.0)
+        
+        # Pesos no válidos: se rechazan sin tocar la red
+        for weight in (0, -1.0, float("nan"), float("inf")):
+            with self.assertRaises(ValueError):
+                self.simulator.update_connection_weight("N3", "N4", weight)
+            with self.assertRaises(ValueError):
+                self.simulator.add_connection("N2", "N4", weight)
+        self.assertEqual(self.simulator.connections["N3"]["N4"], 10.0)
+        self.assertFalse(self.simulator.has_connection("N2", "N4"))
+        print("✓ Celdas de cobertura reparadas tras cada cambio de latencia")
+
+class TestCase19_AdyacenciaSinDuplicados(TestLanSimulator):
+    #Caso de Prueba 19: Conexiones repetidas y consulta de aristas en O(1)
+    
+    def test_conexiones_repetidas(self):
+        print("\n=== CASO 19: ADYACENCIA SIN DUPLICADOS ===")
+        
+        # Repetir una conexión no la duplica y conserva el menor peso
+        self.simulator.add_connection("N2", "N1", 7.0)
+        self.assertEqual(self.simulator.connections["N1"]["N2"], 5.0)
+        self.simulator.add_connection("N2", "N1", 1.5)
+        self.assertEqual(self.simulator.connections["N1"]["N2"], 1.5)
+        self.assertEqual(self.simulator.connections["N2"]["N1"], 1.5)
+        self.assertEqual(list(self.simulator.connections["N1"]), ["N2", "N3", "N4", "N5"])
+        self.assertTrue(self.simulator.has_connection("N5", "N2"))
+        self.assertFalse(self.simulator.has_connection("N2", "N3"))
+        
+        # Cargar dos veces el mismo archivo no infla la adyacencia
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filename = os.path.join(tmp_dir, "topologia.json")
+            create_example_topology_file(filename)
+            simulator = LanSimulator()
+            simulator.load_topology_from_file(filename)
+            edges = sum(len(conns) for conns in simulator.connections.values())
+            simulator.load_topology_from_file(filename)
+            self.assertEqual(sum(len(conns) for conns in simulator.connections.values()), edges)
+        print(f"✓ {edges // 2} conexiones tras cargar la topología dos veces")
+
+class TestCase20_CentralidadIntermediacion(TestLanSimulator):
+    #Caso de Prueba 20: Centralidad de intermediación y ranking de routers críticos
+    
+    def test_ranking_centralidad(self):
+        print("\n=== CASO 20: CENTRALIDAD DE INTERMEDIACIÓN ===")
+        
+        # N1 une los dos ciclos de la red: es el nodo con más caminos más cortos
+        scores = self.simulator.get_centrality()
+        self.assertEqual(max(scores, key=scores.get), "N1")
+        stats = self.simulator.get_network_statistics(centrality=True, top=2)
+        self.assertEqual(stats["critical_nodes"][0][0], "N1")
+        self.assertTrue(all(self.simulator.nodes[n].node_type in ("ROUTER", "CENTRAL")
+                            for n, _ in stats["critical_nodes"]))
+        self.assertNotIn("critical_nodes", self.simulator.get_network_statistics())
+        
+        # Un cambio de topología descarta el resultado guardado
+        self.simulator.simulate_node_failure("N1")
+        self.assertNotIn("N1", self.simulator.get_centrality())
+        print(f"✓ Ranking: {stats['critical_nodes']}")
+    
+    def test_pool_y_muestreo(self):
+        simulator = LanSimulator()
+        simulator.generate_random_topology(num_nodes=150, connection_density=0.03)
+        serial = betweenness_centrality(simulator, processes=1)
+        parallel = betweenness_centrality(simulator, processes=2)
+        for node_id, score in serial.items():
+            self.assertAlmostEqual(parallel[node_id], score)
+        sampled = betweenness_centrality(simulator, sample=150, seed=1)
+        for node_id, score in serial.items():
+            self.assertAlmostEqual(sampled[node_id], score)  # Muestra completa = exacto
+        print("✓ Pool de procesos y muestreo coinciden con el cálculo secuencial")
+
+class TestCase21_CacheRutas(TestLanSimulator):
+    #Caso de Prueba 21: Caché LRU de rutas por época de la topología
+    
+    def test_cache_rutas(self):
+        print("\n=== CASO 21: CACHÉ DE RUTAS ===")
+        
+        first = self.simulator.find_shortest_path("N2", "N4")
+        self.assertEqual(self.simulator.find_shortest_path("N2", "N4"), first)
+        stats = self.simulator.get_route_cache_stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+        
+        # Una falla cambia la época: la ruta vieja ya no se usa
+        self.simulator.simulate_node_failure("N1")
+        self.assertEqual(self.simulator.find_shortest_path("N2", "N4"), (int, []))
+        self.simulator.restore_node("N1")
+        self.simulator.update_connection_weight("N1", "N4", 1.0)
+        self.assertEqual(self.simulator.find_shortest_path("N2", "N4"), (6.0, ["N2", "N1", "N4"]))
+        
+        # Tamaño acotado: se desaloja la ruta menos usada
+        self.simulator.set_route_cache_size(2)
+        for target in ("N3", "N4", "N5"):
+            self.simulator.find_shortest_path("N1", target)
+        stats = self.simulator.get_network_statistics()
+        self.assertGreaterEqual(stats["route_cache_evictions"], 2)
+        self.assertEqual(self.simulator.get_route_cache_stats()["size"], 2)
+        
+        self.simulator.set_route_cache_size(0)
+        self.assertIsNone(self.simulator.get_route_cache_stats())
+        self.assertEqual(self.simulator.find_shortest_path("N1", "N3"), (3.5, ["N1", "N4", "N3"]))
+        print(f"✓ Aciertos: {stats['route_cache_hits']}, fallos: {stats['route_cache_misses']}")
+
+class TestCase22_LineaTiempoEmergencias(TestLanSimulator):
+    #Caso de Prueba 22: Consultas por intervalo de tiempo sobre las emergencias
+
+    def test_linea_tiempo(self):
+        print("\n=== CASO 22: LÍNEA DE TIEMPO DE EMERGENCIAS ===")
+
+        emergencies = [("E1", "ROBO", 100.0), ("E2", "INCENDIO", 105.0), ("E3", "ROBO", 110.0),
+                       ("E4", "INCENDIO", 110.0), ("E5", "ROBO", 130.0)]
+        for e_id, e_type, timestamp in emergencies:
+            self.simulator.add_emergency(Emergency(e_id, e_type, (45, 45), timestamp))
+
+        between = self.simulator.get_emergencies_between(105.0, 110.0)
+        self.assertEqual([e.emergency_id for e in between], ["E2", "E3", "E4"])
+        self.assertEqual(self.simulator.count_emergencies_between(105.0, 110.0), 3)
+        self.assertEqual(self.simulator.count_emergencies_between(emergency_type="ROBO"), 3)
+        self.assertEqual(self.simulator.get_oldest_emergency("INCENDIO").emergency_id, "E2")
+        self.assertEqual(self.simulator.get_emergency_histogram(100.0, 140.0, 4), [2, 2, 0, 1])
+
+        # El despacho mueve la emergencia al grupo COMPLETADA
+        processed, _, _ = self.simulator.process_next_emergency()
+        self.assertEqual(processed.emergency_id, "E2")
+        self.assertEqual(self.simulator.get_oldest_emergency("INCENDIO").emergency_id, "E4")
+        completed = self.simulator.get_emergencies_between(status="COMPLETADA")
+        self.assertEqual([e.emergency_id for e in completed], ["E2"])
+        self.assertIsNone(self.simulator.get_oldest_emergency("INUNDACION"))
+
+        # El índice se reconstruye al restaurar un snapshot
+        recovered = LanSimulator()
+        recovered.restore_state(self.simulator.snapshot_state())
+        self.assertEqual(recovered.count_emergencies_between(status="PENDIENTE"), 4)
+        self.assertEqual([e.emergency_id for e in recovered.get_emergencies_between(end=110.0)],
+                         ["E1", "E2", "E3", "E4"])
+
+        with self.assertRaises(ValueError):
+            self.simulator.get_emergency_histogram(100.0, 100.0, 4)
+        print(f"✓ Emergencias entre 105 y 110: {[e.emergency_id for e in between]}")
+
+class TestCase23_ValidadorParentesis(unittest.TestCase):
+    #Caso de Prueba 23: Validador de paréntesis por bloques contra un recorrido carácter a carácter
+    
+    @staticmethod
+    def reference(data):
+        """Recorre byte a byte con la misma semántica (comillas con escape \\)"""
+        closers = {ord(")"): ord("("), ord("]"): ord("["), ord("}"): ord("{")}
+        stack, quote, escaped, line, column = [], None, False, 1, 1
+        for offset, byte in enumerate(data):
+            if quote is not None:
+                if escaped:
+                    escaped = False
+                elif byte == ord("\\"):
+                    escaped = True
+                elif byte == quote:
+                    quote = None
+            elif byte in b"'\"":
+                quote = byte
+            elif byte in b"([{":
+                stack.append(byte)
+            elif byte in closers:
+                if not stack or stack[-1] != closers[byte]:
+                    return {"offset": offset, "linea": line, "columna": column}
+                stack.pop()
+            line, column = (line + 1, 1) if byte == ord("\n") else (line, column + 1)
+        if quote is not None or stack:
+            return {"offset": len(data), "linea": line, "columna": column}
+        return None
+    
+    def test_regresion_escape_texto_abierto(self):
+        print("\n=== CASO 23: VALIDADOR DE PARÉNTESIS ===")
+        
+        # Un texto que sigue abierto al final del bloque contiene otro texto entre comillas dobles
+        result = validar_flujo(io.BytesIO(b"'abc\\\"x\"') ("), 8)
+        self.assertEqual((result["offset"], result["mensaje"]), (9, "')' sin apertura"))
+        self.assertTrue(validar_texto("f(a[1], {'k': \")\"})")["correcto"])
+        self.assertEqual(validar_texto("(]")["mensaje"], "Se encontró ']' pero faltaba cerrar '('")
+        print("✓ Error ubicado en el byte 9")
+    
+    def test_bloques_contra_referencia(self):
+        for seed in range(3000):
+            rng = random.Random(seed)
+            data = bytes(rng.choice(b"()[]{}\"'\\\\x\n ") for _ in range(rng.randrange(40)))
+            expected = self.reference(data)
+            for chunk_size in range(1, 8):
+                result = validar_flujo(io.BytesIO(data), chunk_size)
+                self.assertEqual(result["correcto"], expected is None, (seed, chunk_size, data))
+                if expected is not None:
+                    self.assertEqual({k: result[k] for k in expected}, expected, (seed, chunk_size, data))
+        print("✓ 3000 entradas al azar coinciden con la referencia en bloques de 1 a 7 bytes")
+
+class TestCase24_ColaCircular(unittest.TestCase):
+    #Caso de Prueba 24: Cola en anillo contra collections.deque
+    
+    def test_contra_deque(self):
+        print("\n=== CASO 24: COLA CIRCULAR ===")
+        
+        rng = random.Random(24)
+        queue, expected = ColaCircular(), deque()
+        resized = wrapped = 0
+        for step in range(20000):
+            capacity = len(queue.datos)
+            operation = rng.random()
+            if operation < 0.45:
+                queue.encolar(step)
+                expected.append(step)
+            elif operation < 0.55:
+                items = range(step, step + rng.randrange(40))
+                queue.encolar_muchos(items)
+                expected.extend(items)
+            elif operation < 0.9:
+                self.assertEqual(queue.desencolar(), expected.popleft() if expected else VACIA)
+            else:
+                n = rng.choice([None, rng.randrange(50)])
+                taken = [expected.popleft() for _ in range(len(expected) if n is None else min(n, len(expected)))]
+                self.assertEqual(queue.desencolar_muchos(n), taken)
+            resized += len(queue.datos) != capacity
+            wrapped += queue.frente + len(queue) > len(queue.datos)
+            
+            self.assertEqual(len(queue), len(expected))
+            self.assertEqual(queue.frente_cola(), expected[0] if expected else None)
+            self.assertEqual(len(queue.datos) & (len(queue.datos) - 1), 0)  # Potencia de 2
+            if step % 97 == 0:
+                self.assertEqual(list(queue), list(expected))
+        
+        self.assertGreater(resized, 10)
+        self.assertGreater(wrapped, 100)
+        self.assertEqual(queue.desencolar_muchos(), list(expected))
+        self.assertTrue(queue.es_vacio())
+        print(f"✓ 20000 operaciones iguales a deque ({resized} redimensionamientos)")
+
+class TestCase25_ColaAcotada(unittest.TestCase):
+    #Caso de Prueba 25: Cola acotada con hilos y asyncio (semántica de queue.Queue)
+    
+    def test_limites_y_tiempos(self):
+        print("\n=== CASO 25: COLA ACOTADA CONCURRENTE ===")
+        
+        bounded = ColaAcotada(2)
+        bounded.encolar(1)
+        bounded.encolar(2)
+        self.assertTrue(bounded.esta_llena())
+        with self.assertRaises(queue.Full):
+            bounded.encolar(3, bloquear=False)
+        start = time.monotonic()
+        with self.assertRaises(queue.Full):
+            bounded.encolar(3, timeout=0.05)
+        self.assertGreaterEqual(time.monotonic() - start, 0.04)
+        self.assertEqual([bounded.desencolar(), bounded.desencolar()], [1, 2])
+        with self.assertRaises(queue.Empty):
+            bounded.desencolar(bloquear=False)
+        with self.assertRaises(queue.Empty):
+            bounded.desencolar(timeout=0.01)
+        with self.assertRaises(ValueError):
+            ColaAcotada(0)
+        print("✓ queue.Full y queue.Empty como en queue.Queue")
+    
+    def test_productores_consumidores(self):
+        bounded = ColaAcotada(8)
+        received = []
+        per_item = 2000
+        
+        def produce(producer):
+            for i in range(per_item):
+                bounded.encolar((producer, i))
+        
+        def consume():
+            while True:
+                item = bounded.desencolar()
+                if item is None:
+                    return
+                received.append(item)  # list.append es atómico
+        
+        producers = [threading.Thread(target=produce, args=(p,)) for p in range(4)]
+        consumers = [threading.Thread(target=consume) for _ in range(3)]
+        for thread in producers + consumers:
+            thread.start()
+        for thread in producers:
+            thread.join()
+        for _ in consumers:
+            bounded.encolar(None)
+        for thread in consumers:
+            thread.join()
+        
+        self.assertEqual(sorted(received), [(p, i) for p in range(4) for i in range(per_item)])
+        self.assertTrue(bounded.esta_vacia())
+        print(f"✓ {len(received)} elementos entregados una sola vez entre 4 productores y 3 consumidores")
+    
+    def test_hilos_y_asyncio(self):
+        bounded = ColaAcotada(4)
+        
+        async def main():
+            # Productor en un hilo, consumidor con await
+            producer = threading.Thread(target=lambda: [bounded.encolar(i) for i in range(500)])
+            producer.start()
+            values = [await bounded.desencolar_async(timeout=5) for _ in range(500)]
+            producer.join()
+            self.assertEqual(values, list(range(500)))
+            
+            with self.assertRaises(queue.Empty):
+                await bounded.desencolar_async(timeout=0.01)
+            
+            # Una espera cancelada no se queda con el elemento
+            cancelled = asyncio.ensure_future(bounded.desencolar_async())
+            waiting = asyncio.ensure_future(bounded.desencolar_async(timeout=5))
+            await asyncio.sleep(0)
+            cancelled.cancel()
+            await asyncio.sleep(0)
+            await bounded.encolar_async("dato")
+            self.assertEqual(await waiting, "dato")
+            self.assertTrue(cancelled.cancelled())
+            
+            # Cancelada después de recibir el aviso: lo pasa a la siguiente
+            cancelled = asyncio.ensure_future(bounded.desencolar_async())
+            waiting = asyncio.ensure_future(bounded.desencolar_async(timeout=5))
+            await asyncio.sleep(0)
+            await bounded.encolar_async("otro")
+            cancelled.cancel()
+            self.assertEqual(await waiting, "otro")
+            
+            # encolar_async espera espacio que libera un consumidor en otro hilo
+            for i in range(4):
+                await bounded.encolar_async(i)
+            consumer = threading.Thread(target=lambda: [bounded.desencolar() for _ in range(5)])
+            consumer.start()
+            await bounded.encolar_async(4, timeout=5)
+            await asyncio.get_running_loop().run_in_executor(None, consumer.join)
+            self.assertTrue(bounded.esta_vacia())
+        
+        asyncio.run(main())
+        print("✓ Entrega entre hilos y corrutinas, tiempo límite y cancelación")
+
+class TestCase26_ArbolBinario(unittest.TestCase):
+    #Caso de Prueba 26: Árbol binario de búsqueda iterativo contra una lista ordenada (bisect)
+    
+    def test_contra_bisect(self):
+        print("\n=== CASO 26: ÁRBOL BINARIO DE BÚSQUEDA ===")
+        
+        rng = random.Random(26)
+        tree, expected = ArbolBinario(), []
+        for step in range(6000):
+            value = rng.randrange(500)
+            position = bisect.bisect_left(expected, value)
+            present = position < len(expected) and expected[position] == value
+            insert = rng.random() < 0.6
+            if insert:
+                self.assertEqual(tree.insertar(value), not present)
+                if not present:
+                    expected.insert(position, value)
+            else:
+                self.assertEqual(tree.eliminar(value), present)
+                if present:
+                    del expected[position]
+            self.assertEqual(value in tree, insert)
+            if step % 50 == 0:
+                low, high = sorted((rng.randrange(520), rng.randrange(520)))
+                self.assertEqual(list(tree), expected)
+                self.assertEqual(list(tree.rango(low, high)),
+                                 expected[bisect.bisect_left(expected, low):bisect.bisect_right(expected, high)])
+        self.assertEqual(len(tree), len(expected))
+        print("✓ 6000 inserciones y eliminaciones iguales a la lista ordenada")
+    
+    def test_datos_ordenados(self):
+        # Insertar en orden degenera el árbol, pero sin recursión no hay RecursionError
+        chain = ArbolBinario(range(2000))
+        self.assertEqual(chain.altura(), 2000)
+        self.assertEqual(list(chain.rango(1990, 5000)), list(range(1990, 2000)))
+        
+        balanced = ArbolBinario.desde_ordenados([1, 1, 2, 3, 5, 8, 13] + list(range(20, 1000)))
+        self.assertEqual(len(balanced), 986)
+        self.assertEqual(balanced.altura(), 10)  # ceil(log2(987))
+        self.assertIn(13, balanced)
+        self.assertNotIn(4, balanced)
+        with self.assertRaises(ValueError):
+            ArbolBinario.desde_ordenados([1, 3, 2])
+        print("✓ desde_ordenados arma un árbol de altura mínima")
+
+class OrderedMapChecks:
+    #Comparación compartida por los mapas ordenados (ArbolAVL, ArbolB) contra un dict y una lista ordenada
+    
+    def check_against_reference(self, new_map, seed, steps=6000, universe=800, check=None):
+        rng = random.Random(seed)
+        tree, values, keys = new_map(), {}, []
+        for step in range(steps):
+            key = rng.randrange(universe)
+            position = bisect.bisect_left(keys, key)
+            present = key in values
+            action = rng.random()
+            if action < 0.45:
+                self.assertEqual(tree.insertar(key, step), not present)
+                if not present:
+                    keys.insert(position, key)
+                values[key] = step
+            elif action < 0.55:
+                tree[key] = -step
+                if not present:
+                    keys.insert(position, key)
+                values[key] = -step
+            elif action < 0.9:
+                self.assertEqual(tree.eliminar(key), present)
+                if present:
+                    del keys[position], values[key]
+            elif present:
+                del tree[key]
+                del keys[position], values[key]
+            else:
+                with self.assertRaises(KeyError):
+                    del tree[key]
+            
+            self.assertEqual(len(tree), len(keys))
+            self.assertEqual(key in tree, key in values)
+            self.assertEqual(tree.buscar(key, "ausente"), values.get(key, "ausente"))
+            self.assertEqual(tree.posicion(key), bisect.bisect_left(keys, key))
+            if step % 60 == 0:
+                self.check_queries(tree, keys, values, rng, universe)
+                if check is not None:
+                    check(tree)
+        self.check_queries(tree, keys, values, rng, universe)
+        return tree, keys, values
+    
+    def check_queries(self, tree, keys, values, rng, universe):
+        items = [(key, values[key]) for key in keys]
+        self.assertEqual(list(tree.items()), items)
+        self.assertEqual(list(tree), keys)
+        self.assertEqual(list(tree.claves()), keys)
+        self.assertEqual(list(tree.valores()), [value for _, value in items])
+        self.assertEqual(list(reversed(tree)), keys[::-1])
+        self.assertEqual(tree.primero(), items[0] if items else None)
+        self.assertEqual(tree.ultimo(), items[-1] if items else None)
+        
+        for _ in range(10):
+            low, high = rng.randrange(-5, universe + 5), rng.randrange(-5, universe + 5)
+            start, end = bisect.bisect_left(keys, low), bisect.bisect_right(keys, high)
+            self.assertEqual(tree.contar_rango(low, high), max(0, end - start))
+            self.assertEqual(list(tree.rango(low, high)), items[start:end])
+            self.assertEqual(list(tree.rango(minimo=low)), items[start:])
+            self.assertEqual(list(tree.rango(maximo=high)), items[:end])
+            missing = rng.randrange(universe)
+            if missing in values:
+                self.assertEqual(tree[missing], values[missing])
+            else:
+                with self.assertRaises(KeyError):
+                    tree[missing]
+        
+        for k in range(-len(items), len(items), max(1, len(items) // 25)):
+            self.assertEqual(tree.seleccionar(k), items[k])
+        for k in (len(items), -len(items) - 1):
+            with self.assertRaises(IndexError):
+                tree.seleccionar(k)
+    
+    def check_bulk(self, new_map, from_sorted, check=None):
+        rng = random.Random(7)
+        batch = [(rng.randrange(100000), index) for index in range(20000)]
+        expected = dict(batch)  # Con claves repetidas gana el último valor
+        tree = new_map()
+        tree.insertar_muchos(batch[:19000])  # Lote grande: mezcla y recarga
+        tree.insertar_muchos(batch[19000:])  # Lote chico frente al mapa: uno por uno
+        self.assertEqual(list(tree.items()), sorted(expected.items()))
+        
+        keys = sorted(expected)
+        built = from_sorted(keys, [expected[key] for key in keys])
+        self.assertEqual(list(built.items()), list(tree.items()))
+        self.assertEqual(len(from_sorted([])), 0)
+        self.assertEqual(list(from_sorted([1, 2, 3]).valores()), [None] * 3)
+        for bad in ([1, 3, 2], [1, 1, 2]):
+            with self.assertRaises(ValueError):
+                from_sorted(bad)
+        if check is not None:
+            check(tree)
+            check(built)
+        return tree, built
+
+class TestCase27_ArbolAVL(OrderedMapChecks, unittest.TestCase):
+    #Caso de Prueba 27: Árbol AVL con estadísticas de orden contra un dict y una lista ordenada (bisect)
+    
+    def check_avl(self, tree):
+        # Cada nodo guarda su altura y tamaño correctos y está balanceado
+        pending, seen = [tree.raiz], {}
+        while pending:
+            node = pending.pop()
+            if node is None:
+                continue
+            children = (node.izquierda, node.derecha)
+            if any(child is not None and id(child) not in seen for child in children):
+                pending.append(node)
+                pending.extend(children)
+                continue
+            heights = [seen[id(child)][0] if child is not None else 0 for child in children]
+            sizes = [seen[id(child)][1] if child is not None else 0 for child in children]
+            self.assertLessEqual(abs(heights[0] - heights[1]), 1)
+            self.assertEqual(node.altura, 1 + max(heights))
+            self.assertEqual(node.tamaño, 1 + sum(sizes))
+            seen[id(node)] = (node.altura, node.tamaño)
+        n = len(tree)
+        self.assertLessEqual(tree.altura(), 1.4405 * math.log2(n + 2))
+    
+    def test_contra_referencia(self):
+        print("\n=== CASO 27: ÁRBOL AVL ===")
+        
+        tree, keys, _ = self.check_against_reference(ArbolAVL, 27, check=self.check_avl)
+        self.check_avl(tree)
+        print(f"✓ 6000 operaciones iguales al dict ordenado ({len(keys)} claves, altura {tree.altura()})")
+    
+    def test_carga_masiva(self):
+        self.check_bulk(ArbolAVL, ArbolAVL.desde_ordenados, check=self.check_avl)
+        
+        chain = ArbolAVL((value, value) for value in range(4096))
+        self.assertEqual(chain.altura(), 13)  # Insertar en orden no degenera el árbol
+        self.check_avl(chain)
+        self.assertEqual(repr(ArbolAVL([(2, "b"), (1, "a")])), "ArbolAVL([(1, 'a'), (2, 'b')])")
+        print("✓ insertar_muchos y desde_ordenados arman árboles AVL válidos")
+
+class TestCase28_ArbolB(OrderedMapChecks, unittest.TestCase):
+    #Caso de Prueba 28: Mapa en hojas contiguas (ArbolB) contra un dict y una lista ordenada (bisect)
+    
+    def check_leaves(self, tree):
+        # Hojas no vacías, ordenadas entre sí, con máximos, valores y tamaños consistentes
+        self.assertEqual(len(tree._hojas), len(tree._valores))
+        self.assertEqual(tree._maximos, [leaf[-1] for leaf in tree._hojas])
+        self.assertEqual(tree._cantidad, sum(map(len, tree._hojas)))
+        keys = []
+        for leaf, values in zip(tree._hojas, tree._valores):
+            self.assertTrue(0 < len(leaf) <= 2 * tree.carga)
+            self.assertEqual(len(leaf), len(values))
+            if tree.tipo:
+                self.assertEqual(leaf.typecode, tree.tipo)
+            keys.extend(leaf)
+        self.assertTrue(all(a < b for a, b in zip(keys, keys[1:])))
+        if tree._fenwick is not None:
+            fenwick = tree._fenwick
+            tree._fenwick = None
+            self.assertEqual(tree._acumulado(), fenwick)
+    
+    def test_contra_referencia(self):
+        print("\n=== CASO 28: ÁRBOL B (HOJAS CONTIGUAS) ===")
+        
+        # Carga chica para que haya muchas divisiones y fusiones de hojas
+        tree, keys, _ = self.check_against_reference(lambda: ArbolB(carga=8), 28, check=self.check_leaves)
+        self.check_leaves(tree)
+        self.assertGreater(len(tree._hojas), 20)
+        
+        packed, _, _ = self.check_against_reference(lambda: ArbolB(tipo="q", carga=4), 280, steps=3000,
+                                                    check=self.check_leaves)
+        self.check_leaves(packed)
+        print(f"✓ 9000 operaciones iguales al dict ordenado ({len(keys)} claves en {len(tree._hojas)} hojas)")
+    
+    def test_carga_masiva(self):
+        for tipo in (None, "q"):
+            tree, built = self.check_bulk(lambda: ArbolB(tipo=tipo, carga=64),
+                                          lambda keys, values=None: ArbolB.desde_ordenados(keys, values, tipo, 64),
+                                          check=self.check_leaves)
+            self.assertEqual(len(built._hojas), -(-len(built) // 64))
+        
+        with self.assertRaises(ValueError):
+            ArbolB(carga=3)
+        with self.assertRaises(ValueError):
+            ArbolB.desde_ordenados([1, 2], ["a"])
+        with self.assertRaises(OverflowError):
+            ArbolB([(1 << 70, None)], tipo="q")  # La clave no entra en el array de enteros
+        self.assertEqual(repr(ArbolB([(2, "b"), (1, "a")])), "ArbolB([(1, 'a'), (2, 'b')])")
+        print("✓ insertar_muchos y desde_ordenados arman hojas válidas, también con array('q')")
+
+class TestCase29_Busquedas(unittest.TestCase):
+    #Caso de Prueba 29: Algoritmos de búsqueda en listas ordenadas contra bisect
+    
+    SEARCHES = (busqueda_lineal, busqueda_binaria, busqueda_interpolacion,
+                busqueda_exponencial, busqueda_bisect)
+    
+    def test_contra_bisect(self):
+        print("\n=== CASO 29: ALGORITMOS DE BÚSQUEDA ===")
+        
+        rng = random.Random(29)
+        cases = [[], [5], [5, 9]]
+        for n in (3, 10, 57, 300, 1000):
+            cases.append(sorted(rng.sample(range(n * 10), n)))          # Uniforme
+            cases.append([value * value for value in range(n)])         # Creciente cuadrático
+            cases.append(sorted({int(1.05 ** value) for value in range(n)}))  # Muy sesgado
+        checked = 0
+        for data in cases:
+            targets = {-1, 0, (data[-1] + 1) if data else 1}
+            for value in data:
+                targets.update((value - 1, value, value + 1))
+            for target in targets:
+                position = bisect.bisect_left(data, target)
+                expected = position if position < len(data) and data[position] == target else -1
+                for search in self.SEARCHES:
+                    self.assertEqual(search(data, target), expected, (search.__name__, len(data), target))
+                checked += 1
+        print(f"✓ {checked} consultas iguales a bisect en {len(cases)} listas")
+    
+    def test_repetidos(self):
+        # Con claves repetidas cualquier índice del objetivo es válido
+        rng = random.Random(290)
+        for _ in range(200):
+            data = sorted(rng.randrange(20) for _ in range(rng.randrange(1, 60)))
+            for target in range(-1, 22):
+                for search in self.SEARCHES:
+                    index = search(data, target)
+                    if target in data:
+                        self.assertEqual(data[index], target, search.__name__)
+                    else:
+                        self.assertEqual(index, -1, search.__name__)
+        self.assertEqual(busqueda_interpolacion([7] * 50, 7), 0)
+        self.assertEqual(busqueda_interpolacion([7] * 50, 8), -1)
+        print("✓ Con repetidos se devuelve una posición del objetivo")
+    
+    def test_benchmark(self):
+        self.assertEqual(tamaños_geometricos(10, 1000, 10), [10, 100, 1000])
+        self.assertEqual(tamaños_geometricos(100, 50, 2), [])
+        self.assertAlmostEqual(ajustar_exponente([(n, 3 * n ** 1.5) for n in (10, 100, 1000)]), 1.5)
+        self.assertAlmostEqual(ajustar_exponente([(n, 7.0) for n in (10, 100)]), 0.0)
+        self.assertIsNone(ajustar_exponente([(10, 1.0)]))
+        
+        names = ["lineal", "binaria", "interpolacion", "exponencial", "bisect"]
+        rows, exponents = correr_barrido(names, [100, 1000], consultas=50, calentamiento=0,
+                                         repeticiones=1, verbose=False)
+        self.assertEqual(len(rows), 2 * len(names))
+        self.assertEqual(set(exponents), set(names))
+        self.assertTrue(all(row["minimo_ns"] <= row["mediana_ns"] for row in rows))
+        print("✓ El barrido verifica todos los algoritmos y ajusta un exponente por algoritmo")
+
+class TestCase30_Sudoku(unittest.TestCase):
+    #Caso de Prueba 30: Sudoku con máscaras de bits contra un verificador y un backtracking de fuerza bruta
+    
+    def check_solution(self, puzzle, solution):
+        # Cada fila, columna y caja tiene 1..9 y se respetan las pistas
+        digits = set(range(1, 10))
+        for index in range(9):
+            self.assertEqual(set(solution[index]), digits)
+            self.assertEqual({row[index] for row in solution}, digits)
+            top, left = (index // 3) * 3, (index % 3) * 3
+            self.assertEqual({solution[top + r][left + c] for r in range(3) for c in range(3)}, digits)
+        for row in range(9):
+            for column in range(9):
+                if puzzle[row][column]:
+                    self.assertEqual(solution[row][column], puzzle[row][column])
+    
+    def brute_force(self, board):
+        # El backtracking de 13Fuerzabruta.py: prueba 1..9 revisando fila, columna y caja
+        for row in range(9):
+            for column in range(9):
+                if board[row][column] == 0:
+                    for num in range(1, 10):
+                        top, left = row - row % 3, column - column % 3
+                        if (num not in board[row] and all(board[r][column] != num for r in range(9))
+                                and all(board[top + r][left + c] != num for r in range(3) for c in range(3))):
+                            board[row][column] = num
+                            if self.brute_force(board):
+                                return True
+                            board[row][column] = 0
+                    return False
+        return True
+    
+    def test_ejemplo(self):
+        print("\n=== CASO 30: SUDOKU ===")
+        
+        original = [row[:] for row in EJEMPLO]
+        solution = resolver(EJEMPLO)
+        self.assertEqual(EJEMPLO, original)  # El tablero de entrada no se modifica
+        self.check_solution(EJEMPLO, solution)
+        
+        reference = [row[:] for row in EJEMPLO]
+        self.assertTrue(self.brute_force(reference))
+        self.assertEqual(solution, reference)  # El ejemplo tiene solución única
+        print("✓ La solución del ejemplo es la misma que la de fuerza bruta")
+    
+    def test_tableros_variados(self):
+        rng = random.Random(30)
+        base = resolver(EJEMPLO)
+        for clues in (0, 17, 22, 28, 35, 50, 81):
+            for _ in range(6):
+                # Reetiqueta dígitos y permuta filas dentro de cada banda para tener otro tablero válido
+                labels = [0] + rng.sample(range(1, 10), 9)
+                rows = [band * 3 + r for band in range(3) for r in rng.sample(range(3), 3)]
+                full = [[labels[base[row][column]] for column in range(9)] for row in rows]
+                kept = set(rng.sample(range(81), clues))
+                puzzle = [[full[r][c] if r * 9 + c in kept else 0 for c in range(9)] for r in range(9)]
+                self.check_solution(puzzle, resolver(puzzle))
+        
+        # AI Escargot: necesita ramificar varias veces
+        hard = leer_tablero("1....7.9..3..2...8..96..5....53..9...1..8...26....4...3......1..4......7..7...3..")
+        self.check_solution(hard, resolver(hard))
+        print("✓ 42 tableros generados y uno difícil resueltos correctamente")
+    
+    def test_sin_solucion(self):
+        repeated = [row[:] for row in EJEMPLO]
+        repeated[0][2] = 5  # Dos 5 en la primera fila
+        self.assertIsNone(resolver(repeated))
+        
+        # Las pistas no se contradicen, pero a (0, 8) solo le falta el 9 y la columna ya lo tiene
+        blocked = [[0] * 9 for _ in range(9)]
+        blocked[0][:8] = range(1, 9)
+        blocked[1][8] = 9
+        self.assertIsNone(resolver(blocked))
+        print("✓ Pistas contradictorias o sin solución devuelven None")
+    
+    def test_texto_y_lote(self):
+        text = a_texto(EJEMPLO)
+        self.assertEqual(len(text), 81)
+        self.assertEqual(leer_tablero(text), EJEMPLO)
+        dotted = "\n".join(" ".join(c if c != "0" else "." for c in text[i:i + 9]) for i in range(0, 81, 9))
+        self.assertEqual(leer_tablero(dotted), EJEMPLO)
+        for bad in (text[:80], text + "1"):
+            with self.assertRaises(ValueError):
+                leer_tablero(bad)
+        
+        unsolvable = "55" + text[2:]
+        solved = a_texto(resolver(EJEMPLO))
+        self.assertEqual(resolver_lote([text, unsolvable, text], procesos=1), [solved, "", solved])
+        
+        # Una línea mal escrita se marca y el resto del lote se resuelve (también con pool)
+        malformed = ["12345", "x" + text[1:]]
+        self.assertEqual(resolver_lote([text] + malformed + [text], procesos=1), [solved, None, None, solved])
+        batch = [text, "12345"] * MIN_POR_PROCESO
+        self.assertEqual(resolver_lote(batch, procesos=2), [solved, None] * MIN_POR_PROCESO)
+        
+        with tempfile.TemporaryDirectory() as folder:
+            source, target = os.path.join(folder, "sudokus.txt"), os.path.join(folder, "soluciones.txt")
+            with open(source, "w") as file:
+                file.write(f"# comentario\n{text}\n\n{unsolvable}\n12345\n{text}\n")
+            solved_count, total, _ = resolver_archivo(source, target, procesos=1)
+            self.assertEqual((solved_count, total), (2, 4))
+            with open(target) as file:
+                self.assertEqual(file.read().splitlines(),
+                                 [solved, "sin solución", "entrada inválida", solved])
+        print("✓ Texto ida y vuelta, lote y archivo")
+
+class TestCase31_Combinatoria(unittest.TestCase):
+    #Caso de Prueba 31: Generadores de permutaciones y combinaciones contra itertools
+    
+    def test_permutaciones(self):
+        print("\n=== CASO 31: PERMUTACIONES Y COMBINACIONES ===")
+        
+        for n in range(8):
+            items = list("gdbface"[:n])
+            heap = list(permutaciones_heap(items))
+            self.assertEqual(len(heap), math.factorial(n))
+            self.assertEqual(set(heap), set(itertools.permutations(items)))
+            for previous, current in zip(heap, heap[1:]):
+                # Heap: cada permutación difiere de la anterior en un solo intercambio
+                self.assertEqual(sum(a != b for a, b in zip(previous, current)), 2)
+            self.assertEqual(list(permutaciones_lexicograficas(items)),
+                             sorted(itertools.permutations(items)))
+        
+        for word in ("aabbc", "mississ", "zzz", "ba"):
+            self.assertEqual(list(permutaciones_lexicograficas(word)),
+                             sorted(set(itertools.permutations(word))))
+        last = [3, 2, 1]
+        self.assertFalse(siguiente_permutacion(last))
+        self.assertEqual(last, [1, 2, 3])  # Después de la última vuelve a la primera
+        print("✓ Heap y orden lexicográfico iguales a itertools.permutations (también con repetidos)")
+    
+    def test_combinaciones(self):
+        for n in range(8):
+            items = "fbdaegc"[:n]
+            for k in range(n + 2):
+                self.assertEqual(list(combinaciones(items, k)), list(itertools.combinations(items, k)))
+            for k in range(5):
+                self.assertEqual(list(combinaciones_con_repeticion(items, k)),
+                                 list(itertools.combinations_with_replacement(items, k)))
+        self.assertEqual(list(combinaciones("abc", -1)), [])
+        print("✓ Combinaciones con y sin repetición iguales a itertools")
+    
+    def test_rank_y_bloques(self):
+        items = "dbfaec"  # Orden base distinto del alfabético
+        for position, permutation in enumerate(itertools.permutations(items)):
+            self.assertEqual(permutacion_en_posicion(items, position), permutation)
+            self.assertEqual(posicion_permutacion(permutation, items), position)
+        for k in range(len(items) + 1):
+            for position, combination in enumerate(itertools.combinations(items, k)):
+                self.assertEqual(combinacion_en_posicion(items, k, position), combination)
+                self.assertEqual(posicion_combinacion(combination, items), position)
+        
+        rng = random.Random(31)
+        total = math.factorial(len(items))
+        for start in [0, total - 1, total - 3] + [rng.randrange(total) for _ in range(20)]:
+            count = rng.randrange(1, 40)
+            self.assertEqual(list(bloque_permutaciones(items, start, count)),
+                             list(itertools.islice(itertools.permutations(items), start, start + count)))
+        for k in range(1, len(items) + 1):
+            total = math.comb(len(items), k)
+            for start in range(total):
+                self.assertEqual(list(bloque_combinaciones(items, k, start, 4)),
+                                 list(itertools.islice(itertools.combinations(items, k), start, start + 4)))
+        
+        letters = "abcdefghij"
+        self.assertEqual(posicion_permutacion(permutacion_en_posicion(letters, 1000000), letters), 1000000)
+        for bad in (-1, 720):
+            with self.assertRaises(IndexError):
+                permutacion_en_posicion(items, bad)
+        with self.assertRaises(IndexError):
+            combinacion_en_posicion(items, 2, 15)
+        with self.assertRaises(ValueError):
+            posicion_permutacion("ddbfae", items)
+        with self.assertRaises(ValueError):
+            posicion_combinacion("ab", items)  # Fuera del orden base (b va antes que a)
+        print("✓ Rank, unrank y tramos iguales a itertools.islice")
+
 def run_performance_test():
     """Ejecuta una prueba de rendimiento adicional"""
     print("\n=== PRUEBA DE RENDIMIENTO EXTENDIDA ===")
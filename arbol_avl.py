@@ -0,0 +1,402 @@
+"""
+Árbol AVL como mapa ordenado
+
+Extiende el ArbolAVL de 18taller.py (mismas rotaciones y regla de balance) a
+un mapa clave -> valor completo:
+
+- insertar, buscar y eliminar sin recursión: se guarda el camino desde la raíz
+  y se rebalancea de abajo hacia arriba.
+- Cada nodo guarda el tamaño de su subárbol, así posicion (rank),
+  seleccionar (select) y contar_rango cuestan O(log n).
+- Los recorridos (claves, valores, items, rango, reversed) son generadores
+  perezosos con pila explícita; no se debe modificar el árbol mientras se
+  recorre.
+- desde_ordenados arma el árbol en O(n) a partir de claves ordenadas, e
+  insertar_muchos reconstruye así el árbol cuando el lote es grande.
+
+Las claves solo necesitan el operador <, como en insertar (tuplas como
+(tiempo, id) sirven para claves repetidas).
+"""
+
+from heapq import merge
+
+
+class NodoAVL:
+    __slots__ = ("clave", "valor", "izquierda", "derecha", "altura", "tamaño")
+
+    def __init__(self, clave, valor=None):
+        self.clave = clave
+        self.valor = valor
+        self.izquierda = None
+        self.derecha = None
+        self.altura = 1
+        self.tamaño = 1  # Nodos del subárbol, incluido este
+
+
+def _actualizar(nodo):
+    izquierda, derecha = nodo.izquierda, nodo.derecha
+    altura_izq = izquierda.altura if izquierda is not None else 0
+    altura_der = derecha.altura if derecha is not None else 0
+    nodo.altura = 1 + (altura_izq if altura_izq > altura_der else altura_der)
+    nodo.tamaño = (1 + (izquierda.tamaño if izquierda is not None else 0)
+                   + (derecha.tamaño if derecha is not None else 0))
+
+
+def _altura(nodo):
+    return nodo.altura if nodo is not None else 0
+
+
+def _tamaño(nodo):
+    return nodo.tamaño if nodo is not None else 0
+
+
+def _rotacion_izquierda(z):
+    y = z.derecha
+    z.derecha = y.izquierda
+    y.izquierda = z
+    _actualizar(z)
+    _actualizar(y)
+    return y
+
+
+def _rotacion_derecha(z):
+    y = z.izquierda
+    z.izquierda = y.derecha
+    y.derecha = z
+    _actualizar(z)
+    _actualizar(y)
+    return y
+
+
+def _balancear(nodo):
+    """Actualiza el nodo y lo rota si quedó desbalanceado; devuelve la nueva raíz del subárbol"""
+    _actualizar(nodo)
+    balance = _altura(nodo.izquierda) - _altura(nodo.derecha)
+    if balance > 1:
+        if _altura(nodo.izquierda.izquierda) < _altura(nodo.izquierda.derecha):
+            nodo.izquierda = _rotacion_izquierda(nodo.izquierda)
+        return _rotacion_derecha(nodo)
+    if balance < -1:
+        if _altura(nodo.derecha.derecha) < _altura(nodo.derecha.izquierda):
+            nodo.derecha = _rotacion_derecha(nodo.derecha)
+        return _rotacion_izquierda(nodo)
+    return nodo
+
+
+def _construir(claves, valores, inicio, fin):
+    """Subárbol balanceado con claves[inicio:fin] (recursión de profundidad log n)"""
+    if inicio >= fin:
+        return None
+    medio = (inicio + fin) // 2
+    nodo = NodoAVL(claves[medio], valores[medio])
+    nodo.izquierda = _construir(claves, valores, inicio, medio)
+    nodo.derecha = _construir(claves, valores, medio + 1, fin)
+    _actualizar(nodo)
+    return nodo
+
+
+class ArbolAVL:
+    """Mapa ordenado clave -> valor con estadísticas de orden (posición, selección y rangos)"""
+
+    def __init__(self, pares=()):
+        """
+        Args:
+            pares (iterable): Pares (clave, valor) iniciales, en cualquier orden
+        """
+        self.raiz = None
+        for clave, valor in pares:
+            self.insertar(clave, valor)
+
+    @classmethod
+    def desde_ordenados(cls, claves, valores=None):
+        """
+        Construye un árbol balanceado en O(n)
+
+        Args:
+            claves (iterable): Claves en orden estrictamente ascendente
+            valores (iterable): Valores en el mismo orden (None = todos None)
+        """
+        claves = list(claves)
+        valores = [None] * len(claves) if valores is None else list(valores)
+        if len(valores) != len(claves):
+            raise ValueError("Debe haber un valor por clave")
+        for i in range(1, len(claves)):
+            if not claves[i - 1] < claves[i]:
+                raise ValueError("Las claves deben estar ordenadas y sin repetir")
+        arbol = cls()
+        arbol.raiz = _construir(claves, valores, 0, len(claves))
+        return arbol
+
+    # ---- Modificación ------------------------------------------------------------
+
+    def _rebalancear(self, camino):
+        """Rebalancea los nodos del camino, de abajo hacia arriba, y reengancha los que rotaron"""
+        for i in range(len(camino) - 1, -1, -1):
+            nodo = camino[i]
+            nuevo = _balancear(nodo)
+            if nuevo is not nodo:
+                if i == 0:
+                    self.raiz = nuevo
+                elif camino[i - 1].izquierda is nodo:
+                    camino[i - 1].izquierda = nuevo
+                else:
+                    camino[i - 1].derecha = nuevo
+
+    def insertar(self, clave, valor=None):
+        """
+        Inserta una clave o reemplaza su valor
+
+        Returns:
+            bool: True si la clave no estaba
+        """
+        camino = []
+        nodo = self.raiz
+        while nodo is not None:
+            if clave < nodo.clave:
+                camino.append(nodo)
+                nodo = nodo.izquierda
+            elif nodo.clave < clave:
+                camino.append(nodo)
+                nodo = nodo.derecha
+            else:
+                nodo.valor = valor
+                return False
+        nuevo = NodoAVL(clave, valor)
+        if not camino:
+            self.raiz = nuevo
+            return True
+        padre = camino[-1]
+        if clave < padre.clave:
+            padre.izquierda = nuevo
+        else:
+            padre.derecha = nuevo
+        self._rebalancear(camino)
+        return True
+
+    def insertar_muchos(self, pares):
+        """
+        Inserta varios pares (clave, valor)
+
+        Si el lote es grande frente al árbol, mezcla ambos en orden y reconstruye
+        en O(n + k log k); si no, inserta uno por uno en O(k log n).
+        """
+        pares = list(pares)
+        if len(pares) * 8 < len(self):
+            for clave, valor in pares:
+                self.insertar(clave, valor)
+            return
+        nuevos = {}
+        for clave, valor in pares:
+            nuevos[clave] = valor  # Si una clave se repite en el lote, gana la última
+        lote = sorted(nuevos.items(), key=lambda par: par[0])
+        claves, valores = [], []
+        for clave, valor in merge(lote, self.items(), key=lambda par: par[0]):
+            if claves and not claves[-1] < clave:
+                continue  # La clave ya estaba: la mezcla pone primero el valor del lote
+            claves.append(clave)
+            valores.append(valor)
+        self.raiz = _construir(claves, valores, 0, len(claves))
+
+    def eliminar(self, clave):
+        """
+        Elimina una clave; un nodo con dos hijos toma la clave de su sucesor
+
+        Returns:
+            bool: True si la clave estaba
+        """
+        camino = []
+        nodo = self.raiz
+        while nodo is not None:
+            if clave < nodo.clave:
+                camino.append(nodo)
+                nodo = nodo.izquierda
+            elif nodo.clave < clave:
+                camino.append(nodo)
+                nodo = nodo.derecha
+            else:
+                break
+        if nodo is None:
+            return False
+        if nodo.izquierda is not None and nodo.derecha is not None:
+            camino.append(nodo)
+            sucesor = nodo.derecha
+            while sucesor.izquierda is not None:
+                camino.append(sucesor)
+                sucesor = sucesor.izquierda
+            nodo.clave, nodo.valor = sucesor.clave, sucesor.valor
+            nodo = sucesor
+        hijo = nodo.izquierda if nodo.izquierda is not None else nodo.derecha
+        if not camino:
+            self.raiz = hijo
+        elif camino[-1].izquierda is nodo:
+            camino[-1].izquierda = hijo
+        else:
+            camino[-1].derecha = hijo
+        self._rebalancear(camino)
+        return True
+
+    def __setitem__(self, clave, valor):
+        self.insertar(clave, valor)
+
+    def __delitem__(self, clave):
+        if not self.eliminar(clave):
+            raise KeyError(clave)
+
+    # ---- Consultas -------------------------------------------------------------------
+
+    def _nodo(self, clave):
+        nodo = self.raiz
+        while nodo is not None:
+            if clave < nodo.clave:
+                nodo = nodo.izquierda
+            elif nodo.clave < clave:
+                nodo = nodo.derecha
+            else:
+                return nodo
+        return None
+
+    def buscar(self, clave, defecto=None):
+        """Valor de la clave, o defecto si no está"""
+        nodo = self._nodo(clave)
+        return defecto if nodo is None else nodo.valor
+
+    def __getitem__(self, clave):
+        nodo = self._nodo(clave)
+        if nodo is None:
+            raise KeyError(clave)
+        return nodo.valor
+
+    def __contains__(self, clave):
+        return self._nodo(clave) is not None
+
+    def __len__(self):
+        return _tamaño(self.raiz)
+
+    def _contar_menores(self, clave, incluir_igual):
+        cuenta = 0
+        nodo = self.raiz
+        while nodo is not None:
+            if clave < nodo.clave or (not incluir_igual and not nodo.clave < clave):
+                nodo = nodo.izquierda
+            else:
+                cuenta += _tamaño(nodo.izquierda) + 1
+                nodo = nodo.derecha
+        return cuenta
+
+    def posicion(self, clave):
+        """Rank: número de claves menores que clave (la clave no tiene que estar)"""
+        return self._contar_menores(clave, False)
+
+    def seleccionar(self, k):
+        """
+        Select: la k-ésima clave en orden (desde 0; negativos cuentan desde el final)
+
+        Returns:
+            tuple: (clave, valor)
+        """
+        n = len(self)
+        if k < 0:
+            k += n
+        if not 0 <= k < n:
+            raise IndexError("Posición fuera del árbol")
+        nodo = self.raiz
+        while True:
+            izquierda = _tamaño(nodo.izquierda)
+            if k < izquierda:
+                nodo = nodo.izquierda
+            elif k == izquierda:
+                return nodo.clave, nodo.valor
+            else:
+                k -= izquierda + 1
+                nodo = nodo.derecha
+
+    def contar_rango(self, minimo, maximo):
+        """Número de claves c con minimo <= c <= maximo, en O(log n)"""
+        if maximo < minimo:
+            return 0
+        return self._contar_menores(maximo, True) - self._contar_menores(minimo, False)
+
+    def primero(self):
+        """(clave, valor) de la menor clave, o None si está vacío"""
+        nodo = self.raiz
+        if nodo is None:
+            return None
+        while nodo.izquierda is not None:
+            nodo = nodo.izquierda
+        return nodo.clave, nodo.valor
+
+    def ultimo(self):
+        """(clave, valor) de la mayor clave, o None si está vacío"""
+        nodo = self.raiz
+        if nodo is None:
+            return None
+        while nodo.derecha is not None:
+            nodo = nodo.derecha
+        return nodo.clave, nodo.valor
+
+    # ---- Recorridos ------------------------------------------------------------------
+
+    def rango(self, minimo=None, maximo=None):
+        """Genera en orden los pares (clave, valor) con minimo <= clave <= maximo (None = sin límite)"""
+        pila = []
+        nodo = self.raiz
+        while pila or nodo is not None:
+            while nodo is not None:
+                if minimo is not None and nodo.clave < minimo:
+                    nodo = nodo.derecha
+                else:
+                    pila.append(nodo)
+                    nodo = nodo.izquierda
+            if not pila:
+                return
+            nodo = pila.pop()
+            if maximo is not None and maximo < nodo.clave:
+                return
+            yield nodo.clave, nodo.valor
+            nodo = nodo.derecha
+
+    def items(self):
+        return self.rango()
+
+    def claves(self):
+        for clave, _ in self.rango():
+            yield clave
+
+    def valores(self):
+        for _, valor in self.rango():
+            yield valor
+
+    __iter__ = claves
+
+    def __reversed__(self):
+        """Claves de mayor a menor"""
+        pila = []
+        nodo = self.raiz
+        while pila or nodo is not None:
+            while nodo is not None:
+                pila.append(nodo)
+                nodo = nodo.derecha
+            nodo = pila.pop()
+            yield nodo.clave
+            nodo = nodo.izquierda
+
+    def altura(self):
+        return _altura(self.raiz)
+
+    def __repr__(self):
+        return f"ArbolAVL({list(self.items())!r})"
+
+
+if __name__ == "__main__":
+    arbol = ArbolAVL()
+    for valor in [10, 20, 30, 40, 50, 25]:
+        arbol.insertar(valor)
+    print("Recorrido inorden:", list(arbol))
+    print("Posición del 30:", arbol.posicion(30))
+    print("Tercera clave:", arbol.seleccionar(2)[0])
+    print("Claves entre 15 y 40:", arbol.contar_rango(15, 40))
+    arbol.eliminar(30)
+    print("Sin el 30:", list(arbol), "altura", arbol.altura())
+
+    grande = ArbolAVL.desde_ordenados(range(1000000))
+    print(f"Un millón de claves: altura {grande.altura()}")
@@ -0,0 +1,371 @@
+"""
+Árbol B+ de dos niveles (lista ordenada de bloques) como mapa ordenado
+
+Misma interfaz que ArbolAVL (arbol_avl.py), pero en vez de un objeto por
+clave guarda las claves en bloques (hojas) de cientos a miles de elementos,
+más un índice con la mayor clave de cada hoja. Buscar es un bisect en el
+índice y otro en la hoja; insertar y eliminar mueven a lo sumo una hoja (un
+memmove en C) y la dividen o fusionan al pasar de 2 * carga o bajar de
+carga / 2. Para posicion y seleccionar se lleva un árbol de Fenwick con el
+tamaño de cada hoja, que se reconstruye solo cuando cambian las hojas.
+
+Con tipo (código de array, por ejemplo "q" o "d") las claves se guardan en
+array.array: unos 8 bytes por clave en lugar de un nodo y un objeto entero.
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from heapq import merge
+from itertools import chain, islice
+from operator import lt
+
+CARGA = 1000  # Tamaño típico de una hoja
+
+
+class ArbolB:
+    """Mapa ordenado con la interfaz de ArbolAVL, guardado en hojas de claves contiguas"""
+
+    def __init__(self, pares=(), tipo=None, carga=CARGA):
+        """
+        Args:
+            pares (iterable): Pares (clave, valor) iniciales, en cualquier orden
+            tipo (str): Código de array.array para las claves (None = lista de Python)
+            carga (int): Tamaño típico de una hoja
+        """
+        if carga < 4:
+            raise ValueError("La carga debe ser al menos 4")
+        self.tipo = tipo
+        self.carga = carga
+        self._hojas = []     # Claves, por hoja
+        self._valores = []   # Valores, en listas paralelas a las hojas
+        self._maximos = []   # Mayor clave de cada hoja
+        self._cantidad = 0
+        self._fenwick = None  # Tamaños de hoja acumulados (None = hay que reconstruirlo)
+        self.insertar_muchos(pares)
+
+    @classmethod
+    def desde_ordenados(cls, claves, valores=None, tipo=None, carga=CARGA):
+        """
+        Construye el mapa en O(n)
+
+        Args:
+            claves (iterable): Claves en orden estrictamente ascendente
+            valores (iterable): Valores en el mismo orden (None = todos None)
+        """
+        claves = list(claves)
+        valores = [None] * len(claves) if valores is None else list(valores)
+        if len(valores) != len(claves):
+            raise ValueError("Debe haber un valor por clave")
+        if not all(map(lt, claves, islice(claves, 1, None))):
+            raise ValueError("Las claves deben estar ordenadas y sin repetir")
+        mapa = cls(tipo=tipo, carga=carga)
+        mapa._cargar(claves, valores)
+        return mapa
+
+    def _hoja(self, claves):
+        return array(self.tipo, claves) if self.tipo else list(claves)
+
+    def _cargar(self, claves, valores):
+        """Reemplaza el contenido por claves ya ordenadas y sin repetir"""
+        carga = self.carga
+        self._hojas = [self._hoja(claves[i:i + carga]) for i in range(0, len(claves), carga)]
+        self._valores = [valores[i:i + carga] for i in range(0, len(valores), carga)]
+        self._maximos = [hoja[-1] for hoja in self._hojas]
+        self._cantidad = len(claves)
+        self._fenwick = None
+
+    # ---- Índice de posiciones ----------------------------------------------------
+
+    def _acumulado(self):
+        fenwick = self._fenwick
+        if fenwick is None:
+            fenwick = [0]
+            fenwick.extend(len(hoja) for hoja in self._hojas)
+            for k in range(1, len(fenwick)):
+                padre = k + (k & -k)
+                if padre < len(fenwick):
+                    fenwick[padre] += fenwick[k]
+            self._fenwick = fenwick
+        return fenwick
+
+    def _sumar(self, i, delta):
+        fenwick = self._fenwick
+        if fenwick is not None:
+            k = i + 1
+            while k < len(fenwick):
+                fenwick[k] += delta
+                k += k & -k
+
+    def _antes_de(self, i):
+        """Número de claves en las hojas anteriores a la hoja i"""
+        fenwick = self._acumulado()
+        suma = 0
+        while i:
+            suma += fenwick[i]
+            i -= i & -i
+        return suma
+
+    # ---- Modificación ------------------------------------------------------------
+
+    def insertar(self, clave, valor=None):
+        """
+        Inserta una clave o reemplaza su valor
+
+        Returns:
+            bool: True si la clave no estaba
+        """
+        maximos = self._maximos
+        if not maximos:
+            self._hojas.append(self._hoja([clave]))
+            self._valores.append([valor])
+            maximos.append(clave)
+            self._cantidad = 1
+            self._fenwick = None
+            return True
+        i = bisect_left(maximos, clave)
+        if i == len(maximos):
+            i -= 1
+            hoja = self._hojas[i]
+            hoja.append(clave)
+            self._valores[i].append(valor)
+            maximos[i] = clave
+        else:
+            hoja = self._hojas[i]
+            j = bisect_left(hoja, clave)
+            if not clave < hoja[j]:
+                self._valores[i][j] = valor
+                return False
+            hoja.insert(j, clave)
+            self._valores[i].insert(j, valor)
+        self._cantidad += 1
+        if len(hoja) > 2 * self.carga:
+            self._dividir(i)
+        else:
+            self._sumar(i, 1)
+        return True
+
+    def _dividir(self, i):
+        hoja, valores = self._hojas[i], self._valores[i]
+        mitad = len(hoja) // 2
+        self._hojas[i:i + 1] = [hoja[:mitad], hoja[mitad:]]
+        self._valores[i:i + 1] = [valores[:mitad], valores[mitad:]]
+        self._maximos.insert(i, hoja[mitad - 1])
+        self._fenwick = None
+
+    def insertar_muchos(self, pares):
+        """
+        Inserta varios pares (clave, valor)
+
+        Si el lote es grande frente al mapa, mezcla ambos en orden y recarga las
+        hojas en O(n + k log k); si no, inserta uno por uno.
+        """
+        pares = list(pares)
+        if len(pares) * 8 < self._cantidad:
+            for clave, valor in pares:
+                self.insertar(clave, valor)
+            return
+        nuevos = {}
+        for clave, valor in pares:
+            nuevos[clave] = valor  # Si una clave se repite en el lote, gana la última
+        lote = sorted(nuevos.items(), key=lambda par: par[0])
+        claves, valores = [], []
+        for clave, valor in merge(lote, self.items(), key=lambda par: par[0]):
+            if claves and not claves[-1] < clave:
+                continue  # La clave ya estaba: la mezcla pone primero el valor del lote
+            claves.append(clave)
+            valores.append(valor)
+        self._cargar(claves, valores)
+
+    def eliminar(self, clave):
+        """
+        Elimina una clave
+
+        Returns:
+            bool: True si la clave estaba
+        """
+        maximos = self._maximos
+        i = bisect_left(maximos, clave)
+        if i == len(maximos):
+            return False
+        hoja = self._hojas[i]
+        j = bisect_left(hoja, clave)
+        if clave < hoja[j]:
+            return False
+        del hoja[j]
+        del self._valores[i][j]
+        self._cantidad -= 1
+        if not hoja:
+            del self._hojas[i], self._valores[i], maximos[i]
+            self._fenwick = None
+            return True
+        if j == len(hoja):
+            maximos[i] = hoja[-1]
+        if len(hoja) < self.carga // 2 and len(maximos) > 1:
+            self._fusionar(i)
+        else:
+            self._sumar(i, -1)
+        return True
+
+    def _fusionar(self, i):
+        """Une la hoja i con una vecina (y la vuelve a dividir si quedó demasiado grande)"""
+        if i == len(self._hojas) - 1:
+            i -= 1
+        self._hojas[i] += self._hojas[i + 1]
+        self._valores[i] += self._valores[i + 1]
+        self._maximos[i] = self._maximos[i + 1]
+        del self._hojas[i + 1], self._valores[i + 1], self._maximos[i + 1]
+        self._fenwick = None
+        if len(self._hojas[i]) > 2 * self.carga:
+            self._dividir(i)
+
+    def __setitem__(self, clave, valor):
+        self.insertar(clave, valor)
+
+    def __delitem__(self, clave):
+        if not self.eliminar(clave):
+            raise KeyError(clave)
+
+    # ---- Consultas -------------------------------------------------------------------
+
+    def _ubicar(self, clave):
+        """(hoja, índice) donde está la clave, o (None, None)"""
+        i = bisect_left(self._maximos, clave)
+        if i < len(self._maximos):
+            hoja = self._hojas[i]
+            j = bisect_left(hoja, clave)
+            if not clave < hoja[j]:
+                return i, j
+        return None, None
+
+    def buscar(self, clave, defecto=None):
+        """Valor de la clave, o defecto si no está"""
+        i, j = self._ubicar(clave)
+        return defecto if i is None else self._valores[i][j]
+
+    def __getitem__(self, clave):
+        i, j = self._ubicar(clave)
+        if i is None:
+            raise KeyError(clave)
+        return self._valores[i][j]
+
+    def __contains__(self, clave):
+        return self._ubicar(clave)[0] is not None
+
+    def __len__(self):
+        return self._cantidad
+
+    def posicion(self, clave):
+        """Rank: número de claves menores que clave (la clave no tiene que estar)"""
+        i = bisect_left(self._maximos, clave)
+        if i == len(self._maximos):
+            return self._cantidad
+        return self._antes_de(i) + bisect_left(self._hojas[i], clave)
+
+    def _hasta(self, clave):
+        """Número de claves menores o iguales que clave"""
+        i = bisect_right(self._maximos, clave)
+        if i == len(self._maximos):
+            return self._cantidad
+        return self._antes_de(i) + bisect_right(self._hojas[i], clave)
+
+    def seleccionar(self, k):
+        """
+        Select: la k-ésima clave en orden (desde 0; negativos cuentan desde el final)
+
+        Returns:
+            tuple: (clave, valor)
+        """
+        if k < 0:
+            k += self._cantidad
+        if not 0 <= k < self._cantidad:
+            raise IndexError("Posición fuera del árbol")
+        fenwick = self._acumulado()
+        # Descenso por el árbol de Fenwick: la hoja i es la última con menos de k + 1 claves antes
+        i, paso = 0, 1 << (len(fenwick) - 1).bit_length()
+        while paso:
+            siguiente = i + paso
+            if siguiente < len(fenwick) and fenwick[siguiente] <= k:
+                i = siguiente
+                k -= fenwick[i]
+            paso >>= 1
+        return self._hojas[i][k], self._valores[i][k]
+
+    def contar_rango(self, minimo, maximo):
+        """Número de claves c con minimo <= c <= maximo, en O(log n)"""
+        if maximo < minimo:
+            return 0
+        return self._hasta(maximo) - self.posicion(minimo)
+
+    def primero(self):
+        """(clave, valor) de la menor clave, o None si está vacío"""
+        if not self._hojas:
+            return None
+        return self._hojas[0][0], self._valores[0][0]
+
+    def ultimo(self):
+        """(clave, valor) de la mayor clave, o None si está vacío"""
+        if not self._hojas:
+            return None
+        return self._hojas[-1][-1], self._valores[-1][-1]
+
+    # ---- Recorridos ------------------------------------------------------------------
+
+    def rango(self, minimo=None, maximo=None):
+        """Genera en orden los pares (clave, valor) con minimo <= clave <= maximo (None = sin límite)"""
+        hojas, valores, maximos = self._hojas, self._valores, self._maximos
+        if not hojas:
+            return
+        i, j = 0, 0
+        if minimo is not None:
+            i = bisect_left(maximos, minimo)
+            if i == len(maximos):
+                return
+            j = bisect_left(hojas[i], minimo)
+        fin_i = len(hojas) - 1
+        if maximo is not None:
+            fin_i = min(bisect_left(maximos, maximo), fin_i)
+        fin_j = len(hojas[fin_i]) if maximo is None else bisect_right(hojas[fin_i], maximo)
+        if fin_i < i or (fin_i == i and fin_j <= j):
+            return
+        if i == fin_i:
+            yield from zip(hojas[i][j:fin_j], valores[i][j:fin_j])
+            return
+        yield from zip(hojas[i][j:], valores[i][j:])
+        for k in range(i + 1, fin_i):
+            yield from zip(hojas[k], valores[k])
+        yield from zip(hojas[fin_i][:fin_j], valores[fin_i][:fin_j])
+
+    def items(self):
+        return self.rango()
+
+    def claves(self):
+        return chain.from_iterable(self._hojas)
+
+    def valores(self):
+        return chain.from_iterable(self._valores)
+
+    __iter__ = claves
+
+    def __reversed__(self):
+        """Claves de mayor a menor"""
+        for hoja in reversed(self._hojas):
+            yield from reversed(hoja)
+
+    def __repr__(self):
+        return f"ArbolB({list(self.items())!r})"
+
+
+if __name__ == "__main__":
+    arbol = ArbolB(carga=4)
+    for valor in [10, 20, 30, 40, 50, 25, 35, 45, 5]:
+        arbol.insertar(valor)
+    print("Recorrido en orden:", list(arbol))
+    print("Hojas:", arbol._hojas)
+    print("Posición del 30:", arbol.posicion(30))
+    print("Tercera clave:", arbol.seleccionar(2)[0])
+    print("Claves entre 15 y 40:", arbol.contar_rango(15, 40))
+    arbol.eliminar(30)
+    print("Sin el 30:", list(arbol))
+
+    grande = ArbolB.desde_ordenados(range(1000000), tipo="q")
+    print(f"Un millón de claves en {len(grande._hojas)} hojas")
@@ -0,0 +1,204 @@
+"""
+Árbol binario de búsqueda iterativo
+
+Misma idea que insertar_nodo y recorrido_inorden (17Arboles.py), pero sin
+recursión: insertar, buscar y eliminar bajan por el árbol con un ciclo, y el
+recorrido inorden es un generador con una pila explícita. Con datos ordenados
+el árbol insertado uno a uno degenera en una lista enlazada (altura n) sin
+llegar al límite de recursión; para esos datos está desde_ordenados, que arma
+en O(n) un árbol balanceado.
+
+rango(minimo, maximo) solo visita los subárboles que pueden tener valores del
+intervalo: O(altura + k) para k resultados.
+"""
+
+
+class Nodo:
+    __slots__ = ("valor", "izquierda", "derecha")
+
+    def __init__(self, valor):
+        self.valor = valor
+        self.izquierda = None
+        self.derecha = None
+
+
+class ArbolBinario:
+    def __init__(self, valores=()):
+        self.raiz = None
+        self.cantidad = 0
+        for valor in valores:
+            self.insertar(valor)
+
+    @classmethod
+    def desde_ordenados(cls, valores):
+        """
+        Construye un árbol balanceado a partir de valores ordenados, en O(n)
+
+        Args:
+            valores (iterable): Valores en orden ascendente (los repetidos se ignoran)
+        """
+        unicos = []
+        for valor in valores:
+            if unicos and not unicos[-1] < valor:
+                if valor < unicos[-1]:
+                    raise ValueError("Los valores deben estar ordenados")
+                continue
+            unicos.append(valor)
+        arbol = cls()
+        arbol.cantidad = len(unicos)
+        if not unicos:
+            return arbol
+        # Pila de (inicio, fin, padre, lado): el nodo es el centro de unicos[inicio:fin]
+        pendientes = [(0, len(unicos), None, None)]
+        while pendientes:
+            inicio, fin, padre, lado = pendientes.pop()
+            medio = (inicio + fin) // 2
+            nodo = Nodo(unicos[medio])
+            if padre is None:
+                arbol.raiz = nodo
+            elif lado:
+                padre.derecha = nodo
+            else:
+                padre.izquierda = nodo
+            if inicio < medio:
+                pendientes.append((inicio, medio, nodo, False))
+            if medio + 1 < fin:
+                pendientes.append((medio + 1, fin, nodo, True))
+        return arbol
+
+    def insertar(self, valor):
+        """
+        Inserta un valor (los repetidos se ignoran, como en insertar_nodo)
+
+        Returns:
+            bool: True si el valor no estaba
+        """
+        nuevo = Nodo(valor)
+        if self.raiz is None:
+            self.raiz = nuevo
+            self.cantidad = 1
+            return True
+        nodo = self.raiz
+        while True:
+            if valor < nodo.valor:
+                if nodo.izquierda is None:
+                    nodo.izquierda = nuevo
+                    break
+                nodo = nodo.izquierda
+            elif nodo.valor < valor:
+                if nodo.derecha is None:
+                    nodo.derecha = nuevo
+                    break
+                nodo = nodo.derecha
+            else:
+                return False
+        self.cantidad += 1
+        return True
+
+    def buscar(self, valor):
+        """
+        Returns:
+            Nodo: El nodo con ese valor, o None si no está
+        """
+        nodo = self.raiz
+        while nodo is not None:
+            if valor < nodo.valor:
+                nodo = nodo.izquierda
+            elif nodo.valor < valor:
+                nodo = nodo.derecha
+            else:
+                return nodo
+        return None
+
+    def __contains__(self, valor):
+        return self.buscar(valor) is not None
+
+    def eliminar(self, valor):
+        """
+        Elimina un valor; un nodo con dos hijos toma el valor de su sucesor
+
+        Returns:
+            bool: True si el valor estaba en el árbol
+        """
+        padre, nodo = None, self.raiz
+        while nodo is not None and nodo.valor != valor:
+            padre = nodo
+            nodo = nodo.izquierda if valor < nodo.valor else nodo.derecha
+        if nodo is None:
+            return False
+        if nodo.izquierda is not None and nodo.derecha is not None:
+            # Sucesor: el menor del subárbol derecho (no tiene hijo izquierdo)
+            padre, sucesor = nodo, nodo.derecha
+            while sucesor.izquierda is not None:
+                padre, sucesor = sucesor, sucesor.izquierda
+            nodo.valor = sucesor.valor
+            nodo = sucesor
+        hijo = nodo.izquierda if nodo.izquierda is not None else nodo.derecha
+        if padre is None:
+            self.raiz = hijo
+        elif padre.izquierda is nodo:
+            padre.izquierda = hijo
+        else:
+            padre.derecha = hijo
+        self.cantidad -= 1
+        return True
+
+    def inorden(self):
+        """Genera los valores de menor a mayor"""
+        pila = []
+        nodo = self.raiz
+        while pila or nodo is not None:
+            while nodo is not None:
+                pila.append(nodo)
+                nodo = nodo.izquierda
+            nodo = pila.pop()
+            yield nodo.valor
+            nodo = nodo.derecha
+
+    __iter__ = inorden
+
+    def rango(self, minimo, maximo):
+        """Genera, en orden, los valores v con minimo <= v <= maximo"""
+        pila = []
+        nodo = self.raiz
+        while pila or nodo is not None:
+            while nodo is not None:
+                if nodo.valor < minimo:
+                    nodo = nodo.derecha  # Ni el nodo ni su subárbol izquierdo entran
+                else:
+                    pila.append(nodo)
+                    nodo = nodo.izquierda
+            if not pila:
+                return
+            nodo = pila.pop()
+            if maximo < nodo.valor:
+                return
+            yield nodo.valor
+            nodo = nodo.derecha
+
+    def altura(self):
+        """Número de niveles (0 si está vacío), recorriendo por niveles"""
+        niveles = 0
+        nivel = [self.raiz] if self.raiz is not None else []
+        while nivel:
+            niveles += 1
+            nivel = [hijo for nodo in nivel for hijo in (nodo.izquierda, nodo.derecha) if hijo is not None]
+        return niveles
+
+    def __len__(self):
+        return self.cantidad
+
+
+if __name__ == "__main__":
+    arbol = ArbolBinario([10, 5, 20, 3, 7, 15, 25])
+    print("El recorrido del arbol es: ", list(arbol))
+    print("Valores entre 6 y 20:", list(arbol.rango(6, 20)))
+    arbol.eliminar(10)
+    print("Sin el 10:", list(arbol))
+
+    ordenado = ArbolBinario()
+    for valor in range(3000):  # Cuadrático: cada inserción baja por toda la lista
+        ordenado.insertar(valor)
+    print(f"Insertando en orden: altura {ordenado.altura()}")
+    balanceado = ArbolBinario.desde_ordenados(range(1000000))
+    print(f"desde_ordenados con un millón de valores: altura {balanceado.altura()}")
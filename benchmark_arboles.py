@@ -0,0 +1,179 @@
+"""
+Benchmark de mapas ordenados: ArbolAVL y ArbolB contra una lista ordenada con bisect
+
+La lista ordenada guarda claves y valores en dos listas paralelas; buscar y
+contar son búsquedas binarias en C, pero insertar y eliminar mueven en
+promedio la mitad de la lista. El AVL hace todo en O(log n) pero en Python,
+con un objeto por clave; ArbolB mueve solo una hoja de a lo sumo 2000 claves
+(con tipo "q", guardadas en array.array).
+
+Escenarios:
+- mixto: operaciones aleatorias (insertar, eliminar, buscar, contar_rango,
+  posicion, seleccionar) sobre un mapa precargado con --inicial claves.
+- construir: armar el mapa a partir de claves ordenadas.
+- recorrer: iterar todas las claves en orden.
+- memoria: bytes por clave del mapa construido (medidos con tracemalloc).
+
+Uso:
+    python benchmark_arboles.py                          # 10^6 operaciones
+    python benchmark_arboles.py --operaciones 100000 --inicial 1000000
+"""
+
+import argparse
+import random
+import time
+import tracemalloc
+from bisect import bisect_left, bisect_right
+
+from arbol_avl import ArbolAVL
+from arbol_b import ArbolB
+
+
+class ListaOrdenada:
+    """Mapa ordenado sobre listas de Python mantenidas con bisect (misma interfaz que ArbolAVL)"""
+
+    def __init__(self):
+        self.lista_claves = []
+        self.lista_valores = []
+
+    @classmethod
+    def desde_ordenados(cls, claves, valores=None):
+        mapa = cls()
+        mapa.lista_claves = list(claves)
+        mapa.lista_valores = [None] * len(mapa.lista_claves) if valores is None else list(valores)
+        return mapa
+
+    def insertar(self, clave, valor=None):
+        i = bisect_left(self.lista_claves, clave)
+        if i < len(self.lista_claves) and self.lista_claves[i] == clave:
+            self.lista_valores[i] = valor
+            return False
+        self.lista_claves.insert(i, clave)
+        self.lista_valores.insert(i, valor)
+        return True
+
+    def eliminar(self, clave):
+        i = bisect_left(self.lista_claves, clave)
+        if i < len(self.lista_claves) and self.lista_claves[i] == clave:
+            del self.lista_claves[i]
+            del self.lista_valores[i]
+            return True
+        return False
+
+    def buscar(self, clave, defecto=None):
+        i = bisect_left(self.lista_claves, clave)
+        if i < len(self.lista_claves) and self.lista_claves[i] == clave:
+            return self.lista_valores[i]
+        return defecto
+
+    def posicion(self, clave):
+        return bisect_left(self.lista_claves, clave)
+
+    def seleccionar(self, k):
+        return self.lista_claves[k], self.lista_valores[k]
+
+    def contar_rango(self, minimo, maximo):
+        return max(0, bisect_right(self.lista_claves, maximo) - bisect_left(self.lista_claves, minimo))
+
+    def __iter__(self):
+        return iter(self.lista_claves)
+
+    def __len__(self):
+        return len(self.lista_claves)
+
+
+# (nombre, constructor a partir de claves ordenadas)
+CONTENDIENTES = (
+    ("ArbolAVL", ArbolAVL.desde_ordenados),
+    ("ArbolB", ArbolB.desde_ordenados),
+    ("ArbolB[q]", lambda claves: ArbolB.desde_ordenados(claves, tipo="q")),
+    ("bisect", ListaOrdenada.desde_ordenados),
+)
+
+
+def generar_operaciones(operaciones, universo, semilla):
+    """Lista de (operación, argumento, argumento) generada de antemano para no medir el azar"""
+    azar = random.Random(semilla)
+    tabla = (("insertar", 30), ("eliminar", 20), ("buscar", 30), ("contar_rango", 10),
+             ("posicion", 5), ("seleccionar", 5))
+    nombres = [nombre for nombre, peso in tabla for _ in range(peso)]
+    resultado = []
+    for _ in range(operaciones):
+        nombre = azar.choice(nombres)
+        clave = azar.randrange(universo)
+        resultado.append((nombre, clave, clave + azar.randrange(universo // 100 + 1)))
+    return resultado
+
+
+def mixto(construir_mapa, inicial, lista_operaciones):
+    mapa = construir_mapa(range(0, 2 * inicial, 2))
+    acciones = {
+        "insertar": lambda a, b: mapa.insertar(a, b),
+        "eliminar": lambda a, b: mapa.eliminar(a),
+        "buscar": lambda a, b: mapa.buscar(a),
+        "contar_rango": mapa.contar_rango,
+        "posicion": lambda a, b: mapa.posicion(a),
+        "seleccionar": lambda a, b: mapa.seleccionar(a % len(mapa)) if len(mapa) else None,
+    }
+    inicio = time.perf_counter()
+    for nombre, a, b in lista_operaciones:
+        acciones[nombre](a, b)
+    return time.perf_counter() - inicio, len(mapa)
+
+
+def construir(construir_mapa, n):
+    inicio = time.perf_counter()
+    construir_mapa(range(n))
+    return time.perf_counter() - inicio
+
+
+def recorrer(construir_mapa, n):
+    mapa = construir_mapa(range(n))
+    inicio = time.perf_counter()
+    for _ in mapa:
+        pass
+    return time.perf_counter() - inicio
+
+
+def memoria(construir_mapa, n):
+    """Bytes por clave que quedan asignados al construir el mapa (incluye los objetos int de las claves)"""
+    claves = range(10 ** 6, 10 ** 6 + 2 * n, 2)
+    tracemalloc.start()
+    mapa = construir_mapa(claves)
+    usados = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del mapa
+    return usados / n
+
+
+def _mostrar(escenario, nombre, segundos, operaciones):
+    print(f"{escenario:<14}{nombre:<14}{segundos:>11.3f}s{operaciones / segundos / 1e6:>10.2f} Mops/s")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark de mapas ordenados")
+    parser.add_argument("--operaciones", type=int, default=10 ** 6, help="Operaciones del escenario mixto")
+    parser.add_argument("--inicial", type=int, default=100000, help="Claves precargadas (mixto)")
+    parser.add_argument("--claves", type=int, default=10 ** 6, help="Claves para construir y recorrer")
+    parser.add_argument("--semilla", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    lista_operaciones = generar_operaciones(args.operaciones, 2 * args.inicial, args.semilla)
+    print(f"{'Escenario':<14}{'Mapa':<14}{'Tiempo':>12}{'Rendimiento':>17}")
+    tamaños = set()
+    for nombre, construir_mapa in CONTENDIENTES:
+        segundos, tamaño = mixto(construir_mapa, args.inicial, lista_operaciones)
+        tamaños.add(tamaño)
+        _mostrar("mixto", nombre, segundos, args.operaciones)
+    if len(tamaños) != 1:
+        raise AssertionError(f"Los mapas terminaron con tamaños distintos: {tamaños}")
+    for nombre, construir_mapa in CONTENDIENTES:
+        _mostrar("construir", nombre, construir(construir_mapa, args.claves), args.claves)
+    for nombre, construir_mapa in CONTENDIENTES:
+        _mostrar("recorrer", nombre, recorrer(construir_mapa, args.claves), args.claves)
+    for nombre, construir_mapa in CONTENDIENTES:
+        print(f"{'memoria':<14}{nombre:<14}{memoria(construir_mapa, args.claves):>11.1f} bytes por clave")
+
+
+if __name__ == "__main__":
+    main()
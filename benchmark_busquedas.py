@@ -0,0 +1,221 @@
+"""
+Comparación empírica de algoritmos de búsqueda
+
+Reemplaza la medición de 12Notacion.py (una sola llamada de cada búsqueda
+medida con time.time(), que queda dominada por el ruido) por un barrido:
+
+- Tamaños en progresión geométrica (--min, --max, --factor).
+- Para cada tamaño y algoritmo: --calentamiento corridas sin medir y
+  --repeticiones corridas medidas con perf_counter_ns, cada una con las
+  mismas --consultas búsquedas (la mitad de valores presentes). Se reporta
+  la mediana en nanosegundos por búsqueda.
+- Con los tiempos de todos los tamaños se ajusta por mínimos cuadrados el
+  exponente k de t ~ n^k: cerca de 1 es lineal y cerca de 0 es logarítmico
+  o mejor.
+
+Los algoritmos se registran con @registrar. Un algoritmo "por lote" recibe
+todas las consultas juntas (como numpy.searchsorted, que solo se incluye si
+numpy está instalado).
+
+Uso:
+    python benchmark_busquedas.py
+    python benchmark_busquedas.py --max 10000000 --csv resultados.csv
+"""
+
+import argparse
+import csv
+import math
+import random
+import statistics
+import sys
+import time
+
+from busquedas import (busqueda_bisect, busqueda_binaria, busqueda_exponencial,
+                       busqueda_interpolacion, busqueda_lineal)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# nombre -> (función, por_lote, preparar, tamaño máximo)
+ALGORITMOS = {}
+
+
+def registrar(nombre, por_lote=False, preparar=None, maximo=None):
+    """
+    Registra un algoritmo en el benchmark
+
+    Args:
+        nombre (str): Nombre en las tablas
+        por_lote (bool): La función recibe (datos, lista de objetivos) y devuelve una lista de índices
+        preparar (callable): Convierte (datos, objetivos) antes de medir (por ejemplo, a arreglos numpy)
+        maximo (int): Tamaño a partir del cual no se mide (para los algoritmos O(n))
+    """
+    def decorador(funcion):
+        ALGORITMOS[nombre] = (funcion, por_lote, preparar, maximo)
+        return funcion
+    return decorador
+
+
+registrar("lineal", maximo=10 ** 5)(busqueda_lineal)
+registrar("binaria")(busqueda_binaria)
+registrar("interpolacion")(busqueda_interpolacion)
+registrar("exponencial")(busqueda_exponencial)
+registrar("bisect")(busqueda_bisect)
+
+if np is not None:
+    def _a_numpy(datos, objetivos):
+        return np.asarray(datos, dtype=np.int64), np.asarray(objetivos, dtype=np.int64)
+
+    @registrar("numpy.searchsorted", por_lote=True, preparar=_a_numpy)
+    def busqueda_numpy(datos, objetivos):
+        posiciones = np.searchsorted(datos, objetivos)
+        dentro = np.minimum(posiciones, len(datos) - 1)
+        return np.where(datos[dentro] == objetivos, posiciones, -1)
+
+
+def tamaños_geometricos(minimo, maximo, factor):
+    tamaños = []
+    n = minimo
+    while n <= maximo:
+        tamaños.append(int(n))
+        n *= factor
+    return tamaños
+
+
+def generar_caso(n, consultas, azar):
+    """Lista ordenada de n enteros distintos y consultas (mitad presentes, mitad al azar)"""
+    datos = sorted(azar.sample(range(n * 10), n))
+    objetivos = [azar.choice(datos) if i % 2 else azar.randrange(n * 10) for i in range(consultas)]
+    return datos, objetivos
+
+
+def _correr(funcion, por_lote, datos, objetivos):
+    if por_lote:
+        return list(funcion(datos, objetivos))
+    return [funcion(datos, objetivo) for objetivo in objetivos]
+
+
+def medir(nombre, datos, objetivos, calentamiento, repeticiones):
+    """
+    Mide un algoritmo sobre un caso
+
+    Returns:
+        dict: mediana y mínimo en nanosegundos por búsqueda
+    """
+    funcion, por_lote, preparar, _ = ALGORITMOS[nombre]
+    if preparar is not None:
+        datos, objetivos = preparar(datos, objetivos)
+    for _ in range(calentamiento):
+        _correr(funcion, por_lote, datos, objetivos)
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter_ns()
+        _correr(funcion, por_lote, datos, objetivos)
+        tiempos.append((time.perf_counter_ns() - inicio) / len(objetivos))
+    return {"mediana_ns": statistics.median(tiempos), "minimo_ns": min(tiempos)}
+
+
+def verificar(nombre, datos, objetivos):
+    """Compara las respuestas del algoritmo con bisect; lanza AssertionError si alguna difiere"""
+    funcion, por_lote, preparar, _ = ALGORITMOS[nombre]
+    esperado = [busqueda_bisect(datos, objetivo) for objetivo in objetivos]
+    entrada = preparar(datos, objetivos) if preparar is not None else (datos, objetivos)
+    obtenido = [int(i) for i in _correr(funcion, por_lote, *entrada)]
+    if obtenido != esperado:
+        raise AssertionError(f"{nombre} da resultados distintos de bisect con n={len(datos)}")
+
+
+def ajustar_exponente(puntos):
+    """
+    Pendiente de log(t) contra log(n) por mínimos cuadrados
+
+    Args:
+        puntos (list): Pares (n, tiempo)
+
+    Returns:
+        float: Exponente k de t ~ n^k (None con menos de dos tamaños)
+    """
+    if len(puntos) < 2:
+        return None
+    xs = [math.log(n) for n, _ in puntos]
+    ys = [math.log(t) for _, t in puntos]
+    media_x, media_y = statistics.fmean(xs), statistics.fmean(ys)
+    numerador = sum((x - media_x) * (y - media_y) for x, y in zip(xs, ys))
+    denominador = sum((x - media_x) ** 2 for x in xs)
+    return numerador / denominador
+
+
+def correr_barrido(nombres, tamaños, consultas, calentamiento, repeticiones, semilla=42, verbose=True):
+    """
+    Mide todos los algoritmos en todos los tamaños
+
+    Returns:
+        tuple: (filas {algoritmo, n, mediana_ns, minimo_ns}, {algoritmo: exponente})
+    """
+    azar = random.Random(semilla)
+    filas = []
+    for n in tamaños:
+        datos, objetivos = generar_caso(n, consultas, azar)
+        for nombre in nombres:
+            maximo = ALGORITMOS[nombre][3]
+            if maximo is not None and n > maximo:
+                continue
+            verificar(nombre, datos, objetivos)
+            fila = {"algoritmo": nombre, "n": n}
+            fila.update(medir(nombre, datos, objetivos, calentamiento, repeticiones))
+            filas.append(fila)
+            if verbose:
+                print(f"{nombre:<20}{n:>10}{fila['mediana_ns']:>14.0f}{fila['minimo_ns']:>14.0f}")
+    exponentes = {
+        nombre: ajustar_exponente([(fila["n"], fila["mediana_ns"]) for fila in filas
+                                   if fila["algoritmo"] == nombre])
+        for nombre in nombres
+    }
+    return filas, exponentes
+
+
+def guardar_csv(filas, exponentes, archivo):
+    with open(archivo, "w", newline="") as file:
+        escritor = csv.DictWriter(file, fieldnames=["algoritmo", "n", "mediana_ns", "minimo_ns", "exponente"])
+        escritor.writeheader()
+        for fila in filas:
+            escritor.writerow(dict(fila, exponente=exponentes[fila["algoritmo"]]))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Comparación empírica de algoritmos de búsqueda")
+    parser.add_argument("--min", type=int, default=2 ** 10, help="Tamaño inicial")
+    parser.add_argument("--max", type=int, default=2 ** 20, help="Tamaño máximo")
+    parser.add_argument("--factor", type=float, default=4, help="Razón entre tamaños consecutivos")
+    parser.add_argument("--consultas", type=int, default=200, help="Búsquedas por corrida")
+    parser.add_argument("--calentamiento", type=int, default=1, help="Corridas sin medir")
+    parser.add_argument("--repeticiones", type=int, default=5, help="Corridas medidas")
+    parser.add_argument("--algoritmos", nargs="+", choices=sorted(ALGORITMOS), help="Subconjunto a medir")
+    parser.add_argument("--semilla", type=int, default=42)
+    parser.add_argument("--csv", help="Archivo CSV donde guardar los resultados")
+    args = parser.parse_args(argv)
+
+    if args.factor <= 1:
+        parser.error("--factor debe ser mayor que 1")
+    if np is None:
+        print("numpy no está instalado: se omite numpy.searchsorted")
+    nombres = args.algoritmos or list(ALGORITMOS)
+    tamaños = tamaños_geometricos(args.min, args.max, args.factor)
+
+    print(f"{'Algoritmo':<20}{'n':>10}{'Mediana ns':>14}{'Mínimo ns':>14}")
+    filas, exponentes = correr_barrido(nombres, tamaños, args.consultas, args.calentamiento,
+                                       args.repeticiones, args.semilla)
+    print("\nExponente ajustado (t ~ n^k):")
+    for nombre in nombres:
+        k = exponentes[nombre]
+        print(f"  {nombre:<20}{'sin datos' if k is None else f'{k:.2f}':>10}")
+    if args.csv:
+        guardar_csv(filas, exponentes, args.csv)
+        print(f"Resultados guardados en {args.csv}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
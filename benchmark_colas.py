@@ -0,0 +1,191 @@
+"""
+Benchmark de colas: ColaCircular contra ColaVector y la Cola enlazada, y
+ColaAcotada contra queue.Queue y asyncio.Queue
+
+Las clases de 16ejercicioscola.py se cargan sin ejecutar el script (que pide
+datos por teclado): solo se compilan sus definiciones de clases.
+
+Escenarios:
+- alternado: cola con profundidad fija; cada operación encola y desencola.
+- llenar_vaciar: encolar n elementos y luego desencolarlos todos. ColaVector
+  es cuadrática aquí (pop(0) mueve toda la lista), así que solo se mide hasta
+  --max-vector elementos.
+- por_bloques: igual que llenar_vaciar pero con encolar_muchos/desencolar_muchos.
+- hilos / asyncio: productores y consumidores concurrentes sobre una cola acotada.
+
+Uso:
+    python benchmark_colas.py                      # 10^7 operaciones por escenario
+    python benchmark_colas.py --operaciones 100000 --elementos 50000
+"""
+
+import argparse
+import ast
+import asyncio
+import os
+import queue
+import threading
+import time
+
+from cola_circular import ColaCircular
+from cola_concurrente import ColaAcotada
+
+ARCHIVO_COLAS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "16ejercicioscola.py")
+
+
+def cargar_definiciones(archivo, nombres):
+    """
+    Compila solo las clases y funciones indicadas de un script, sin ejecutar el resto
+
+    Returns:
+        dict: {nombre: clase o función}
+    """
+    with open(archivo, encoding="utf-8") as file:
+        arbol = ast.parse(file.read(), archivo)
+    arbol.body = [nodo for nodo in arbol.body
+                  if isinstance(nodo, (ast.ClassDef, ast.FunctionDef)) and nodo.name in nombres]
+    espacio = {}
+    exec(compile(arbol, archivo, "exec"), espacio)
+    return {nombre: espacio[nombre] for nombre in nombres}
+
+
+def alternado(clase, operaciones, profundidad):
+    cola = clase()
+    for i in range(profundidad):
+        cola.encolar(i)
+    encolar, desencolar = cola.encolar, cola.desencolar
+    inicio = time.perf_counter()
+    for i in range(operaciones // 2):
+        encolar(i)
+        desencolar()
+    return time.perf_counter() - inicio
+
+
+def llenar_vaciar(clase, operaciones):
+    cola = clase()
+    encolar, desencolar = cola.encolar, cola.desencolar
+    n = operaciones // 2
+    inicio = time.perf_counter()
+    for i in range(n):
+        encolar(i)
+    for _ in range(n):
+        desencolar()
+    return time.perf_counter() - inicio
+
+
+def por_bloques(operaciones, bloque):
+    cola = ColaCircular()
+    n = operaciones // 2
+    datos = list(range(bloque))
+    inicio = time.perf_counter()
+    for _ in range(n // bloque):
+        cola.encolar_muchos(datos)
+    while cola.desencolar_muchos(bloque):
+        pass
+    return time.perf_counter() - inicio
+
+
+def hilos(encolar, desencolar, elementos, productores, consumidores):
+    """Productores y consumidores en hilos; cada consumidor termina al recibir None"""
+    por_productor = elementos // productores
+
+    def producir():
+        for i in range(por_productor):
+            encolar(i)
+
+    def consumir():
+        while desencolar() is not None:
+            pass
+
+    trabajadores = [threading.Thread(target=consumir) for _ in range(consumidores)]
+    generadores = [threading.Thread(target=producir) for _ in range(productores)]
+    inicio = time.perf_counter()
+    for hilo in trabajadores + generadores:
+        hilo.start()
+    for hilo in generadores:
+        hilo.join()
+    for _ in trabajadores:
+        encolar(None)
+    for hilo in trabajadores:
+        hilo.join()
+    return time.perf_counter() - inicio
+
+
+def asincrono(fabrica, nombres, elementos, productores, consumidores):
+    """Productores y consumidores como corrutinas en un mismo event loop"""
+    por_productor = elementos // productores
+
+    async def correr():
+        cola = fabrica()
+        encolar, desencolar = getattr(cola, nombres[0]), getattr(cola, nombres[1])
+
+        async def producir():
+            for i in range(por_productor):
+                await encolar(i)
+
+        async def consumir():
+            while await desencolar() is not None:
+                pass
+
+        inicio = time.perf_counter()
+        tareas = [asyncio.create_task(consumir()) for _ in range(consumidores)]
+        await asyncio.gather(*(producir() for _ in range(productores)))
+        for _ in tareas:
+            await encolar(None)
+        await asyncio.gather(*tareas)
+        return time.perf_counter() - inicio
+
+    return asyncio.run(correr())
+
+
+def _mostrar(escenario, nombre, segundos, operaciones):
+    if segundos is None:
+        print(f"{escenario:<14}{nombre:<14}{'omitido':>12}")
+    else:
+        print(f"{escenario:<14}{nombre:<14}{segundos:>11.3f}s{operaciones / segundos / 1e6:>10.2f} Mops/s")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark de colas")
+    parser.add_argument("--operaciones", type=int, default=10 ** 7, help="Operaciones por escenario")
+    parser.add_argument("--profundidad", type=int, default=1000, help="Elementos en cola (alternado)")
+    parser.add_argument("--max-vector", type=int, default=200000,
+                        help="Máximo de operaciones de ColaVector en llenar_vaciar")
+    parser.add_argument("--bloque", type=int, default=1000, help="Tamaño de bloque (por_bloques)")
+    parser.add_argument("--elementos", type=int, default=200000,
+                        help="Elementos que pasan por las colas concurrentes")
+    parser.add_argument("--capacidad", type=int, default=1024, help="Capacidad de las colas acotadas")
+    parser.add_argument("--productores", type=int, default=2)
+    parser.add_argument("--consumidores", type=int, default=2)
+    args = parser.parse_args(argv)
+
+    clases = cargar_definiciones(ARCHIVO_COLAS, ("Nodo", "Cola", "ColaVector"))
+    contendientes = (("ColaCircular", ColaCircular), ("ColaVector", clases["ColaVector"]),
+                     ("Cola", clases["Cola"]))
+    operaciones = args.operaciones
+
+    print(f"{'Escenario':<14}{'Cola':<14}{'Tiempo':>12}{'Rendimiento':>17}")
+    for nombre, clase in contendientes:
+        _mostrar("alternado", nombre, alternado(clase, operaciones, args.profundidad), operaciones)
+    for nombre, clase in contendientes:
+        if clase is clases["ColaVector"] and operaciones > args.max_vector:
+            _mostrar("llenar_vaciar", nombre, None, operaciones)
+            continue
+        _mostrar("llenar_vaciar", nombre, llenar_vaciar(clase, operaciones), operaciones)
+    _mostrar("por_bloques", "ColaCircular", por_bloques(operaciones, args.bloque), operaciones)
+
+    elementos, capacidad = args.elementos, args.capacidad
+    trabajo = (elementos, args.productores, args.consumidores)
+    print(f"\nProductor/consumidor: {elementos} elementos, capacidad {capacidad}, "
+          f"{args.productores} productores, {args.consumidores} consumidores")
+    acotada = ColaAcotada(capacidad)
+    _mostrar("hilos", "ColaAcotada", hilos(acotada.encolar, acotada.desencolar, *trabajo), elementos)
+    estandar = queue.Queue(capacidad)
+    _mostrar("hilos", "queue.Queue", hilos(estandar.put, estandar.get, *trabajo), elementos)
+    _mostrar("asyncio", "ColaAcotada", asincrono(lambda: ColaAcotada(capacidad),
+                                                 ("encolar_async", "desencolar_async"), *trabajo), elementos)
+    _mostrar("asyncio", "asyncio.Queue", asincrono(lambda: asyncio.Queue(capacidad),
+                                                   ("put", "get"), *trabajo), elementos)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,277 @@
+"""
+Suite de benchmarks de escalabilidad para el Simulador de Red LAN
+Proyecto Final - Redes Computacionales y Análisis de Algoritmos
+
+Recorre combinaciones de número de nodos, densidad de conexiones y número de
+emergencias con semillas fijas, mide generación de topología, carga (JSON y
+binaria), enrutamiento, despacho y memoria, y guarda los resultados en JSON.
+El modo de comparación marca regresiones respecto a un resultado base.
+
+Uso:
+    python benchmark_simulador.py --output resultados.json
+    python benchmark_simulador.py --quick --compare base.json --tolerance 0.25
+    python benchmark_simulador.py --max-bytes-per-node 2000 --max-bytes-per-edge 200
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from proyecto import LanSimulator
+
+DEFAULT_NODES = (100, 500, 2000)
+DEFAULT_DENSITIES = (0.005, 0.02)
+DEFAULT_EMERGENCIES = (200, 1000)
+QUICK_NODES = (50, 200)
+QUICK_DENSITIES = (0.02,)
+QUICK_EMERGENCIES = (100,)
+ROUTE_QUERIES = 200
+
+# Métricas donde un valor mayor es mejor (el resto: menor es mejor)
+HIGHER_IS_BETTER = {"dispatch_per_s", "dispatched"}
+# Parámetros que identifican un caso (o lo describen): no se comparan como métricas
+CASE_KEYS = {"nodes", "density", "emergencies", "seed", "edges"}
+UNIT_NAMES = {"node": "nodo", "edge": "conexión", "emergency": "emergencia"}
+
+
+@contextlib.contextmanager
+def _quiet():
+    """Oculta los mensajes que imprime el simulador durante las mediciones"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        yield
+
+
+def _timed(function, *args, **kwargs):
+    """Ejecuta una función y devuelve (resultado, segundos)"""
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def _build(num_nodes, density, seed):
+    random.seed(seed)
+    simulator = LanSimulator()
+    with _quiet():
+        simulator.generate_random_topology(num_nodes, density)
+    return simulator
+
+
+def run_case(num_nodes, density, num_emergencies, seed=42):
+    """
+    Ejecuta un caso del benchmark
+
+    Args:
+        num_nodes (int): Número de nodos de la topología
+        density (float): Densidad de conexiones (0-1)
+        num_emergencies (int): Emergencias a generar y despachar
+        seed (int): Semilla para que el caso sea reproducible
+
+    Returns:
+        dict: Métricas del caso
+    """
+    result = {"nodes": num_nodes, "density": density, "emergencies": num_emergencies, "seed": seed}
+
+    # Generación (tiempo) y memoria de la topología (en una segunda corrida, con tracemalloc)
+    simulator, result["generate_s"] = _timed(_build, num_nodes, density, seed)
+    num_edges = sum(len(conns) for conns in simulator.connections.values()) // 2
+    result["edges"] = num_edges
+    tracemalloc.start()
+    measured = _build(num_nodes, density, seed)
+    result["topology_bytes"], result["peak_bytes"] = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del measured
+    result["bytes_per_node"] = result["topology_bytes"] / num_nodes
+    result["bytes_per_edge"] = result["topology_bytes"] / max(num_edges, 1)
+
+    # Carga desde JSON y desde el formato binario
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        json_file = os.path.join(tmp_dir, "topologia.json")
+        binary_file = os.path.join(tmp_dir, "topologia.lantopo")
+        state = simulator.snapshot_state()
+        with open(json_file, "w") as file:
+            json.dump({"nodes": state["nodes"], "connections": state["connections"]}, file)
+        simulator.export_topology_binary(binary_file)
+        _, result["load_json_s"] = _timed(LanSimulator().load_topology_streaming, json_file)
+        _, result["load_binary_s"] = _timed(LanSimulator().load_topology_binary, binary_file)
+
+    # Enrutamiento entre pares aleatorios fijos
+    rng = random.Random(seed)
+    node_ids = list(simulator.nodes)
+    pairs = [(rng.choice(node_ids), rng.choice(node_ids)) for _ in range(ROUTE_QUERIES)]
+    start = time.perf_counter()
+    for source, target in pairs:
+        simulator.find_shortest_path(source, target)
+    result["route_us"] = (time.perf_counter() - start) / ROUTE_QUERIES * 1e6
+
+    # Despacho de emergencias
+    random.seed(seed + 1)
+    for _ in range(num_emergencies):
+        simulator.generate_random_emergency()
+    dispatched = 0
+    start = time.perf_counter()
+    for _ in range(num_emergencies):
+        emergency, _, _ = simulator.process_next_emergency()
+        if emergency is not None:
+            dispatched += 1
+    elapsed = time.perf_counter() - start
+    result["dispatched"] = dispatched
+    result["dispatch_per_s"] = num_emergencies / elapsed if elapsed else 0.0
+
+    # Memoria por estructura al final de la simulación
+    report = simulator.memory_report()
+    result["structure_bytes"] = report["structures"]
+    result["mem_bytes_per_node"] = float(report["bytes_per_node"])
+    result["mem_bytes_per_edge"] = float(report["bytes_per_edge"])
+    result["mem_bytes_per_emergency"] = float(report["bytes_per_emergency"])
+    return result
+
+
+def check_budgets(report, budgets):
+    """
+    Verifica los presupuestos de memoria de cada caso
+
+    Args:
+        report (dict): Resultado de run_suite
+        budgets (dict): {"node": bytes, "edge": bytes, "emergency": bytes} (None = sin límite)
+
+    Returns:
+        list: Descripciones de los presupuestos excedidos
+    """
+    violations = []
+    for case in report["results"]:
+        for unit, limit in budgets.items():
+            value = case[f"mem_bytes_per_{unit}"]
+            if limit is not None and value > limit:
+                violations.append(
+                    f"n={case['nodes']} d={case['density']} e={case['emergencies']}: "
+                    f"{value:.0f} bytes por {UNIT_NAMES[unit]} > {limit}")
+    return violations
+
+
+def run_suite(nodes, densities, emergencies, seed=42, verbose=True):
+    """
+    Ejecuta todas las combinaciones de parámetros
+
+    Returns:
+        dict: {"environment": {...}, "results": [métricas por caso]}
+    """
+    results = []
+    for num_nodes in nodes:
+        for density in densities:
+            for num_emergencies in emergencies:
+                case = run_case(num_nodes, density, num_emergencies, seed)
+                results.append(case)
+                if verbose:
+                    print(f"n={num_nodes:<6} d={density:<6} e={num_emergencies:<6} "
+                          f"aristas={case['edges']:<7} gen={case['generate_s']:.3f}s "
+                          f"json={case['load_json_s']:.3f}s bin={case['load_binary_s']:.3f}s "
+                          f"ruta={case['route_us']:.1f}us despacho={case['dispatch_per_s']:.0f}/s "
+                          f"mem={case['mem_bytes_per_node']:.0f}B/nodo "
+                          f"{case['mem_bytes_per_edge']:.0f}B/conexión "
+                          f"{case['mem_bytes_per_emergency']:.0f}B/emergencia")
+    return {
+        "environment": {
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "timestamp": time.time(),
+        },
+        "results": results,
+    }
+
+
+def _case_key(case):
+    return case["nodes"], case["density"], case["emergencies"], case["seed"]
+
+
+def compare(current, baseline, tolerance=0.2):
+    """
+    Compara resultados contra una base y lista las regresiones
+
+    Args:
+        current (dict): Resultado de run_suite
+        baseline (dict): Resultado base cargado desde JSON
+        tolerance (float): Empeoramiento relativo permitido (0.2 = 20%)
+
+    Returns:
+        list: Descripciones de las regresiones encontradas
+    """
+    base_cases = {_case_key(case): case for case in baseline["results"]}
+    regressions = []
+    for case in current["results"]:
+        base = base_cases.get(_case_key(case))
+        if base is None:
+            continue
+        for metric, value in case.items():
+            base_value = base.get(metric)
+            if (metric in CASE_KEYS or isinstance(value, bool)
+                    or not isinstance(value, (int, float)) or not base_value):
+                continue
+            if metric in HIGHER_IS_BETTER:
+                worse = value < base_value / (1 + tolerance)
+            else:
+                worse = value > base_value * (1 + tolerance)
+            if worse:
+                regressions.append(
+                    f"n={case['nodes']} d={case['density']} e={case['emergencies']}: "
+                    f"{metric} {base_value:.4g} -> {value:.4g}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks de escalabilidad del simulador LAN")
+    parser.add_argument("--nodes", type=int, nargs="+", help="Números de nodos a probar")
+    parser.add_argument("--densities", type=float, nargs="+", help="Densidades de conexión")
+    parser.add_argument("--emergencies", type=int, nargs="+", help="Números de emergencias")
+    parser.add_argument("--seed", type=int, default=42, help="Semilla base")
+    parser.add_argument("--quick", action="store_true", help="Usar un barrido pequeño")
+    parser.add_argument("--output", help="Archivo JSON donde guardar los resultados")
+    parser.add_argument("--compare", help="Archivo JSON base para detectar regresiones")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Tolerancia relativa (0.2 = 20%%)")
+    parser.add_argument("--max-bytes-per-node", type=float, help="Presupuesto de memoria por nodo")
+    parser.add_argument("--max-bytes-per-edge", type=float, help="Presupuesto de memoria por conexión")
+    parser.add_argument("--max-bytes-per-emergency", type=float, help="Presupuesto de memoria por emergencia")
+    args = parser.parse_args(argv)
+
+    nodes = args.nodes or (QUICK_NODES if args.quick else DEFAULT_NODES)
+    densities = args.densities or (QUICK_DENSITIES if args.quick else DEFAULT_DENSITIES)
+    emergencies = args.emergencies or (QUICK_EMERGENCIES if args.quick else DEFAULT_EMERGENCIES)
+
+    report = run_suite(nodes, densities, emergencies, args.seed)
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+        print(f"Resultados guardados en {args.output}")
+
+    exit_code = 0
+    violations = check_budgets(report, {"node": args.max_bytes_per_node,
+                                        "edge": args.max_bytes_per_edge,
+                                        "emergency": args.max_bytes_per_emergency})
+    if violations:
+        print(f"\n{len(violations)} presupuestos de memoria excedidos:")
+        for line in violations:
+            print(f"  - {line}")
+        exit_code = 1
+
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+        regressions = compare(report, baseline, args.tolerance)
+        if regressions:
+            print(f"\n{len(regressions)} regresiones respecto a {args.compare}:")
+            for line in regressions:
+                print(f"  - {line}")
+            return 1
+        print(f"\nSin regresiones respecto a {args.compare}")
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,75 @@
+"""
+Algoritmos de búsqueda en listas ordenadas
+
+busqueda_lineal y busqueda_binaria son las funciones de 12Notacion.py tal
+como están (busquda_lineal allí): ese script mide al importarse, así que solo
+se compilan sus definiciones con cargar_definiciones de benchmark_colas.py.
+Se agregan:
+
+- busqueda_interpolacion: estima la posición por la proporción del valor
+  entre los extremos; O(log log n) en promedio con datos uniformes, O(n) en
+  el peor caso.
+- busqueda_exponencial: duplica un límite hasta pasar el objetivo y luego
+  hace búsqueda binaria; O(log i) si el objetivo está en la posición i.
+- busqueda_bisect: la búsqueda binaria del módulo bisect (en C).
+
+Todas devuelven el índice del objetivo o -1 si no está.
+"""
+
+import os
+from bisect import bisect_left
+
+from benchmark_colas import cargar_definiciones
+
+ARCHIVO_NOTACION = os.path.join(os.path.dirname(os.path.abspath(__file__)), "12Notacion.py")
+
+_notacion = cargar_definiciones(ARCHIVO_NOTACION, ("busquda_lineal", "busqueda_binaria"))
+busqueda_lineal = _notacion["busquda_lineal"]
+busqueda_binaria = _notacion["busqueda_binaria"]
+
+
+def busqueda_interpolacion(arr, objetivo):
+    """Solo para valores numéricos"""
+    inicio, fin = 0, len(arr) - 1
+    while inicio <= fin and arr[inicio] <= objetivo <= arr[fin]:
+        if arr[fin] == arr[inicio]:
+            return inicio if arr[inicio] == objetivo else -1
+        pos = inicio + int((objetivo - arr[inicio]) * (fin - inicio) / (arr[fin] - arr[inicio]))
+        if arr[pos] == objetivo:
+            return pos
+        elif arr[pos] < objetivo:
+            inicio = pos + 1
+        else:
+            fin = pos - 1
+    return -1
+
+
+def busqueda_exponencial(arr, objetivo):
+    n = len(arr)
+    if not n:
+        return -1
+    limite = 1
+    while limite < n and arr[limite] < objetivo:
+        limite *= 2
+    inicio, fin = limite // 2, min(limite, n - 1)
+    while inicio <= fin:
+        medio = (inicio + fin) // 2
+        if arr[medio] == objetivo:
+            return medio
+        elif arr[medio] < objetivo:
+            inicio = medio + 1
+        else:
+            fin = medio - 1
+    return -1
+
+
+def busqueda_bisect(arr, objetivo):
+    i = bisect_left(arr, objetivo)
+    return i if i < len(arr) and arr[i] == objetivo else -1
+
+
+if __name__ == "__main__":
+    datos = [3, 8, 15, 21, 42, 56, 77, 91]
+    for buscar in (busqueda_lineal, busqueda_binaria, busqueda_interpolacion,
+                   busqueda_exponencial, busqueda_bisect):
+        print(f"{buscar.__name__}: 42 en la posición {buscar(datos, 42)}, 50 -> {buscar(datos, 50)}")
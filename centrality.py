@@ -0,0 +1,152 @@
+"""
+Centralidad de intermediación (betweenness) del Simulador de Red LAN
+Proyecto Final - Redes Computacionales y Análisis de Algoritmos
+
+Algoritmo de Brandes con pesos (un Dijkstra por nodo fuente y acumulación de
+dependencias en orden inverso) sobre los nodos activos. Las fuentes se
+reparten entre los procesos de un multiprocessing.Pool y las puntuaciones
+parciales se suman al final. Para redes muy grandes se puede usar un modo
+aproximado que solo recorre una muestra de fuentes y escala el resultado.
+
+Costo exacto: O(V * (E + V log V)); con una muestra de k fuentes, O(k * (E + V log V)).
+"""
+
+import heapq
+import multiprocessing
+import os
+import random
+from math import inf
+
+# Con menos fuentes que esto no vale la pena crear procesos
+MIN_PARALLEL_SOURCES = 64
+
+_graph = None  # Adyacencia compartida por los procesos del pool (ver _init_worker)
+
+
+def graph_arrays(simulator):
+    """
+    Copia compacta (por índices) de la red activa, que se puede enviar a otros procesos
+
+    Returns:
+        tuple: (ids de nodo, adyacencia: lista de listas de (índice, peso))
+    """
+    node_ids = [node_id for node_id, node in simulator.nodes.items() if node.active]
+    index = {node_id: i for i, node_id in enumerate(node_ids)}
+    adjacency = [
+        [(index[neighbor], weight) for neighbor, weight in simulator.connections[node_id].items()
+         if neighbor in index and neighbor != node_id]
+        for node_id in node_ids
+    ]
+    return node_ids, adjacency
+
+
+def _accumulate(adjacency, source, scores):
+    """Suma a scores las dependencias de una fuente (un paso del algoritmo de Brandes)"""
+    n = len(adjacency)
+    best = [inf] * n
+    sigma = [0] * n           # Número de caminos más cortos desde la fuente
+    preds = [None] * n        # Predecesores en los caminos más cortos
+    done = [False] * n
+    order = []                # Nodos en orden de distancia no decreciente
+    best[source] = 0
+    sigma[source] = 1
+    preds[source] = []
+    heap = [(0, source)]
+    while heap:
+        distance, v = heapq.heappop(heap)
+        if done[v] or distance > best[v]:
+            continue
+        done[v] = True
+        order.append(v)
+        paths = sigma[v]
+        for w, weight in adjacency[v]:
+            candidate = distance + weight
+            if candidate < best[w]:
+                best[w] = candidate
+                sigma[w] = paths
+                preds[w] = [v]
+                heapq.heappush(heap, (candidate, w))
+            elif candidate == best[w] and not done[w]:
+                sigma[w] += paths
+                preds[w].append(v)
+
+    delta = [0.0] * n
+    for w in reversed(order):
+        coefficient = (1 + delta[w]) / sigma[w]
+        for v in preds[w]:
+            delta[v] += sigma[v] * coefficient
+        if w != source:
+            scores[w] += delta[w]
+
+
+def _partial_scores(sources, adjacency=None):
+    """Puntuaciones parciales de un grupo de fuentes"""
+    if adjacency is None:
+        adjacency = _graph
+    scores = [0.0] * len(adjacency)
+    for source in sources:
+        _accumulate(adjacency, source, scores)
+    return scores
+
+
+def _init_worker(adjacency):
+    global _graph
+    _graph = adjacency
+
+
+def betweenness_centrality(simulator, processes=None, sample=None, seed=None, normalized=True):
+    """
+    Centralidad de intermediación de los nodos activos
+
+    Args:
+        simulator (LanSimulator): Simulador a analizar
+        processes (int): Procesos del pool (None = núcleos disponibles, 1 = sin pool)
+        sample (int): Fuentes a muestrear para el modo aproximado (None = todas)
+        seed (int): Semilla de la muestra, para resultados reproducibles
+        normalized (bool): Dividir entre el número de pares posibles
+
+    Returns:
+        dict: {node_id: puntuación} (los nodos inactivos no aparecen)
+    """
+    node_ids, adjacency = graph_arrays(simulator)
+    n = len(node_ids)
+    sources = list(range(n))
+    if sample is not None and sample < n:
+        sources = random.Random(seed).sample(sources, sample)
+
+    if processes is None:
+        processes = os.cpu_count() or 1
+    processes = min(processes, max(1, len(sources) // MIN_PARALLEL_SOURCES))
+    if processes <= 1:
+        scores = _partial_scores(sources, adjacency)
+    else:
+        chunk = -(-len(sources) // (processes * 4))
+        groups = [sources[i:i + chunk] for i in range(0, len(sources), chunk)]
+        with multiprocessing.Pool(processes, initializer=_init_worker, initargs=(adjacency,)) as pool:
+            scores = [0.0] * n
+            for partial in pool.imap_unordered(_partial_scores, groups):
+                for i, value in enumerate(partial):
+                    scores[i] += value
+
+    # Grafo no dirigido: cada par se contó en ambos sentidos
+    if normalized:
+        scale = 1 / ((n - 1) * (n - 2)) if n > 2 else 1.0
+    else:
+        scale = 0.5
+    if sources and len(sources) < n:
+        scale *= n / len(sources)
+    return {node_id: scores[i] * scale for i, node_id in enumerate(node_ids)}
+
+
+def rank_nodes(simulator, scores, node_types=("ROUTER", "CENTRAL"), top=10):
+    """
+    Nodos de los tipos indicados con mayor centralidad
+
+    Returns:
+        list: Tuplas (node_id, puntuación), de mayor a menor
+    """
+    nodes = simulator.nodes
+    candidates = [(node_id, score) for node_id, score in scores.items()
+                  if node_types is None or nodes[node_id].node_type in node_types]
+    candidates.sort(key=lambda item: (-item[1], item[0]))
+    return candidates[:top]
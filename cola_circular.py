@@ -0,0 +1,144 @@
+"""
+Cola con arreglo circular (buffer en anillo)
+
+Misma interfaz que ColaVector (16ejercicioscola.py), pero desencolar no mueve
+los elementos: se avanza el índice del frente. Encolar y desencolar son O(1)
+amortizado; el arreglo duplica su capacidad cuando se llena y la reduce a la
+mitad cuando queda ocupado menos de un cuarto. La capacidad siempre es una
+potencia de 2, así que el índice circular se calcula con una máscara.
+"""
+
+CAPACIDAD_INICIAL = 8
+VACIA = "La cola esta vacía"  # Lo que devuelve ColaVector.desencolar con la cola vacía
+
+
+class ColaCircular:
+    __slots__ = ("datos", "frente", "cantidad")
+
+    def __init__(self, datos=()):
+        self.datos = [None] * CAPACIDAD_INICIAL
+        self.frente = 0  # Índice del primer elemento
+        self.cantidad = 0
+        self.encolar_muchos(datos)
+
+    def _redimensionar(self, capacidad):
+        """Copia los elementos, en orden, a un arreglo nuevo que empieza en el índice 0"""
+        nuevos = self._en_orden()
+        nuevos.extend([None] * (capacidad - self.cantidad))
+        self.datos = nuevos
+        self.frente = 0
+
+    def _en_orden(self):
+        """Copia de los elementos del frente al final"""
+        fin = self.frente + self.cantidad
+        capacidad = len(self.datos)
+        if fin <= capacidad:
+            return self.datos[self.frente:fin]
+        return self.datos[self.frente:] + self.datos[:fin - capacidad]
+
+    def encolar(self, dato):
+        datos = self.datos
+        cantidad = self.cantidad
+        if cantidad == len(datos):
+            self._redimensionar(2 * cantidad)
+            datos = self.datos
+        datos[(self.frente + cantidad) & (len(datos) - 1)] = dato
+        self.cantidad = cantidad + 1
+
+    def desencolar(self):
+        cantidad = self.cantidad
+        if not cantidad:
+            return VACIA
+        datos = self.datos
+        frente = self.frente
+        dato = datos[frente]
+        datos[frente] = None  # No retener la referencia
+        self.frente = (frente + 1) & (len(datos) - 1)
+        self.cantidad = cantidad - 1
+        if cantidad <= len(datos) >> 2 and len(datos) > CAPACIDAD_INICIAL:
+            self._reducir()
+        return dato
+
+    def _reducir(self):
+        capacidad = len(self.datos)
+        if capacidad > CAPACIDAD_INICIAL and self.cantidad < capacidad // 4:
+            self._redimensionar(capacidad // 2)
+
+    def encolar_muchos(self, datos):
+        """Encola todos los elementos de un iterable (a lo sumo dos copias por bloques)"""
+        datos = list(datos)
+        n = len(datos)
+        if not n:
+            return
+        capacidad = len(self.datos)
+        if self.cantidad + n > capacidad:
+            while capacidad < self.cantidad + n:
+                capacidad *= 2
+            self._redimensionar(capacidad)
+        inicio = (self.frente + self.cantidad) & (capacidad - 1)
+        primero = min(n, capacidad - inicio)
+        self.datos[inicio:inicio + primero] = datos[:primero]
+        if primero < n:
+            self.datos[:n - primero] = datos[primero:]
+        self.cantidad += n
+
+    def desencolar_muchos(self, n=None):
+        """
+        Desencola hasta n elementos (todos si n es None)
+
+        Returns:
+            list: Elementos desencolados, del frente al final
+        """
+        if n is None or n > self.cantidad:
+            n = self.cantidad
+        if n <= 0:
+            return []
+        capacidad = len(self.datos)
+        primero = min(n, capacidad - self.frente)
+        fin = self.frente + primero
+        resultado = self.datos[self.frente:fin]
+        self.datos[self.frente:fin] = [None] * primero
+        if primero < n:
+            resultado.extend(self.datos[:n - primero])
+            self.datos[:n - primero] = [None] * (n - primero)
+        self.frente = (self.frente + n) & (capacidad - 1)
+        self.cantidad -= n
+        self._reducir()
+        return resultado
+
+    def frente_cola(self):
+        """Primer elemento sin desencolarlo (None si está vacía)"""
+        return self.datos[self.frente] if self.cantidad else None
+
+    def es_vacio(self):
+        return self.cantidad == 0
+
+    def tamaño(self):
+        return self.cantidad
+
+    def __len__(self):
+        return self.cantidad
+
+    def __iter__(self):
+        """Recorre del frente al final sin copiar el arreglo"""
+        datos = self.datos
+        mascara = len(datos) - 1
+        frente = self.frente
+        for i in range(self.cantidad):
+            yield datos[(frente + i) & mascara]
+
+    def __repr__(self):
+        return f"ColaCircular({self._en_orden()!r})"
+
+
+if __name__ == "__main__":
+    cola = ColaCircular()
+    cola.encolar(1)
+    cola.encolar(2)
+    cola.encolar(3)
+    print(cola.desencolar())
+    print(cola.desencolar())
+    print(f"Tamaño actual: {cola.tamaño()}")
+    cola.encolar_muchos(range(4, 10))
+    print(list(cola))
+    print(cola.desencolar_muchos(4))
@@ -0,0 +1,238 @@
+"""
+Cola enlazada acotada para varios productores y consumidores
+
+Usa la misma estructura de nodos que Cola (16ejercicioscola.py), pero con
+nodos de __slots__ que se reciclan en una lista libre para no crear y
+destruir un objeto por cada elemento. Las operaciones bloqueantes esperan,
+con tiempo límite opcional, a que haya espacio o datos; las variantes
+encolar_async/desencolar_async hacen lo mismo con await, y ambas se pueden
+mezclar (por ejemplo, productores en hilos y consumidores en asyncio).
+
+Como en queue.Queue, al vencer el tiempo límite se lanza queue.Full o
+queue.Empty.
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from queue import Empty, Full
+
+
+class Nodo:
+    __slots__ = ("dato", "siguiente")
+
+    def __init__(self, dato):
+        self.dato = dato
+        self.siguiente = None
+
+
+class ColaAcotada:
+    def __init__(self, capacidad):
+        """
+        Args:
+            capacidad (int): Máximo de elementos en la cola
+        """
+        if capacidad <= 0:
+            raise ValueError("La capacidad debe ser positiva")
+        self.capacidad = capacidad
+        self.frente = None
+        self.final = None
+        self.cantidad = 0
+        self._libres = None  # Lista libre de nodos (enlazada por siguiente)
+        self._candado = threading.Lock()
+        self._no_vacia = threading.Condition(self._candado)
+        self._no_llena = threading.Condition(self._candado)
+        self._hilos_esperan_datos = 0    # Hilos bloqueados (para no notificar en vano)
+        self._hilos_esperan_espacio = 0
+        self._esperan_datos = deque()    # Futuros de corrutinas esperando un elemento
+        self._esperan_espacio = deque()  # Futuros de corrutinas esperando espacio
+
+    # ---- Estructura (siempre con el candado tomado) ---------------------------
+
+    def _agregar(self, dato):
+        nodo = self._libres
+        if nodo is None:
+            nodo = Nodo(dato)
+        else:
+            self._libres = nodo.siguiente
+            nodo.dato = dato
+            nodo.siguiente = None
+        if self.final is None:
+            self.frente = self.final = nodo
+        else:
+            self.final.siguiente = nodo
+            self.final = nodo
+        self.cantidad += 1
+        if self._hilos_esperan_datos:
+            self._no_vacia.notify()
+        if self._esperan_datos:
+            _despertar(self._esperan_datos)
+
+    def _sacar(self):
+        nodo = self.frente
+        dato = nodo.dato
+        self.frente = nodo.siguiente
+        if self.frente is None:
+            self.final = None
+        nodo.dato = None
+        nodo.siguiente = self._libres
+        self._libres = nodo
+        self.cantidad -= 1
+        if self._hilos_esperan_espacio:
+            self._no_llena.notify()
+        if self._esperan_espacio:
+            _despertar(self._esperan_espacio)
+        return dato
+
+    # ---- Hilos -----------------------------------------------------------------
+
+    def encolar(self, dato, bloquear=True, timeout=None):
+        """
+        Encola un elemento, esperando si la cola está llena
+
+        Args:
+            bloquear (bool): Si es False y no hay espacio, lanza queue.Full de inmediato
+            timeout (float): Segundos máximos de espera (None = sin límite)
+        """
+        with self._no_llena:
+            if self.cantidad >= self.capacidad:
+                if not bloquear:
+                    raise Full
+                self._hilos_esperan_espacio += 1
+                try:
+                    if timeout is None:
+                        while self.cantidad >= self.capacidad:
+                            self._no_llena.wait()
+                    elif not self._no_llena.wait_for(lambda: self.cantidad < self.capacidad, timeout):
+                        raise Full
+                finally:
+                    self._hilos_esperan_espacio -= 1
+            self._agregar(dato)
+
+    def desencolar(self, bloquear=True, timeout=None):
+        """
+        Desencola un elemento, esperando si la cola está vacía
+
+        Args:
+            bloquear (bool): Si es False y no hay datos, lanza queue.Empty de inmediato
+            timeout (float): Segundos máximos de espera (None = sin límite)
+        """
+        with self._no_vacia:
+            if not self.cantidad:
+                if not bloquear:
+                    raise Empty
+                self._hilos_esperan_datos += 1
+                try:
+                    if timeout is None:
+                        while not self.cantidad:
+                            self._no_vacia.wait()
+                    elif not self._no_vacia.wait_for(lambda: self.cantidad, timeout):
+                        raise Empty
+                finally:
+                    self._hilos_esperan_datos -= 1
+            return self._sacar()
+
+    # ---- asyncio -------------------------------------------------------------------
+
+    async def encolar_async(self, dato, timeout=None):
+        """Como encolar, pero esperando con await (lanza queue.Full al vencer el tiempo)"""
+        limite = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._candado:
+                if self.cantidad < self.capacidad:
+                    self._agregar(dato)
+                    return
+                futuro = _registrar(self._esperan_espacio)
+            await _esperar(futuro, limite, self._candado, self._esperan_espacio, Full)
+
+    async def desencolar_async(self, timeout=None):
+        """Como desencolar, pero esperando con await (lanza queue.Empty al vencer el tiempo)"""
+        limite = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._candado:
+                if self.cantidad:
+                    return self._sacar()
+                futuro = _registrar(self._esperan_datos)
+            await _esperar(futuro, limite, self._candado, self._esperan_datos, Empty)
+
+    # ---- Consultas -------------------------------------------------------------------
+
+    def esta_vacia(self):
+        return self.cantidad == 0
+
+    def esta_llena(self):
+        return self.cantidad >= self.capacidad
+
+    def tamaño(self):
+        return self.cantidad
+
+    def __len__(self):
+        return self.cantidad
+
+
+def _registrar(esperando):
+    """Anota la corrutina actual como esperando (con el candado tomado)"""
+    loop = asyncio.get_running_loop()
+    futuro = loop.create_future()
+    esperando.append((loop, threading.get_ident(), futuro))
+    return futuro
+
+
+def _despertar(esperando):
+    """Despierta a la primera corrutina que sigue esperando (con el candado tomado)"""
+    while esperando:
+        loop, hilo, futuro = esperando.popleft()
+        if not futuro.done():
+            if hilo == threading.get_ident():
+                futuro.set_result(None)  # Mismo hilo que su event loop: sin despertar al selector
+            else:
+                loop.call_soon_threadsafe(_resolver, futuro)
+            return
+
+
+def _resolver(futuro):
+    if not futuro.done():
+        futuro.set_result(None)
+
+
+async def _esperar(futuro, limite, candado, esperando, error):
+    """Espera un aviso; si vence el tiempo se retira de la fila y pasa el aviso si ya lo recibió"""
+    restante = None if limite is None else limite - time.monotonic()
+    if restante is not None and restante <= 0:
+        _retirar(futuro, candado, esperando)
+        raise error
+    try:
+        await asyncio.wait_for(futuro, restante)
+    except asyncio.TimeoutError:
+        _retirar(futuro, candado, esperando)
+        raise error from None
+    except asyncio.CancelledError:
+        _retirar(futuro, candado, esperando)
+        raise
+
+
+def _retirar(futuro, candado, esperando):
+    with candado:
+        for i, (_, _, otro) in enumerate(esperando):
+            if otro is futuro:
+                del esperando[i]
+                return
+        # Ya no estaba en la fila: recibió un aviso que no usará, se lo pasa a otra
+        _despertar(esperando)
+
+
+if __name__ == "__main__":
+    cola = ColaAcotada(2)
+    cola.encolar(10)
+    cola.encolar(20)
+    try:
+        cola.encolar(30, timeout=0.1)
+    except Full:
+        print("La cola esta llena")
+    print(cola.desencolar())
+    print(cola.desencolar())
+    try:
+        cola.desencolar(bloquear=False)
+    except Empty:
+        print("La cola esta vacia")
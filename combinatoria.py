@@ -0,0 +1,219 @@
+"""
+Generadores de permutaciones y combinaciones
+
+Reemplaza los tres ciclos anidados de "Generacion de combinaciones"
+(13Fuerzabruta.py), que solo sirven para 3 elementos y descartan 21 de las
+27 ternas. Todo se genera de a uno (tuplas), sin armar la lista completa:
+
+- permutaciones_heap: algoritmo de Heap, cada permutación difiere de la
+  anterior en un intercambio.
+- permutaciones_lexicograficas: orden lexicográfico con siguiente_permutacion;
+  con elementos repetidos genera cada permutación distinta una sola vez.
+- combinaciones y combinaciones_con_repeticion de k elementos.
+- posicion_* / *_en_posicion: rank y unrank (código de Lehmer para
+  permutaciones, sistema combinatorio para combinaciones). Con ellas
+  bloque_permutaciones y bloque_combinaciones recorren solo un tramo, para
+  repartir el trabajo entre procesos.
+
+permutaciones_lexicograficas ordena por valor; las demás funciones toman como
+orden base el de la secuencia recibida (si viene ordenada, es el mismo).
+"""
+
+from math import comb, factorial
+
+
+def permutaciones_heap(elementos):
+    """Genera las n! permutaciones con el algoritmo de Heap (versión iterativa)"""
+    a = list(elementos)
+    n = len(a)
+    contadores = [0] * n
+    yield tuple(a)
+    i = 1
+    while i < n:
+        if contadores[i] < i:
+            j = contadores[i] if i % 2 else 0
+            a[i], a[j] = a[j], a[i]
+            yield tuple(a)
+            contadores[i] += 1
+            i = 1
+        else:
+            contadores[i] = 0
+            i += 1
+
+
+def siguiente_permutacion(a):
+    """
+    Avanza la lista a la siguiente permutación en orden lexicográfico (en el lugar)
+
+    Returns:
+        bool: False si ya era la última (y la deja en la primera)
+    """
+    i = len(a) - 2
+    while i >= 0 and not a[i] < a[i + 1]:
+        i -= 1
+    if i < 0:
+        a.reverse()
+        return False
+    j = len(a) - 1
+    while not a[i] < a[j]:
+        j -= 1
+    a[i], a[j] = a[j], a[i]
+    a[i + 1:] = reversed(a[i + 1:])
+    return True
+
+
+def permutaciones_lexicograficas(elementos):
+    """Genera las permutaciones distintas de los elementos en orden lexicográfico"""
+    a = sorted(elementos)
+    yield tuple(a)
+    while siguiente_permutacion(a):
+        yield tuple(a)
+
+
+def combinaciones(elementos, k):
+    """Genera los subconjuntos de k elementos (sin repetición), en orden lexicográfico"""
+    elementos = list(elementos)
+    n = len(elementos)
+    if not 0 <= k <= n:
+        return
+    indices = list(range(k))
+    yield tuple(elementos[i] for i in indices)
+    while True:
+        i = k - 1
+        while i >= 0 and indices[i] == n - k + i:
+            i -= 1
+        if i < 0:
+            return
+        indices[i] += 1
+        for j in range(i + 1, k):
+            indices[j] = indices[j - 1] + 1
+        yield tuple(elementos[i] for i in indices)
+
+
+def combinaciones_con_repeticion(elementos, k):
+    """Genera las combinaciones de k elementos pudiendo repetir, en orden lexicográfico"""
+    elementos = list(elementos)
+    n = len(elementos)
+    if not n and k:
+        return
+    indices = [0] * k
+    yield tuple(elementos[i] for i in indices)
+    while True:
+        i = k - 1
+        while i >= 0 and indices[i] == n - 1:
+            i -= 1
+        if i < 0:
+            return
+        indices[i:] = [indices[i] + 1] * (k - i)
+        yield tuple(elementos[i] for i in indices)
+
+
+# ---- Rank y unrank ---------------------------------------------------------------
+
+
+def posicion_permutacion(permutacion, elementos):
+    """
+    Rank: posición (desde 0) de una permutación en el orden lexicográfico de elementos
+
+    Args:
+        permutacion (sequence): Reordenamiento de elementos (sin repetidos)
+        elementos (sequence): Elementos en el orden base
+    """
+    indice = {elemento: i for i, elemento in enumerate(elementos)}
+    usados = sorted(indice.get(x, -1) for x in permutacion)
+    if len(indice) != len(elementos) or usados != list(range(len(elementos))):
+        raise ValueError("La permutación debe usar cada elemento una vez")
+    restantes = list(range(len(elementos)))
+    posicion = 0
+    for elemento in permutacion:
+        j = restantes.index(indice[elemento])  # Cuántos restantes son menores (código de Lehmer)
+        posicion += j * factorial(len(restantes) - 1)
+        del restantes[j]
+    return posicion
+
+
+def permutacion_en_posicion(elementos, posicion):
+    """Unrank: la permutación de elementos que está en esa posición del orden lexicográfico"""
+    restantes = list(elementos)
+    if not 0 <= posicion < factorial(len(restantes)):
+        raise IndexError("Posición fuera del rango de permutaciones")
+    resultado = []
+    for i in range(len(restantes), 0, -1):
+        j, posicion = divmod(posicion, factorial(i - 1))
+        resultado.append(restantes.pop(j))
+    return tuple(resultado)
+
+
+def bloque_permutaciones(elementos, inicio, cantidad):
+    """Genera cantidad permutaciones (o hasta la última) desde la posición inicio"""
+    indices = list(permutacion_en_posicion(range(len(elementos)), inicio))
+    for _ in range(cantidad):
+        yield tuple(elementos[i] for i in indices)
+        if not siguiente_permutacion(indices):
+            return
+
+
+def posicion_combinacion(combinacion, elementos):
+    """Rank: posición (desde 0) de una combinación sin repetición en el orden lexicográfico"""
+    indice = {elemento: i for i, elemento in enumerate(elementos)}
+    indices = [indice[x] for x in combinacion]
+    if any(not a < b for a, b in zip(indices, indices[1:])):
+        raise ValueError("La combinación debe seguir el orden de los elementos y no repetir")
+    n, k = len(elementos), len(indices)
+    posicion, anterior = 0, -1
+    for i, actual in enumerate(indices):
+        # Combinaciones que empiezan (en esta posición) con un índice menor que actual
+        for menor in range(anterior + 1, actual):
+            posicion += comb(n - menor - 1, k - i - 1)
+        anterior = actual
+    return posicion
+
+
+def combinacion_en_posicion(elementos, k, posicion):
+    """Unrank: la combinación de k elementos en esa posición del orden lexicográfico"""
+    n = len(elementos)
+    if not 0 <= posicion < comb(n, k):
+        raise IndexError("Posición fuera del rango de combinaciones")
+    resultado = []
+    candidato = 0
+    for i in range(k):
+        while True:
+            bloque = comb(n - candidato - 1, k - i - 1)
+            if posicion < bloque:
+                break
+            posicion -= bloque
+            candidato += 1
+        resultado.append(elementos[candidato])
+        candidato += 1
+    return tuple(resultado)
+
+
+def bloque_combinaciones(elementos, k, inicio, cantidad):
+    """Genera cantidad combinaciones de k (o hasta la última) desde la posición inicio"""
+    elementos = list(elementos)
+    n = len(elementos)
+    primera = combinacion_en_posicion(list(range(n)), k, inicio)
+    indices = list(primera)
+    for _ in range(cantidad):
+        yield tuple(elementos[i] for i in indices)
+        i = k - 1
+        while i >= 0 and indices[i] == n - k + i:
+            i -= 1
+        if i < 0:
+            return
+        indices[i] += 1
+        for j in range(i + 1, k):
+            indices[j] = indices[j - 1] + 1
+
+
+if __name__ == "__main__":
+    numeros = ["1", "2", "3"]
+    print(f"Las combinaciones de {', '.join(numeros)} son: ")
+    for permutacion in permutaciones_lexicograficas(numeros):
+        print(", ".join(permutacion))
+    print("Heap:", list(permutaciones_heap("abc")))
+    print("Combinaciones de 2 entre 4:", list(combinaciones("abcd", 2)))
+    print("Con repetición:", list(combinaciones_con_repeticion("ab", 3)))
+    letras = "abcdefghij"
+    print(f"Permutación 1000000 de {letras}:", "".join(permutacion_en_posicion(letras, 1000000)))
+    print("Tramo desde la 1000000:", ["".join(p) for p in bloque_permutaciones(letras, 1000000, 3)])
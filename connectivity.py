@@ -0,0 +1,293 @@
+"""
+Análisis de conectividad de la red del Simulador de Red LAN
+Proyecto Final - Redes Computacionales y Análisis de Algoritmos
+
+ConnectivityIndex precalcula, con el algoritmo de Tarjan (versión iterativa),
+los puntos de articulación, los puentes y las componentes biconexas de los
+nodos activos. Además guarda, para cada punto de articulación, los subárboles
+DFS que quedarían separados si ese nodo falla: como en preorden cada subárbol
+es un intervalo contiguo, "qué nodos quedan inalcanzables si falla X" se
+responde en O(k) con k = nodos afectados (O(1) si X no es de articulación).
+
+El índice se marca como desactualizado en cada cambio de topología y se
+recalcula (O(V + E)) la siguiente vez que se consulta.
+"""
+
+
+class ConnectivityIndex:
+    """Puntos de articulación, puentes y componentes biconexas de los nodos activos"""
+
+    def __init__(self, simulator):
+        """
+        Inicializa el índice (se calcula en la primera consulta)
+
+        Args:
+            simulator (LanSimulator): Simulador cuya red se analiza
+        """
+        self.simulator = simulator
+        self.dirty = True
+
+    def invalidate(self):
+        """Marca el índice como desactualizado (la topología cambió)"""
+        self.dirty = True
+
+    def _ensure(self):
+        if self.dirty:
+            self._build()
+            self.dirty = False
+
+    def _build(self):
+        """Tarjan iterativo sobre los nodos activos"""
+        nodes = self.simulator.nodes
+        connections = self.simulator.connections
+
+        preorder = {}          # nodo -> número en preorden
+        low = {}               # nodo -> menor preorden alcanzable
+        order = []             # nodos en preorden
+        subtree_end = {}       # nodo -> fin (exclusivo) de su subárbol en order
+        component_root = {}    # nodo -> raíz DFS de su componente
+        cut_children = {}      # punto de articulación -> [(inicio, fin)] subárboles separados
+        bridges = set()
+        blocks = []            # componentes biconexas (conjuntos de nodos)
+
+        for root, root_node in nodes.items():
+            if root in preorder or not root_node.active:
+                continue
+            preorder[root] = low[root] = len(order)
+            order.append(root)
+            component_root[root] = root
+            root_children = []
+            edge_stack = []
+            # Marco: (nodo, padre, iterador de vecinos); no hay aristas repetidas
+            stack = [(root, None, iter(connections[root]))]
+
+            while stack:
+                frame = stack[-1]
+                node, parent, neighbors = frame
+                advanced = False
+                for neighbor in neighbors:
+                    if not nodes[neighbor].active or neighbor == node or neighbor == parent:
+                        continue
+                    if neighbor not in preorder:
+                        preorder[neighbor] = low[neighbor] = len(order)
+                        order.append(neighbor)
+                        component_root[neighbor] = root
+                        edge_stack.append((node, neighbor))
+                        stack.append((neighbor, node, iter(connections[neighbor])))
+                        advanced = True
+                        break
+                    if preorder[neighbor] < preorder[node]:
+                        edge_stack.append((node, neighbor))  # Arista de retroceso
+                        if preorder[neighbor] < low[node]:
+                            low[node] = preorder[neighbor]
+                if advanced:
+                    continue
+
+                # Todos los vecinos de node fueron visitados
+                stack.pop()
+                subtree_end[node] = len(order)
+                if parent is None:
+                    continue
+                if low[node] < low[parent]:
+                    low[parent] = low[node]
+                if low[node] > preorder[parent]:
+                    bridges.add(frozenset((parent, node)))
+                if low[node] >= preorder[parent]:
+                    # parent separa al subárbol de node: cerrar una componente biconexa
+                    block = set()
+                    while edge_stack:
+                        u, v = edge_stack.pop()
+                        block.add(u)
+                        block.add(v)
+                        if (u, v) == (parent, node):
+                            break
+                    blocks.append(block)
+                    if parent == root:
+                        root_children.append((preorder[node], subtree_end[node]))
+                    else:
+                        cut_children.setdefault(parent, []).append((preorder[node], subtree_end[node]))
+
+            if len(root_children) >= 2:
+                cut_children[root] = root_children
+            elif len(preorder) - preorder[root] == 1:
+                blocks.append({root})  # Nodo aislado
+
+        self.preorder = preorder
+        self.order = order
+        self.subtree_end = subtree_end
+        self.component_root = component_root
+        self.cut_children = cut_children
+        self.bridges = bridges
+        self.blocks = blocks
+
+    # ---- Consultas ------------------------------------------------------------
+
+    def articulation_points(self):
+        """Nodos activos cuya falla desconecta la red (en preorden)"""
+        self._ensure()
+        return [node_id for node_id in self.order if node_id in self.cut_children]
+
+    def is_articulation_point(self, node_id):
+        """Indica en O(1) si la falla del nodo desconecta su componente"""
+        self._ensure()
+        return node_id in self.cut_children
+
+    def is_bridge(self, node1_id, node2_id):
+        """Indica en O(1) si la conexión es un puente"""
+        self._ensure()
+        return frozenset((node1_id, node2_id)) in self.bridges
+
+    def biconnected_components(self):
+        """Componentes biconexas como conjuntos de ids de nodo"""
+        self._ensure()
+        return self.blocks
+
+    def component_nodes(self, node_id):
+        """Nodos activos de la componente conexa de un nodo (intervalo del preorden)"""
+        self._ensure()
+        root = self.component_root.get(node_id)
+        if root is None:
+            return []
+        return self.order[self.preorder[root]:self.subtree_end[root]]
+
+    def failure_groups(self, node_id):
+        """
+        Grupos en que se divide la componente de un nodo si este falla
+
+        Returns:
+            list: Listas de ids; la primera es la parte que conserva la raíz DFS
+                  (vacía si node_id es la raíz)
+        """
+        self._ensure()
+        intervals = self.cut_children.get(node_id)
+        if not intervals:
+            return []
+        separated = [self.order[start:end] for start, end in intervals]
+        root = self.component_root[node_id]
+        if root == node_id:
+            return [[]] + separated
+        # El resto de la componente: todo menos node_id y los subárboles separados
+        rest = []
+        position = self.preorder[root]
+        component_end = self.subtree_end[root]
+        for start, end in sorted(intervals) + [(component_end, component_end)]:
+            rest.extend(n for n in self.order[position:start] if n != node_id)
+            position = end
+        return [rest] + separated
+
+    def unreachable_if_failed(self, node_id, reference_id=None):
+        """
+        Nodos que quedan desconectados si falla un nodo
+
+        Args:
+            node_id (str): Nodo que fallaría
+            reference_id (str): Nodo desde el que se mide la alcanzabilidad
+                                (por defecto, la parte más grande que sobrevive)
+
+        Returns:
+            list: Ids de los nodos que quedarían inalcanzables (sin incluir node_id)
+        """
+        groups = self.failure_groups(node_id)
+        if not groups:
+            return []
+        if reference_id is not None and reference_id != node_id:
+            if self.component_root.get(reference_id) != self.component_root[node_id]:
+                return []  # La referencia está en otra componente: nada cambia para ella
+            position = self.preorder[reference_id]
+            keep = 0  # Por defecto, la parte de la raíz
+            for i, (start, end) in enumerate(self.cut_children[node_id], start=1):
+                if start <= position < end:
+                    keep = i
+                    break
+        else:
+            keep = max(range(len(groups)), key=lambda i: len(groups[i]))
+        return [n for i, group in enumerate(groups) if i != keep for n in group]
+
+
+class ReachabilityOracle:
+    """
+    Etiquetas de componente conexa de los nodos activos con union-find
+
+    Agregar conexiones o restaurar nodos solo une conjuntos (casi O(1)); una
+    falla no se puede deshacer en union-find, así que marca el oráculo como
+    desactualizado y las etiquetas se recalculan en la siguiente consulta.
+    """
+
+    def __init__(self, simulator):
+        self.simulator = simulator
+        self.parent = {}
+        self.size = {}
+        self.dirty = True
+
+    def invalidate(self):
+        """Fuerza el recálculo completo en la siguiente consulta (ej. tras una falla)"""
+        self.dirty = True
+
+    def _find(self, node_id):
+        parent = self.parent
+        root = parent[node_id]
+        while root != parent[root]:
+            parent[root] = parent[parent[root]]  # Compresión por división a la mitad
+            root = parent[root]
+        parent[node_id] = root
+        return root
+
+    def _union(self, node1_id, node2_id):
+        root1, root2 = self._find(node1_id), self._find(node2_id)
+        if root1 == root2:
+            return
+        if self.size[root1] < self.size[root2]:
+            root1, root2 = root2, root1
+        self.parent[root2] = root1
+        self.size[root1] += self.size[root2]
+
+    def _rebuild(self):
+        nodes = self.simulator.nodes
+        self.parent = {node_id: node_id for node_id, node in nodes.items() if node.active}
+        self.size = dict.fromkeys(self.parent, 1)
+        for node_id in self.parent:
+            for neighbor in self.simulator.connections[node_id]:
+                if neighbor in self.parent:
+                    self._union(node_id, neighbor)
+        self.dirty = False
+
+    def add_node(self, node):
+        """Registra un nodo nuevo (o reemplazado)"""
+        if self.dirty:
+            return
+        if not node.active:
+            if node.node_id in self.parent:
+                self.dirty = True  # Un nodo activo fue reemplazado por uno inactivo
+            return
+        self.restore(node.node_id)
+
+    def connect(self, node1_id, node2_id):
+        """Registra una conexión nueva entre dos nodos"""
+        if not self.dirty and node1_id in self.parent and node2_id in self.parent:
+            self._union(node1_id, node2_id)
+
+    def restore(self, node_id):
+        """Registra que un nodo volvió a estar activo, uniéndolo con sus vecinos activos"""
+        if self.dirty or node_id in self.parent:
+            return
+        self.parent[node_id] = node_id
+        self.size[node_id] = 1
+        for neighbor in self.simulator.connections[node_id]:
+            if neighbor in self.parent:
+                self._union(node_id, neighbor)
+
+    def component(self, node_id):
+        """Etiqueta de la componente de un nodo activo (None si está inactivo)"""
+        if self.dirty:
+            self._rebuild()
+        if node_id not in self.parent:
+            return None
+        return self._find(node_id)
+
+    def reachable(self, node1_id, node2_id):
+        """Indica si existe un camino de nodos activos entre los dos nodos"""
+        if self.dirty:
+            self._rebuild()
+        if node1_id not in self.parent or node2_id not in self.parent:
+            return False
+        return self._find(node1_id) == self._find(node2_id)
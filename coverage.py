@@ -0,0 +1,276 @@
+"""
+Mapa de cobertura (Voronoi de red) del Simulador de Red LAN
+Proyecto Final - Redes Computacionales y Análisis de Algoritmos
+
+Para cada combinación de recursos que pide un tipo de emergencia se calcula,
+con un Dijkstra de múltiples fuentes desde todas las estaciones activas que la
+abastecen, la celda de cada estación: cada nodo queda asociado a la estación
+más cercana por la red y a su distancia. Elegir la estación de un despacho es
+entonces una consulta O(1).
+
+Las celdas se reparan de forma incremental:
+- si un nodo falla, solo se recalcula el subárbol de caminos más cortos que
+  colgaba de él (la celda completa si era una estación);
+- si una estación se queda sin existencias, solo se recalcula su celda;
+- si una conexión se alarga o se elimina, solo se recalcula el subárbol que
+  colgaba de ella (nada, si no era parte del árbol de caminos más cortos);
+- nodos, conexiones, restauraciones, estaciones nuevas y conexiones que se
+  acortan solo pueden reducir distancias, así que se propagan desde el punto
+  del cambio.
+Los cambios masivos (carga de archivos, snapshots) descartan los mapas y se
+recalculan en la siguiente consulta.
+"""
+
+import heapq
+from math import inf
+
+
+def resource_key(required_resources):
+    """Clave del mapa para una lista de recursos requeridos"""
+    return tuple(sorted(set(required_resources)))
+
+
+class VoronoiCells:
+    """Partición de la red en celdas de las estaciones que abastecen una combinación de recursos"""
+
+    def __init__(self, key):
+        self.key = key
+        self.owner = {}    # nodo -> estación más cercana
+        self.dist = {}     # nodo -> distancia por la red a esa estación
+        self.parent = {}   # nodo -> nodo anterior en el camino desde la estación
+        self.members = {}  # estación -> nodos de su celda
+
+    def supplies(self, node):
+        """Indica si un nodo activo tiene todos los recursos de la clave"""
+        return node.active and all(node.has_resource(r) for r in self.key)
+
+    def _assign(self, node_id, station_id, distance, parent_id):
+        previous = self.owner.get(node_id)
+        if previous != station_id:
+            if previous is not None:
+                self.members[previous].discard(node_id)
+            self.members.setdefault(station_id, set()).add(node_id)
+            self.owner[node_id] = station_id
+        self.dist[node_id] = distance
+        self.parent[node_id] = parent_id
+
+    def _remove(self, node_ids):
+        for node_id in node_ids:
+            station_id = self.owner.pop(node_id)
+            del self.dist[node_id]
+            del self.parent[node_id]
+            cell = self.members[station_id]
+            cell.discard(node_id)
+            if not cell:
+                del self.members[station_id]
+
+    def _propagate(self, heap, nodes, connections, allowed=None):
+        """
+        Dijkstra a partir de los nodos del montículo (ya asignados)
+
+        Args:
+            heap (list): Entradas (distancia, nodo)
+            allowed (set): Si se indica, solo se pueden reasignar estos nodos
+        """
+        dist = self.dist
+        while heap:
+            distance, node_id = heapq.heappop(heap)
+            if distance > dist[node_id]:
+                continue
+            station_id = self.owner[node_id]
+            for neighbor, weight in connections[node_id].items():
+                if not nodes[neighbor].active or (allowed is not None and neighbor not in allowed):
+                    continue
+                candidate = distance + weight
+                if candidate < dist.get(neighbor, inf):
+                    self._assign(neighbor, station_id, candidate, node_id)
+                    heapq.heappush(heap, (candidate, neighbor))
+
+    def build(self, nodes, connections):
+        """Dijkstra de múltiples fuentes desde todas las estaciones que abastecen la clave"""
+        self.owner, self.dist, self.parent, self.members = {}, {}, {}, {}
+        heap = []
+        for node_id, node in nodes.items():
+            if self.supplies(node):
+                self._assign(node_id, node_id, 0, None)
+                heap.append((0, node_id))
+        heapq.heapify(heap)
+        self._propagate(heap, nodes, connections)
+
+    def _subtree(self, node_id):
+        """Nodos cuyo camino a la estación pasa por node_id (incluido)"""
+        parent = self.parent
+        status = {node_id: True}
+        for member in self.members[self.owner[node_id]]:
+            path = []
+            current = member
+            while current not in status:
+                path.append(current)
+                current = parent[current]
+                if current is None:
+                    break
+            inside = status[current] if current is not None else False
+            for visited in path:
+                status[visited] = inside
+        return {member for member, inside in status.items() if inside}
+
+    def _repair(self, orphans, nodes, connections):
+        """Recalcula los nodos huérfanos desde la frontera con el resto de las celdas"""
+        self._remove(orphans)
+        dist = self.dist
+        heap = []
+        for node_id in orphans:
+            node = nodes[node_id]
+            if not node.active:
+                continue
+            if self.supplies(node):
+                self._assign(node_id, node_id, 0, None)
+                heap.append((0, node_id))
+                continue
+            for neighbor, weight in connections[node_id].items():
+                if neighbor in dist and nodes[neighbor].active:
+                    candidate = dist[neighbor] + weight
+                    if candidate < dist.get(node_id, inf):
+                        self._assign(node_id, self.owner[neighbor], candidate, neighbor)
+            if node_id in dist:
+                heap.append((dist[node_id], node_id))
+        heapq.heapify(heap)
+        self._propagate(heap, nodes, connections, allowed=orphans)
+
+    def _improve(self, node_id, nodes, connections):
+        """Propaga un posible acortamiento de distancias que empieza en node_id"""
+        node = nodes[node_id]
+        if not node.active:
+            return
+        dist = self.dist
+        if self.supplies(node):
+            if dist.get(node_id) == 0 and self.owner[node_id] == node_id:
+                return
+            self._assign(node_id, node_id, 0, None)
+        else:
+            for neighbor, weight in connections[node_id].items():
+                if neighbor in dist and nodes[neighbor].active:
+                    candidate = dist[neighbor] + weight
+                    if candidate < dist.get(node_id, inf):
+                        self._assign(node_id, self.owner[neighbor], candidate, neighbor)
+            if node_id not in dist:
+                return
+        self._propagate([(dist[node_id], node_id)], nodes, connections)
+
+    def node_failed(self, node_id, nodes, connections):
+        """Repara las celdas tras la falla de un nodo"""
+        if node_id in self.owner:
+            self._repair(self._subtree(node_id), nodes, connections)
+
+    def stock_changed(self, node_id, nodes, connections):
+        """Repara las celdas tras un cambio de recursos en un nodo"""
+        node = nodes[node_id]
+        if self.owner.get(node_id) == node_id and not self.supplies(node):
+            # Dejó de ser estación: su celda completa queda huérfana (el nodo sigue como relevo)
+            self._repair(set(self.members[node_id]), nodes, connections)
+        elif self.supplies(node):
+            self._improve(node_id, nodes, connections)
+
+    def connection_added(self, node1_id, node2_id, nodes, connections):
+        """Propaga los caminos más cortos que abre una conexión nueva"""
+        self._improve(node1_id, nodes, connections)
+        self._improve(node2_id, nodes, connections)
+
+    def connection_lengthened(self, node1_id, node2_id, nodes, connections):
+        """Repara las celdas tras alargar o eliminar una conexión"""
+        for parent_id, child_id in ((node1_id, node2_id), (node2_id, node1_id)):
+            if child_id in self.owner and self.parent[child_id] == parent_id:
+                self._repair(self._subtree(child_id), nodes, connections)
+                return
+
+    def node_restored(self, node_id, nodes, connections):
+        """Incorpora un nodo que volvió a estar activo (o un nodo nuevo)"""
+        self._improve(node_id, nodes, connections)
+
+    def path_to_station(self, node_id):
+        """Camino desde la estación dueña de la celda hasta node_id"""
+        path = []
+        current = node_id
+        while current is not None:
+            path.append(current)
+            current = self.parent[current]
+        path.reverse()
+        return path
+
+
+class CoverageMap:
+    """Mapas de cobertura por combinación de recursos, construidos bajo demanda"""
+
+    def __init__(self, simulator):
+        """
+        Inicializa el mapa (cada partición se calcula en su primera consulta)
+
+        Args:
+            simulator (LanSimulator): Simulador cuya red se cubre
+        """
+        self.simulator = simulator
+        self.cells = {}  # clave de recursos -> VoronoiCells
+
+    def invalidate(self):
+        """Descarta todas las particiones (se recalculan en la siguiente consulta)"""
+        self.cells = {}
+
+    def partition(self, required_resources):
+        """Partición de una combinación de recursos (la calcula si no existe)"""
+        key = resource_key(required_resources)
+        cells = self.cells.get(key)
+        if cells is None:
+            cells = VoronoiCells(key)
+            cells.build(self.simulator.nodes, self.simulator.connections)
+            self.cells[key] = cells
+        return cells
+
+    def nearest_station(self, required_resources, node_id):
+        """
+        Estación más cercana por la red a un nodo que tiene todos los recursos
+
+        Args:
+            required_resources (list): Recursos requeridos
+            node_id (str): Nodo de la emergencia
+
+        Returns:
+            tuple: (id de la estación, distancia) o (None, inf) si ninguna lo alcanza
+        """
+        cells = self.partition(required_resources)
+        station_id = cells.owner.get(node_id)
+        if station_id is None:
+            return None, inf
+        if not cells.supplies(self.simulator.nodes[station_id]):
+            # Los recursos cambiaron sin aviso: reparar esta celda y volver a consultar
+            cells.stock_changed(station_id, self.simulator.nodes, self.simulator.connections)
+            return self.nearest_station(required_resources, node_id)
+        return station_id, cells.dist[node_id]
+
+    def _each(self, method, *args):
+        nodes, connections = self.simulator.nodes, self.simulator.connections
+        for cells in self.cells.values():
+            getattr(cells, method)(*args, nodes, connections)
+
+    def node_added(self, node_id):
+        """Registra un nodo nuevo"""
+        self._each("node_restored", node_id)
+
+    def connection_added(self, node1_id, node2_id):
+        """Registra una conexión nueva (o una que disminuyó de peso)"""
+        self._each("connection_added", node1_id, node2_id)
+
+    def connection_lengthened(self, node1_id, node2_id):
+        """Registra que una conexión aumentó de peso o fue eliminada"""
+        self._each("connection_lengthened", node1_id, node2_id)
+
+    def node_failed(self, node_id):
+        """Registra la falla de un nodo"""
+        self._each("node_failed", node_id)
+
+    def node_restored(self, node_id):
+        """Registra que un nodo volvió a estar activo"""
+        self._each("node_restored", node_id)
+
+    def stock_changed(self, node_id):
+        """Registra un cambio en los recursos de un nodo"""
+        self._each("stock_changed", node_id)
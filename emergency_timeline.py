@@ -0,0 +1,162 @@
+"""
+Índice temporal de emergencias del Simulador de Red LAN
+Proyecto Final - Redes Computacionales y Análisis de Algoritmos
+
+emergency_registry es un diccionario por id, así que preguntas como "todas
+las emergencias entre t1 y t2" o "la emergencia pendiente más antigua de un
+tipo" recorren todo el registro. Este índice guarda las emergencias en mapas
+ordenados (ArbolB, ver arbol_b.py) con la clave (timestamp, secuencia):
+
+- by_time: todas las emergencias.
+- groups: un mapa por (tipo, estado). Las consultas por tipo o por estado
+  combinan los mapas del grupo (a lo sumo 6 tipos x 3 estados), así cada
+  emergencia está en dos mapas en vez de cuatro.
+
+Rangos en O(log n + k), conteos y la más antigua en O(log n) por mapa.
+"""
+
+from heapq import merge
+from math import inf
+
+from arbol_b import ArbolB
+
+
+def _key(item):
+    return item[0]
+
+
+class EmergencyTimeline:
+    """Mapas ordenados por timestamp de las emergencias del simulador"""
+
+    def __init__(self):
+        self.by_time = ArbolB()
+        self.groups = {}  # (tipo, estado) -> ArbolB
+        self.keys = {}    # emergency_id -> ((timestamp, secuencia), tipo, estado)
+        self.sequence = 0  # Desempata emergencias con el mismo timestamp
+
+    def _group(self, emergency_type, status):
+        group = self.groups.get((emergency_type, status))
+        if group is None:
+            group = self.groups[(emergency_type, status)] = ArbolB()
+        return group
+
+    def add(self, emergency):
+        """Indexa una emergencia (si ya había una con el mismo id, la reemplaza)"""
+        if emergency.emergency_id in self.keys:
+            self.remove(emergency.emergency_id)
+        key = (emergency.timestamp, self.sequence)
+        self.sequence += 1
+        self.keys[emergency.emergency_id] = (key, emergency.emergency_type, emergency.status)
+        self.by_time.insertar(key, emergency)
+        self._group(emergency.emergency_type, emergency.status).insertar(key, emergency)
+
+    def remove(self, emergency_id):
+        """
+        Quita una emergencia del índice
+
+        Returns:
+            bool: True si estaba indexada
+        """
+        entry = self.keys.pop(emergency_id, None)
+        if entry is None:
+            return False
+        key, emergency_type, status = entry
+        self.by_time.eliminar(key)
+        self.groups[(emergency_type, status)].eliminar(key)
+        return True
+
+    def status_changed(self, emergency):
+        """Mueve una emergencia al grupo de su estado actual"""
+        entry = self.keys.get(emergency.emergency_id)
+        if entry is None or entry[2] == emergency.status:
+            return
+        key, emergency_type, status = entry
+        self.groups[(emergency_type, status)].eliminar(key)
+        self._group(emergency_type, emergency.status).insertar(key, emergency)
+        self.keys[emergency.emergency_id] = (key, emergency_type, emergency.status)
+
+    def rebuild(self, emergencies):
+        """
+        Reconstruye el índice desde cero en O(n log n) (ordenando una vez y
+        armando cada mapa en O(n) desde datos ordenados)
+        """
+        ordered = sorted(emergencies, key=lambda emergency: emergency.timestamp)
+        self.keys = {}
+        grouped = {}
+        keys = []
+        for sequence, emergency in enumerate(ordered):
+            key = (emergency.timestamp, sequence)
+            keys.append(key)
+            self.keys[emergency.emergency_id] = (key, emergency.emergency_type, emergency.status)
+            group = grouped.setdefault((emergency.emergency_type, emergency.status), ([], []))
+            group[0].append(key)
+            group[1].append(emergency)
+        self.sequence = len(ordered)
+        self.by_time = ArbolB.desde_ordenados(keys, ordered)
+        self.groups = {group: ArbolB.desde_ordenados(group_keys, values)
+                       for group, (group_keys, values) in grouped.items()}
+
+    def clear(self):
+        self.rebuild(())
+
+    def __len__(self):
+        return len(self.by_time)
+
+    def _trees(self, emergency_type, status):
+        """Mapas que cubren el filtro (by_time si no hay filtro)"""
+        if emergency_type is None and status is None:
+            return [self.by_time]
+        return [tree for (group_type, group_status), tree in self.groups.items()
+                if (emergency_type is None or group_type == emergency_type)
+                and (status is None or group_status == status)]
+
+    def between(self, start=None, end=None, emergency_type=None, status=None):
+        """
+        Emergencias con start <= timestamp <= end, de la más antigua a la más reciente
+
+        Args:
+            start (float): Inicio del intervalo (None = sin límite)
+            end (float): Fin del intervalo, incluido (None = sin límite)
+            emergency_type (str): Solo este tipo (None = todos)
+            status (str): Solo este estado (None = todos)
+
+        Returns:
+            generator: Objetos Emergency
+        """
+        low = None if start is None else (start,)
+        high = None if end is None else (end, inf)
+        ranges = [tree.rango(low, high) for tree in self._trees(emergency_type, status)]
+        items = ranges[0] if len(ranges) == 1 else merge(*ranges, key=_key)
+        return (emergency for _, emergency in items)
+
+    def count_between(self, start=None, end=None, emergency_type=None, status=None):
+        """Número de emergencias con start <= timestamp <= end, en O(log n) por mapa"""
+        low = (-inf,) if start is None else (start,)
+        high = (inf, inf) if end is None else (end, inf)
+        return sum(tree.contar_rango(low, high) for tree in self._trees(emergency_type, status))
+
+    def oldest(self, emergency_type=None, status=None):
+        """
+        Emergencia más antigua que cumple el filtro
+
+        Returns:
+            Emergency: La emergencia, o None si no hay ninguna
+        """
+        firsts = [tree.primero() for tree in self._trees(emergency_type, status) if len(tree)]
+        return min(firsts, key=_key)[1] if firsts else None
+
+    def histogram(self, start, end, buckets, emergency_type=None, status=None):
+        """
+        Conteos por intervalos iguales de [start, end) para tableros (ventanas deslizantes)
+
+        Returns:
+            list: buckets conteos, en O(buckets * log n)
+        """
+        if buckets <= 0 or end <= start:
+            raise ValueError("Se necesita al menos un intervalo y end > start")
+        width = (end - start) / buckets
+        trees = self._trees(emergency_type, status)
+        edges = [start + i * width for i in range(buckets)] + [end]
+        # Emergencias con timestamp menor que cada borde
+        below = [sum(tree.posicion((edge,)) for tree in trees) for edge in edges]
+        return [below[i + 1] - below[i] for i in range(buckets)]
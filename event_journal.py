@@ -0,0 +1,362 @@
+"""
+Diario de eventos (journal) de solo-anexado para el Simulador de Red LAN
+Proyecto Final - Redes Computacionales y Análisis de Algoritmos
+
+Registra en formato binario compacto las mutaciones del simulador que ocurren
+entre snapshots (emergencias nuevas, fallas, restauraciones y despachos) para
+poder recuperarlas tras una caída: se carga el último snapshot y se reproduce
+la cola del diario.
+
+Formato de cada registro:
+    cabecera <BQII> = tipo, número de secuencia (lsn), largo del payload, crc32
+    payload        = campos numéricos empaquetados + cadenas con prefijo de largo <I
+"""
+
+import json
+import os
+import struct
+import threading
+import time
+import zlib
+
+MAGIC = b"LANJ\x02\n"  # Identifica un archivo de diario válido (y la versión del formato)
+
+# Tipos de evento
+EV_EMERGENCY = 1
+EV_NODE_FAILURE = 2
+EV_NODE_RESTORE = 3
+EV_DISPATCH = 4
+
+_HEADER = struct.Struct("<BQII")
+_LENGTH = struct.Struct("<I")  # Prefijo de las cadenas: ids largos no deben tumbar al simulador
+_EMERGENCY = struct.Struct("<ddd")  # x, y, timestamp
+_DISPATCH = struct.Struct("<d")  # tiempo de respuesta
+
+
+def _pack_str(text):
+    """Codifica una cadena con su largo en bytes como prefijo"""
+    raw = text.encode("utf-8")
+    return _LENGTH.pack(len(raw)) + raw
+
+
+def _unpack_str(payload, offset):
+    """Decodifica una cadena con prefijo de largo, devuelve (texto, nuevo offset)"""
+    (size,) = _LENGTH.unpack_from(payload, offset)
+    start = offset + _LENGTH.size
+    return payload[start:start + size].decode("utf-8"), start + size
+
+
+def encode_event(event_type, lsn, payload):
+    """Arma un registro binario completo (cabecera + payload)"""
+    return _HEADER.pack(event_type, lsn, len(payload), zlib.crc32(payload)) + payload
+
+
+def decode_payload(event_type, payload):
+    """
+    Convierte el payload binario de un evento en una tupla de campos
+
+    Returns:
+        tuple: Campos del evento según su tipo
+    """
+    if event_type == EV_EMERGENCY:
+        x, y, timestamp = _EMERGENCY.unpack_from(payload, 0)
+        emergency_id, offset = _unpack_str(payload, _EMERGENCY.size)
+        emergency_type, _ = _unpack_str(payload, offset)
+        return emergency_id, emergency_type, (x, y), timestamp
+    if event_type in (EV_NODE_FAILURE, EV_NODE_RESTORE):
+        node_id, _ = _unpack_str(payload, 0)
+        return (node_id,)
+    if event_type == EV_DISPATCH:
+        (response_time,) = _DISPATCH.unpack_from(payload, 0)
+        emergency_id, offset = _unpack_str(payload, _DISPATCH.size)
+        node_id, _ = _unpack_str(payload, offset)
+        return emergency_id, node_id, response_time
+    raise ValueError(f"Tipo de evento desconocido en el diario: {event_type}")
+
+
+def read_events(filename):
+    """
+    Lee los eventos de un archivo de diario
+
+    Se detiene en el primer registro incompleto o corrupto (escritura cortada
+    por una caída), que se considera el final válido del diario.
+
+    Args:
+        filename (str): Ruta del archivo de diario
+
+    Yields:
+        tuple: (tipo, lsn, campos del evento)
+    """
+    for event_type, lsn, payload, _ in _scan(filename):
+        yield event_type, lsn, decode_payload(event_type, payload)
+
+
+def _scan(filename):
+    """Recorre los registros válidos, devolviendo también el offset final de cada uno"""
+    if not os.path.exists(filename):
+        return
+    with open(filename, "rb") as file:
+        data = file.read()
+    if not data.startswith(MAGIC):
+        return
+    offset = len(MAGIC)
+    while offset + _HEADER.size <= len(data):
+        event_type, lsn, size, crc = _HEADER.unpack_from(data, offset)
+        start = offset + _HEADER.size
+        payload = data[start:start + size]
+        if len(payload) < size or zlib.crc32(payload) != crc:
+            return
+        offset = start + size
+        yield event_type, lsn, payload, offset
+
+
+class EventJournal:
+    """Diario de eventos con escritura en grupo (group commit) y fsync por lotes"""
+
+    def __init__(self, filename, flush_interval=0.05, batch_bytes=64 * 1024,
+                 compact_bytes=8 * 1024 * 1024, snapshot_file=None):
+        """
+        Abre (o crea) un diario de eventos
+
+        Args:
+            filename (str): Ruta del archivo de diario
+            flush_interval (float): Segundos máximos entre fsync de un lote
+            batch_bytes (int): Tamaño del búfer que fuerza un commit anticipado
+            compact_bytes (int): Tamaño del diario a partir del cual se compacta
+            snapshot_file (str): Snapshot que se reescribe al compactar (None = sin compactación)
+        """
+        self.filename = filename
+        self.old_filename = filename + ".old"  # Segmento anterior mientras se compacta
+        self.flush_interval = flush_interval
+        self.batch_bytes = batch_bytes
+        self.compact_bytes = compact_bytes
+        self.snapshot_file = snapshot_file
+        self.simulator = None  # Lo asigna LanSimulator.attach_journal
+
+        self.last_lsn = self._recover_tail()
+        self.file = open(filename, "ab")
+        if self.file.tell() == 0:
+            self.file.write(MAGIC)
+            self.file.flush()
+            os.fsync(self.file.fileno())
+        self.file_size = self.file.tell()
+
+        self._buffer = bytearray()
+        self._lock = threading.Lock()
+        self._io_lock = threading.Lock()  # Serializa escritura y rotación del archivo
+        self._wakeup = threading.Event()
+        self._closed = False
+        self._compact_requested = False
+        self._compacting = False
+        self._rotating = False  # Hasta que el compactador rota el archivo, commit no escribe
+        self._compactor = None
+        self._flusher = threading.Thread(target=self._flush_loop, daemon=True)
+        self._flusher.start()
+
+    def _recover_tail(self):
+        """Obtiene el último lsn válido y recorta un registro final incompleto"""
+        last_lsn = 0
+        valid_end = None
+        for filename in (self.old_filename, self.filename):
+            for _, lsn, _, offset in _scan(filename):
+                last_lsn = lsn
+                if filename == self.filename:
+                    valid_end = offset
+        if os.path.exists(self.filename):
+            size = os.path.getsize(self.filename)
+            if size >= len(MAGIC):
+                with open(self.filename, "rb") as file:
+                    if file.read(len(MAGIC)) != MAGIC:
+                        raise ValueError(f"{self.filename} no es un diario de eventos de esta versión")
+            end = valid_end if valid_end is not None else len(MAGIC)
+            if size < len(MAGIC):
+                end = 0
+            if end < size:
+                with open(self.filename, "r+b") as file:
+                    file.truncate(end)
+        return last_lsn
+
+    # ---- Escritura de eventos -------------------------------------------------
+
+    def _append(self, event_type, payload):
+        """Agrega un registro al búfer del lote actual"""
+        with self._lock:
+            self.last_lsn += 1
+            self._buffer += encode_event(event_type, self.last_lsn, payload)
+            if len(self._buffer) >= self.batch_bytes:
+                self._wakeup.set()
+        if self._compact_requested:
+            self._start_compaction()
+
+    def log_emergency(self, emergency):
+        """Registra una emergencia agregada a la cola"""
+        x, y = emergency.location
+        self._append(EV_EMERGENCY,
+                     _EMERGENCY.pack(x, y, emergency.timestamp)
+                     + _pack_str(emergency.emergency_id)
+                     + _pack_str(emergency.emergency_type))
+
+    def log_node_failure(self, node_id):
+        """Registra la falla de un nodo"""
+        self._append(EV_NODE_FAILURE, _pack_str(node_id))
+
+    def log_node_restore(self, node_id):
+        """Registra la restauración de un nodo"""
+        self._append(EV_NODE_RESTORE, _pack_str(node_id))
+
+    def log_dispatch(self, emergency_id, node_id, response_time):
+        """Registra la decisión de despacho de una emergencia a un nodo"""
+        self._append(EV_DISPATCH,
+                     _DISPATCH.pack(response_time)
+                     + _pack_str(emergency_id)
+                     + _pack_str(node_id))
+
+    # ---- Commit en grupo -------------------------------------------------------
+
+    def commit(self):
+        """Escribe y sincroniza (fsync) todos los eventos pendientes"""
+        with self._io_lock:
+            with self._lock:
+                if self._rotating:
+                    return  # Los eventos nuevos van al segmento que abrirá el compactador
+                pending = self._buffer
+                self._buffer = bytearray()
+            if pending:
+                self.file.write(pending)
+                self.file.flush()
+                os.fsync(self.file.fileno())
+                self.file_size += len(pending)
+        if (self.snapshot_file and not self._compacting
+                and self.file_size >= self.compact_bytes):
+            self._compact_requested = True
+
+    def _flush_loop(self):
+        """Hilo de fondo: hace commit del lote cada flush_interval o al llenarse el búfer"""
+        while not self._closed:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            if self._closed:
+                break
+            self.commit()
+
+    def close(self):
+        """Hace commit de lo pendiente y cierra el diario"""
+        if self._closed:
+            return
+        self._closed = True
+        self._wakeup.set()
+        self._flusher.join()
+        if self._compactor is not None:
+            self._compactor.join()
+        self.commit()
+        self.file.close()
+
+    # ---- Compactación ---------------------------------------------------------
+
+    def _start_compaction(self):
+        """
+        Inicia la compactación del diario
+
+        En el hilo del simulador, justo después de anexar un evento (así la
+        captura y el lsn son consistentes), se toma una copia superficial del
+        estado (capture_state) y se aparta el búfer pendiente. Esa copia recorre
+        todos los nodos y conexiones, así que la compactación sí provoca una
+        pausa O(N+E) en el hilo que muta el simulador. Todo lo demás (fsync,
+        rotación del archivo, armado y escritura del snapshot) lo hace el hilo
+        compactador.
+        """
+        if self.simulator is None or self._compacting:
+            self._compact_requested = False
+            return
+        self._compacting = True
+        self._compact_requested = False
+        with self._lock:
+            pending = self._buffer  # Eventos hasta la captura: cierran el segmento actual
+            self._buffer = bytearray()
+            self._rotating = True
+        capture = self.simulator.capture_state()
+        self._compactor = threading.Thread(target=self._finish_compaction, args=(pending, capture), daemon=True)
+        self._compactor.start()
+
+    def _finish_compaction(self, pending, capture):
+        """Rota el diario, escribe el snapshot de forma atómica y descarta el segmento anterior"""
+        try:
+            with self._io_lock:
+                self.file.write(pending)
+                self.file.flush()
+                os.fsync(self.file.fileno())
+                # Rotar: el segmento actual pasa a .old hasta que el snapshot sea durable
+                self.file.close()
+                if os.path.exists(self.old_filename):
+                    self._append_to_old()
+                else:
+                    os.replace(self.filename, self.old_filename)
+                self.file = open(self.filename, "ab")
+                self.file.write(MAGIC)
+                self.file.flush()
+                os.fsync(self.file.fileno())
+                self.file_size = self.file.tell()
+                with self._lock:
+                    self._rotating = False
+            write_snapshot(self.snapshot_file, self.simulator.snapshot_state(capture))
+            if os.path.exists(self.old_filename):
+                os.remove(self.old_filename)
+        finally:
+            with self._lock:
+                self._rotating = False
+            self._compacting = False
+
+    def _append_to_old(self):
+        """
+        Anexa el segmento actual a un .old que dejó una compactación fallida
+
+        Si write_snapshot falló, el .old guarda los eventos desde el último
+        snapshot bueno y no se puede pisar. Primero se recorta su cola inválida
+        (una anexión cortada por una caída) y luego se le agregan los registros
+        del segmento actual. Si hay una caída antes de borrar el segmento, la
+        recuperación ve los eventos repetidos y los descarta por lsn.
+        """
+        valid_end = len(MAGIC)
+        for _, _, _, offset in _scan(self.old_filename):
+            valid_end = offset
+        with open(self.filename, "rb") as file:
+            records = file.read()[len(MAGIC):]
+        with open(self.old_filename, "r+b") as file:
+            if file.read(len(MAGIC)) != MAGIC:
+                file.seek(0)
+                file.write(MAGIC)
+                valid_end = len(MAGIC)
+            file.truncate(valid_end)
+            file.seek(valid_end)
+            file.write(records)
+            file.flush()
+            os.fsync(file.fileno())
+        os.remove(self.filename)
+
+    def compact(self):
+        """Solicita una compactación en el próximo evento registrado"""
+        if self.snapshot_file:
+            self._compact_requested = True
+
+    def wait_for_compaction(self, timeout=5.0):
+        """Espera a que termine una compactación en curso (útil en pruebas)"""
+        deadline = time.monotonic() + timeout
+        while self._compacting and time.monotonic() < deadline:
+            time.sleep(0.001)
+        return not self._compacting
+
+
+def write_snapshot(filename, state):
+    """
+    Escribe un snapshot de forma atómica (archivo temporal + reemplazo)
+
+    Args:
+        filename (str): Ruta del snapshot
+        state (dict): Estado serializable del simulador
+    """
+    tmp_filename = filename + ".tmp"
+    with open(tmp_filename, "w") as file:
+        json.dump(state, file)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(tmp_filename, filename)
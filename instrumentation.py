@@ -0,0 +1,115 @@
+"""
+Instrumentación opcional de las fases de despacho del Simulador de Red LAN
+Proyecto Final - Redes Computacionales y Análisis de Algoritmos
+
+Registra, con perf_counter_ns, un histograma de tiempos por fase de
+process_next_emergency (filtro de candidatos, nodo más cercano, Dijkstra,
+actualización de estadísticas) y los contadores de cada consulta de ruta
+(inserciones y extracciones del montículo, aristas revisadas, incluidas las
+que llevan a vecinos inactivos). Cuando está desactivada el simulador solo
+compara su atributo profiler con None.
+"""
+
+PHASES = ("dispatch", "candidate_filter", "nearest_node", "dijkstra", "stats_update")
+
+
+class Histogram:
+    """Histograma con cubetas en potencias de 2 (valores enteros, ej. nanosegundos)"""
+
+    def __init__(self):
+        self.buckets = [0] * 64  # Cubeta i: valores en [2^(i-1), 2^i)
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = 0
+
+    def add(self, value):
+        """Registra un valor"""
+        self.buckets[value.bit_length()] += 1
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, fraction):
+        """Cota superior aproximada (límite de la cubeta) del percentil pedido"""
+        if not self.count:
+            return 0
+        target = fraction * self.count
+        seen = 0
+        for i, bucket in enumerate(self.buckets):
+            seen += bucket
+            if seen >= target:
+                return min((1 << i) - 1 if i else 0, self.max)
+        return self.max
+
+    def summary(self):
+        """Resumen del histograma como diccionario"""
+        return {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.total / self.count if self.count else 0,
+            "min": self.min or 0,
+            "p50": self.percentile(0.50),
+            "p99": self.percentile(0.99),
+            "max": self.max,
+        }
+
+
+class DispatchProfiler:
+    """Acumula los tiempos por fase y los contadores de las consultas de ruta"""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Descarta todas las mediciones"""
+        self.phases = {phase: Histogram() for phase in PHASES}
+        self.heap_pushes = Histogram()
+        self.heap_pops = Histogram()
+        self.edges_scanned = Histogram()
+
+    def record(self, phase, elapsed_ns):
+        """Registra la duración de una fase en nanosegundos"""
+        self.phases[phase].add(elapsed_ns)
+
+    def record_route(self, pushes, pops, edges_scanned):
+        """Registra el trabajo realizado por una consulta de ruta"""
+        self.heap_pushes.add(pushes)
+        self.heap_pops.add(pops)
+        self.edges_scanned.add(edges_scanned)
+
+    def report(self):
+        """
+        Obtiene el reporte de la instrumentación
+
+        Returns:
+            dict: {"phases_ns": {fase: resumen}, "route": {contador: resumen}}
+        """
+        return {
+            "phases_ns": {phase: hist.summary() for phase, hist in self.phases.items()},
+            "route": {
+                "heap_pushes": self.heap_pushes.summary(),
+                "heap_pops": self.heap_pops.summary(),
+                "edges_scanned": self.edges_scanned.summary(),
+            },
+        }
+
+    def format_report(self):
+        """Reporte en texto, como tabla, para la interfaz de línea de comandos"""
+        lines = [f"{'Fase':<18}{'n':>8}{'media (us)':>12}{'p50 (us)':>11}{'p99 (us)':>11}{'máx (us)':>11}"]
+        for phase, hist in self.phases.items():
+            data = hist.summary()
+            lines.append(f"{phase:<18}{data['count']:>8}{data['mean'] / 1000:>12.2f}"
+                         f"{data['p50'] / 1000:>11.2f}{data['p99'] / 1000:>11.2f}{data['max'] / 1000:>11.2f}")
+        lines.append("")
+        lines.append(f"{'Por consulta de ruta':<22}{'media':>10}{'p99':>10}{'máx':>10}")
+        for name, hist in (("inserciones heap", self.heap_pushes),
+                           ("extracciones heap", self.heap_pops),
+                           ("aristas revisadas", self.edges_scanned)):
+            data = hist.summary()
+            lines.append(f"{name:<22}{data['mean']:>10.1f}{data['p99']:>10}{data['max']:>10}")
+        return "\n".join(lines)
+
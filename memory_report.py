@@ -0,0 +1,160 @@
+"""
+Reporte de memoria por estructura de datos del Simulador de Red LAN
+Proyecto Final - Redes Computacionales y Análisis de Algoritmos
+
+Recorre en profundidad las estructuras del simulador sumando sys.getsizeof de
+cada objeto alcanzable (cada objeto se cuenta una sola vez, en la primera
+estructura que lo alcanza) y agrupa el resultado por estructura y por tipo de
+objeto. Si tracemalloc está activo también reporta la memoria trazada.
+"""
+
+import sys
+import time
+import tracemalloc
+from types import BuiltinFunctionType, FunctionType, MethodType, ModuleType
+
+# Tipos que no se recorren (compartidos por todo el programa)
+_SKIP_TYPES = (type, ModuleType, FunctionType, BuiltinFunctionType, MethodType)
+
+# Orden del recorrido: las listas de estadísticas de los nodos se miden aparte
+STRUCTURES = ("node_stats", "nodes", "connections", "emergency_registry", "emergencies", "zone_tree",
+              "timeline", "route_cache")
+
+
+def deep_sizeof(obj, seen=None, by_type=None):
+    """
+    Tamaño en bytes de un objeto y de todo lo que alcanza
+
+    Args:
+        obj: Objeto a medir
+        seen (set): Ids de objetos ya contados (se actualiza)
+        by_type (dict): Acumulador {tipo: [cantidad, bytes]} (se actualiza)
+
+    Returns:
+        int: Bytes de los objetos alcanzados que no estaban en seen
+    """
+    if seen is None:
+        seen = set()
+    total = 0
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        if id(current) in seen or isinstance(current, _SKIP_TYPES):
+            continue
+        seen.add(id(current))
+        size = sys.getsizeof(current)
+        total += size
+        if by_type is not None:
+            entry = by_type.setdefault(type(current).__name__, [0, 0])
+            entry[0] += 1
+            entry[1] += size
+
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            stack.extend(current)
+        elif isinstance(current, (str, bytes, int, float, bool)) or current is None:
+            continue
+        else:
+            if hasattr(current, "__dict__"):
+                stack.append(current.__dict__)
+            for slot in getattr(type(current), "__slots__", ()):
+                if hasattr(current, slot):
+                    stack.append(getattr(current, slot))
+    return total
+
+
+def memory_report(simulator):
+    """
+    Desglose de memoria del simulador
+
+    Args:
+        simulator (LanSimulator): Simulador a medir
+
+    Returns:
+        dict: Bytes por estructura, por tipo de objeto, por nodo/conexión/emergencia
+              y, si tracemalloc está activo, la memoria trazada actual y pico
+    """
+    seen = set()
+    by_type = {}
+    parts = {
+        "node_stats": [node.stats for node in simulator.nodes.values()],
+        "nodes": simulator.nodes,
+        "connections": simulator.connections,
+        "emergency_registry": simulator.emergency_registry,
+        "emergencies": simulator.emergencies,
+        "zone_tree": simulator.zone_tree,
+        "timeline": simulator.timeline,
+        "route_cache": simulator.route_cache,
+    }
+    structures = {}
+    for name in STRUCTURES:
+        structures[name] = deep_sizeof(parts[name], seen, by_type)
+    # La lista auxiliar de node_stats no es parte del simulador
+    structures["node_stats"] -= sys.getsizeof(parts["node_stats"])
+    by_type["list"][0] -= 1
+    by_type["list"][1] -= sys.getsizeof(parts["node_stats"])
+
+    num_nodes = len(simulator.nodes)
+    num_edges = sum(len(conns) for conns in simulator.connections.values()) // 2
+    num_emergencies = len(simulator.emergency_registry)
+    emergency_bytes = (structures["emergency_registry"] + structures["emergencies"] + structures["zone_tree"]
+                       + structures["timeline"])
+
+    report = {
+        "total_bytes": sum(structures.values()),
+        "structures": structures,
+        "types": {name: {"count": count, "bytes": size}
+                  for name, (count, size) in sorted(by_type.items(), key=lambda item: -item[1][1])},
+        "counts": {"nodes": num_nodes, "edges": num_edges, "emergencies": num_emergencies},
+        "bytes_per_node": (structures["nodes"] + structures["node_stats"]) / num_nodes if num_nodes else 0,
+        "bytes_per_edge": structures["connections"] / num_edges if num_edges else 0,
+        "bytes_per_emergency": emergency_bytes / num_emergencies if num_emergencies else 0,
+    }
+    if tracemalloc.is_tracing():
+        current, peak = tracemalloc.get_traced_memory()
+        report["tracemalloc"] = {"current": current, "peak": peak}
+    return report
+
+
+def format_report(report, top_types=8):
+    """Reporte de memoria en texto para la consola"""
+    lines = [f"Memoria total: {report['total_bytes'] / 1024:.1f} KiB"]
+    for name, size in report["structures"].items():
+        lines.append(f"  {name:<20}{size / 1024:>12.1f} KiB")
+    lines.append(f"  por nodo: {report['bytes_per_node']:.0f} B, por conexión: {report['bytes_per_edge']:.0f} B, "
+                 f"por emergencia: {report['bytes_per_emergency']:.0f} B")
+    lines.append("Tipos de objeto con más memoria:")
+    for name, data in list(report["types"].items())[:top_types]:
+        lines.append(f"  {name:<20}{data['count']:>10} objetos {data['bytes'] / 1024:>12.1f} KiB")
+    if "tracemalloc" in report:
+        lines.append(f"tracemalloc: actual {report['tracemalloc']['current'] / 1024:.1f} KiB, "
+                     f"pico {report['tracemalloc']['peak'] / 1024:.1f} KiB")
+    return "\n".join(lines)
+
+
+class MemoryTimeline:
+    """Registra la evolución de la memoria del simulador a lo largo de una simulación"""
+
+    def __init__(self, simulator):
+        self.simulator = simulator
+        self.samples = []  # (etiqueta, tiempo, bytes por estructura)
+
+    def sample(self, label):
+        """Toma una muestra de la memoria actual"""
+        report = memory_report(self.simulator)
+        self.samples.append((label, time.time(), report["structures"]))
+        return report
+
+    def growth(self):
+        """
+        Crecimiento por estructura entre la primera y la última muestra
+
+        Returns:
+            dict: {estructura: bytes de diferencia}
+        """
+        if len(self.samples) < 2:
+            return {}
+        first, last = self.samples[0][2], self.samples[-1][2]
+        return {name: last[name] - first[name] for name in last}
@@ -0,0 +1,93 @@
+"""
+Exportación periódica de métricas del Simulador de Red LAN
+Proyecto Final - Redes Computacionales y Análisis de Algoritmos
+
+Escribe las estadísticas de get_network_statistics en un archivo, en formato de
+texto de Prometheus o JSON, para que un recolector local lo lea. Como las
+estadísticas se mantienen de forma incremental, cada escritura cuesta O(1)
+respecto al tamaño de la red.
+"""
+
+import json
+import os
+import threading
+import time
+
+# Estadística -> (nombre de la métrica, tipo, descripción)
+METRICS = {
+    "total_nodes": ("lan_nodes_total", "gauge", "Nodos registrados en la red"),
+    "active_nodes": ("lan_nodes_active", "gauge", "Nodos activos"),
+    "total_emergencies": ("lan_emergencies_total", "counter", "Emergencias recibidas"),
+    "completed_emergencies": ("lan_emergencies_completed_total", "counter", "Emergencias atendidas"),
+    "pending_emergencies": ("lan_emergencies_pending", "gauge", "Emergencias en cola"),
+    "avg_response_time": ("lan_response_time_avg_seconds", "gauge", "Tiempo promedio de respuesta"),
+    "total_data_transmitted": ("lan_data_transmitted_total", "counter", "Datos transmitidos (unidades)"),
+    "route_cache_hits": ("lan_route_cache_hits_total", "counter", "Rutas servidas desde la caché"),
+    "route_cache_misses": ("lan_route_cache_misses_total", "counter", "Rutas calculadas con Dijkstra"),
+    "route_cache_evictions": ("lan_route_cache_evictions_total", "counter", "Rutas desalojadas de la caché"),
+}
+
+
+def render_prometheus(stats):
+    """Convierte las estadísticas al formato de texto de Prometheus"""
+    lines = []
+    for key, (name, metric_type, description) in METRICS.items():
+        if key in stats:
+            lines.append(f"# HELP {name} {description}")
+            lines.append(f"# TYPE {name} {metric_type}")
+            lines.append(f"{name} {stats[key]}")
+    return "\n".join(lines) + "\n"
+
+
+def render_json(stats):
+    """Convierte las estadísticas a JSON con la marca de tiempo de la muestra"""
+    return json.dumps({"timestamp": time.time(), **stats})
+
+
+class MetricsExporter:
+    """Hilo que escribe las métricas del simulador cada cierto intervalo"""
+
+    def __init__(self, simulator, filename, interval=1.0, fmt="prometheus"):
+        """
+        Inicializa el exportador
+
+        Args:
+            simulator (LanSimulator): Simulador a observar
+            filename (str): Archivo de salida (se reemplaza de forma atómica)
+            interval (float): Segundos entre escrituras
+            fmt (str): "prometheus" o "json"
+        """
+        if fmt not in ("prometheus", "json"):
+            raise ValueError(f"Formato de métricas no válido: {fmt}")
+        self.simulator = simulator
+        self.filename = filename
+        self.interval = interval
+        self.render = render_prometheus if fmt == "prometheus" else render_json
+        self._stop = threading.Event()
+        self._thread = None
+
+    def write_once(self):
+        """Escribe una muestra de las métricas"""
+        tmp_filename = self.filename + ".tmp"
+        with open(tmp_filename, "w") as file:
+            file.write(self.render(self.simulator.get_network_statistics()))
+        os.replace(tmp_filename, self.filename)
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.write_once()
+            self._stop.wait(self.interval)
+
+    def start(self):
+        """Inicia la exportación periódica en segundo plano"""
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """Detiene la exportación periódica"""
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
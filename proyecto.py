@@ -5,10 +5,26 @@ Proyecto Final - Redes Computacionales y Análisis de Algoritmos
 
 import heapq
 import json
+import os
 import random
+import sys
 import time
 from collections import defaultdict
-from math import inf
+from math import inf, isfinite
+from time import perf_counter_ns
+
+from event_journal import (EV_DISPATCH, EV_EMERGENCY, EV_NODE_FAILURE, EV_NODE_RESTORE,
+                           read_events, write_snapshot)
+from connectivity import ConnectivityIndex, ReachabilityOracle
+from centrality import betweenness_centrality, rank_nodes
+from coverage import CoverageMap
+from emergency_timeline import EmergencyTimeline
+from route_cache import RouteCache
+from instrumentation import DispatchProfiler
+from memory_report import memory_report
+from topology_binary import MappedTopology, is_topology_binary, write_topology_binary
+from topology_export import export_topology, failed_neighbourhood, nodes_in_zone, nodes_within_hops
+from topology_loader import iter_topology
 
 class LanNode:
     """Representa un nodo en la red LAN (estación de servicio o router)"""
@@ -34,6 +50,8 @@ class LanNode:
             "incidents_handled": 0, #Numero de incidentes atendidos
             "response_times": [] #Lista de tiempos de respuesta para cada incidente
         }
+        self.response_time_total = 0  # Suma de response_times, para promediar en O(1)
+        self.counters = None  # Contadores de la red a la que pertenece (los asigna add_node)
     
     def add_resource(self, resource_type, count=1):
         """Agrega recursos al nodo, añade elementos al diccionario linea 30"""
@@ -56,10 +74,14 @@ class LanNode:
     
     def deactivate(self):
         """Desactiva el nodo (simulación de caída)"""
+        if self.active and self.counters is not None:
+            self.counters.active_nodes -= 1
         self.active = False
     
     def activate(self):
         """Activa el nodo(cuando lo arreglan)"""
+        if not self.active and self.counters is not None:
+            self.counters.active_nodes += 1
         self.active = True
     
     def update_stats(self, data_size, incident_handled=False, response_time=None):
@@ -69,17 +91,58 @@ class LanNode:
             self.stats["incidents_handled"] += 1
         if response_time is not None:
             self.stats["response_times"].append(response_time)
+            self.response_time_total += response_time
+        if self.counters is not None:
+            self.counters.record(data_size, response_time)
+    
+    def load_stats(self, stats):
+        """Reemplaza las estadísticas del nodo (por ejemplo, al restaurar un snapshot)"""
+        self.stats = stats
+        self.response_time_total = sum(stats["response_times"])
     
     def get_avg_response_time(self):
         """Calcula el tiempo promedio de respuesta, la suma, sobre la cantidad"""
         if not self.stats["response_times"]:
             return 0
-        return sum(self.stats["response_times"]) / len(self.stats["response_times"])
+        return self.response_time_total / len(self.stats["response_times"])
     
     def __str__(self):
         return f"Nodo {self.node_id}: {self.name} ({self.node_type})" #En un texto, escribe Nodo "id delcodigo": "Nombre del nodo" ("tipo de nodo")
 
 
+class NetworkCounters:
+    """Contadores globales de la red, mantenidos incrementalmente por los nodos"""
+    
+    def __init__(self):
+        self.total_nodes = 0
+        self.active_nodes = 0
+        self.total_data_transmitted = 0
+        self.response_time_total = 0
+        self.response_time_count = 0
+    
+    def record(self, data_size, response_time=None):
+        """Suma los datos transmitidos y el tiempo de respuesta de un incidente"""
+        self.total_data_transmitted += data_size
+        if response_time is not None:
+            self.response_time_total += response_time
+            self.response_time_count += 1
+    
+    def attach(self, node, sign=1):
+        """Suma (sign=1) o resta (sign=-1) la contribución completa de un nodo"""
+        self.total_nodes += sign
+        if node.active:
+            self.active_nodes += sign
+        self.total_data_transmitted += sign * node.stats["data_transmitted"]
+        self.response_time_total += sign * node.response_time_total
+        self.response_time_count += sign * len(node.stats["response_times"])
+    
+    def avg_response_time(self):
+        """Tiempo promedio de respuesta de toda la red"""
+        if not self.response_time_count:
+            return 0
+        return self.response_time_total / self.response_time_count
+
+
 class Emergency:
     """Representa una emergencia en el sistema"""
     
@@ -173,19 +236,82 @@ class PathFinder:
 class LanSimulator:
     """Simulador principal de la red LAN"""
     
-    def __init__(self):
-        """Inicializa el simulador de red LAN"""
+    CENTRALITY_EXACT_LIMIT = 2000  # Más nodos activos: centralidad aproximada por muestreo
+    CENTRALITY_SAMPLE = 256
+    
+    def __init__(self, route_cache_size=4096):
+        """
+        Inicializa el simulador de red LAN
+        
+        Args:
+            route_cache_size (int): Rutas guardadas en la caché LRU (0 = sin caché)
+        """
         self.nodes = {} # Diccionario de nodos (node_id -> LanNode)
-        self.connections = defaultdict(list)  # Lista de adyacencia(grafos) para conexiones
+        self.connections = defaultdict(dict)  # Adyacencia (grafo): nodo -> {vecino: peso}, sin aristas repetidas
         self.path_finder = PathFinder(self.nodes, self.connections)  # Nueva línea
         self.emergencies = []  # Cola de prioridad para emergencias
         self.emergency_registry = {}  # Registro de emergencias (emergency_id -> Emergency)
         self.zone_tree = {}  # Estructura para búsqueda por zonas
+        self.timeline = EmergencyTimeline()  # Emergencias ordenadas por timestamp (ver emergency_timeline.py)
         self.stats = {
             "total_emergencies": 0,
             "completed_emergencies": 0,
             "avg_response_time": 0
         }
+        self.journal = None  # Diario de eventos opcional (ver event_journal.py)
+        self.counters = NetworkCounters()  # Estadísticas de la red en O(1)
+        self.profiler = None  # Instrumentación opcional de despacho (ver instrumentation.py)
+        self.connectivity = ConnectivityIndex(self)  # Articulaciones y puentes (ver connectivity.py)
+        self.reachability = ReachabilityOracle(self)  # Componentes de nodos activos (union-find)
+        self.coverage = CoverageMap(self)  # Estación más cercana por recurso (ver coverage.py)
+        self.centrality = None  # Última centralidad calculada: ((sample, seed), puntuaciones)
+        self.topology_epoch = 0  # Aumenta con cada cambio que puede alterar las rutas
+        self.route_cache = RouteCache(route_cache_size) if route_cache_size else None
+    
+    def _topology_changed(self, event=None, node1_id=None, node2_id=None):
+        """
+        Avisa a los índices derivados que la topología o el estado de los nodos cambió
+        
+        Args:
+            event (str): "node" (nodo agregado), "connection" (conexión agregada),
+                         "shorter"/"longer" (cambio de peso de una conexión),
+                         "disconnect" (conexión eliminada), "failure" (nodo caído),
+                         "restore" (nodo restaurado), "stock" (recursos de un nodo)
+                         o None (cualquier otro cambio)
+            node1_id (str): Nodo afectado
+            node2_id (str): Segundo nodo de la conexión
+        """
+        if event == "stock":
+            self.coverage.stock_changed(node1_id)
+            return
+        self.centrality = None
+        if event != "node":  # Un nodo nuevo aún no tiene conexiones: no cambia ninguna ruta
+            self.topology_epoch += 1
+        if event == "shorter":  # El peso no cambia la conectividad
+            self.coverage.connection_added(node1_id, node2_id)
+            return
+        if event == "longer":
+            self.coverage.connection_lengthened(node1_id, node2_id)
+            return
+        self.connectivity.invalidate()
+        if event == "connection":
+            self.reachability.connect(node1_id, node2_id)
+            self.coverage.connection_added(node1_id, node2_id)
+        elif event == "node":
+            self.reachability.add_node(self.nodes[node1_id])
+            self.coverage.node_added(node1_id)
+        elif event == "restore":
+            self.reachability.restore(node1_id)
+            self.coverage.node_restored(node1_id)
+        elif event == "failure":
+            self.reachability.invalidate()
+            self.coverage.node_failed(node1_id)
+        elif event == "disconnect":
+            self.reachability.invalidate()
+            self.coverage.connection_lengthened(node1_id, node2_id)
+        else:
+            self.reachability.invalidate()
+            self.coverage.invalidate()
     
     def add_node(self, node):
         """
@@ -194,15 +320,27 @@ class LanSimulator:
         Args:
             node (LanNode): Nodo a agregar
         """
+        previous = self.nodes.get(node.node_id)
+        if previous is not None and previous.counters is self.counters:
+            self.counters.attach(previous, sign=-1)
+            previous.counters = None
         self.nodes[node.node_id] = node
+        node.counters = self.counters
+        self.counters.attach(node)
         # Inicializar la lista de adyacencia (GRafo) para este nodo
         if node.node_id not in self.connections:
-            self.connections[node.node_id] = []
+            self.connections[node.node_id] = {}
+        if previous is None:
+            self._topology_changed("node", node.node_id)
+        else:
+            self._topology_changed()  # Nodo reemplazado: sus recursos y estado pueden ser otros
     
     def add_connection(self, node1_id, node2_id, weight):
         """
         Agrega una conexión entre dos nodos
         
+        Si la conexión ya existe no se duplica: se conserva el menor de los dos pesos.
+        
         Args:
             node1_id (str): ID del primer nodo
             node2_id (str): ID del segundo nodo
@@ -211,10 +349,113 @@ class LanSimulator:
         # Verificar que ambos nodos existan
         if node1_id not in self.nodes or node2_id not in self.nodes:
             raise ValueError("Uno o ambos nodos no existen en la red")
+        self._check_weight(weight)
+        
+        current = self.connections[node1_id].get(node2_id)
+        if current is not None:
+            if weight < current:
+                self.update_connection_weight(node1_id, node2_id, weight)
+            return
         
         # Agregar la conexión en ambas direcciones (grafo no dirigido)
-        self.connections[node1_id].append((node2_id, weight))
-        self.connections[node2_id].append((node1_id, weight))
+        self.connections[node1_id][node2_id] = weight
+        self.connections[node2_id][node1_id] = weight
+        self._topology_changed("connection", node1_id, node2_id)
+    
+    def add_connections(self, connections):
+        """
+        Agrega conexiones en bloque, validando todos los nodos en una sola pasada
+        
+        Las conexiones repetidas (en la lista o ya existentes) conservan el menor peso.
+        
+        Args:
+            connections (list): Tuplas (node1_id, node2_id, weight)
+        
+        Raises:
+            ValueError: Si alguna conexión usa nodos que no existen o tiene un peso
+                        no válido (no se agrega ninguna)
+        """
+        nodes = self.nodes
+        missing = {node_id for node1_id, node2_id, _ in connections
+                   for node_id in (node1_id, node2_id) if node_id not in nodes}
+        if missing:
+            raise ValueError(f"Conexiones con nodos que no existen en la red: {sorted(missing)[:10]}")
+        for _, _, weight in connections:
+            self._check_weight(weight)
+        
+        adjacency = self.connections
+        for node1_id, node2_id, weight in connections:
+            neighbors = adjacency[node1_id]
+            current = neighbors.get(node2_id)
+            if current is None or weight < current:
+                neighbors[node2_id] = weight
+                adjacency[node2_id][node1_id] = weight
+        self._topology_changed()
+    
+    def has_connection(self, node1_id, node2_id):
+        """Indica en O(1) si existe una conexión entre dos nodos"""
+        return node2_id in self.connections.get(node1_id, ())
+    
+    def update_connection_weight(self, node1_id, node2_id, weight):
+        """
+        Cambia el peso (latencia) de una conexión existente
+        
+        Los mapas de cobertura se reparan de forma incremental: si la conexión
+        se acorta se propagan las nuevas distancias; si se alarga solo se
+        recalcula el subárbol de caminos más cortos que dependía de ella.
+        
+        Args:
+            node1_id (str): ID del primer nodo
+            node2_id (str): ID del segundo nodo
+            weight (float): Nuevo peso de la conexión
+        
+        Raises:
+            ValueError: Si la conexión no existe o el peso no es válido
+        """
+        old_weight = self._connection_weight(node1_id, node2_id)
+        self._check_weight(weight)
+        self.connections[node1_id][node2_id] = weight
+        self.connections[node2_id][node1_id] = weight
+        if weight < old_weight:
+            self._topology_changed("shorter", node1_id, node2_id)
+        elif weight > old_weight:
+            self._topology_changed("longer", node1_id, node2_id)
+    
+    def remove_connection(self, node1_id, node2_id):
+        """
+        Elimina la conexión entre dos nodos
+        
+        Args:
+            node1_id (str): ID del primer nodo
+            node2_id (str): ID del segundo nodo
+        
+        Raises:
+            ValueError: Si la conexión no existe
+        """
+        self._connection_weight(node1_id, node2_id)
+        del self.connections[node1_id][node2_id]
+        self.connections[node2_id].pop(node1_id, None)  # Ya no existe si era un lazo
+        self._topology_changed("disconnect", node1_id, node2_id)
+    
+    def _check_weight(self, weight):
+        """
+        Verifica que un peso sea un número finito y positivo
+        
+        Dijkstra, la reparación de los árboles de caminos más cortos (cobertura)
+        y la caché de rutas suponen pesos positivos: un peso negativo o NaN
+        daría rutas incorrectas sin ningún error.
+        """
+        if not (isinstance(weight, (int, float)) and weight > 0 and isfinite(weight)):
+            raise ValueError(f"El peso de una conexión debe ser un número positivo: {weight!r}")
+    
+    def _connection_weight(self, node1_id, node2_id):
+        """Peso de una conexión (ValueError si no existe)"""
+        if node1_id not in self.nodes or node2_id not in self.nodes:
+            raise ValueError("Uno o ambos nodos no existen en la red")
+        weight = self.connections[node1_id].get(node2_id)
+        if weight is None:
+            raise ValueError(f"No existe una conexión entre {node1_id} y {node2_id}")
+        return weight
     
     def add_emergency(self, emergency):
         """
@@ -225,6 +466,7 @@ class LanSimulator:
         """
         heapq.heappush(self.emergencies, emergency) # cola que atiende por orden de prioridad
         self.emergency_registry[emergency.emergency_id] = emergency
+        self.timeline.add(emergency)
         self.stats["total_emergencies"] += 1
         
         # Registrar en el árbol de zonas
@@ -232,6 +474,9 @@ class LanSimulator:
         if zone_key not in self.zone_tree: 
             self.zone_tree[zone_key] = []
         self.zone_tree[zone_key].append(emergency.emergency_id) #guarda en el diccionario
+        
+        if self.journal is not None:
+            self.journal.log_emergency(emergency)
     
     def _get_zone_key(self, location):
         """
@@ -264,6 +509,48 @@ class LanSimulator:
         return [self.emergency_registry[e_id] for e_id in self.zone_tree[zone_key] #Devuelve los detalles de las emergencias en las zonas, con sus identificadores
                 if e_id in self.emergency_registry] #Si el identificador esta, lo recupera y lo añade a la lista
     
+    def get_emergencies_between(self, start=None, end=None, emergency_type=None, status=None):
+        """
+        Obtiene las emergencias de un intervalo de tiempo, en O(log n + k)
+        
+        Args:
+            start (float): Inicio del intervalo (None = sin límite)
+            end (float): Fin del intervalo, incluido (None = sin límite)
+            emergency_type (str): Solo este tipo de emergencia (None = todos)
+            status (str): Solo este estado (None = todos)
+        
+        Returns:
+            list: Emergencias de la más antigua a la más reciente
+        """
+        return list(self.timeline.between(start, end, emergency_type, status))
+    
+    def count_emergencies_between(self, start=None, end=None, emergency_type=None, status=None):
+        """
+        Cuenta las emergencias de un intervalo de tiempo sin recorrerlas (O(log n))
+        
+        Returns:
+            int: Número de emergencias
+        """
+        return self.timeline.count_between(start, end, emergency_type, status)
+    
+    def get_oldest_emergency(self, emergency_type=None, status="PENDIENTE"):
+        """
+        Obtiene la emergencia más antigua de un tipo y estado
+        
+        Returns:
+            Emergency: La emergencia, o None si no hay ninguna
+        """
+        return self.timeline.oldest(emergency_type, status)
+    
+    def get_emergency_histogram(self, start, end, buckets, emergency_type=None, status=None):
+        """
+        Cuenta emergencias por intervalos iguales de [start, end) (para tableros)
+        
+        Returns:
+            list: Conteo de cada intervalo
+        """
+        return self.timeline.histogram(start, end, buckets, emergency_type, status)
+    
     def process_next_emergency(self):
         """
         Procesa la siguiente emergencia en la cola
@@ -274,6 +561,10 @@ class LanSimulator:
         if not self.emergencies:
             return None, None, None
         
+        profiler = self.profiler
+        if profiler is not None:
+            dispatch_start = perf_counter_ns()
+        
         # Obtener la emergencia de mayor prioridad
         emergency = heapq.heappop(self.emergencies)
         
@@ -284,51 +575,75 @@ class LanSimulator:
         )
         
         if nearest_node:
-            # Asignar la emergencia al nodo
-            emergency.assign_to_node(nearest_node.node_id)
-            
-            # Actualizar estadísticas del nodo
-            nearest_node.update_stats(
-                data_size=100,  # Simulación de datos transmitidos
-                incident_handled=True,
-                response_time=emergency.get_response_time()
-            )
-            
-            # Marcar la emergencia como completada
-            emergency.complete()
-            self.stats["completed_emergencies"] += 1
+            response_time = emergency.get_response_time()
+            self._complete_dispatch(emergency, nearest_node, response_time)
             
-            # Actualizar tiempo promedio de respuesta
-            total_times = sum([n.stats["response_times"] for n in self.nodes.values() if n.stats["response_times"]], [])
-            if total_times:
-                self.stats["avg_response_time"] = sum(total_times) / len(total_times)
+            if self.journal is not None:
+                self.journal.log_dispatch(emergency.emergency_id, nearest_node.node_id, response_time)
             
+            if profiler is not None:
+                profiler.record("dispatch", perf_counter_ns() - dispatch_start)
             return emergency, nearest_node, path
         
         # Si no se encontró un nodo adecuado, volver a poner la emergencia en la cola
         heapq.heappush(self.emergencies, emergency)
+        if profiler is not None:
+            profiler.record("dispatch", perf_counter_ns() - dispatch_start)
         return None, None, None
     
-    def _find_nearest_resource_node(self, location, required_resources):
-        """Versión para encontrar la ruta mas cercana"""
-        valid_nodes = [ # Se crea una tupla, en la que se cumplan las condiciones, de que el nodo este activo, y que tenga los recursos (ambulancias etc)
-            (node_id, node) for node_id, node in self.nodes.items()
-            if node.active and all(node.has_resource(r) for r in required_resources)
-        ]
-    
-        if not valid_nodes:
-            return None, None
+    def _complete_dispatch(self, emergency, node, response_time):
+        """
+        Aplica la decisión de despacho de una emergencia ya retirada de la cola
         
-        # Encontrar el nodo más cercano
-        nearest_node_id, nearest_node = min(
-            valid_nodes,
-            key=lambda item: self.path_finder.euclidean_distance(item[1].location, location)
+        Args:
+            emergency (Emergency): Emergencia despachada
+            node (LanNode): Nodo asignado
+            response_time (float): Tiempo de respuesta registrado
+        """
+        profiler = self.profiler
+        if profiler is not None:
+            start = perf_counter_ns()
+        
+        # Asignar la emergencia al nodo
+        emergency.assign_to_node(node.node_id)
+        
+        # Actualizar estadísticas del nodo
+        node.update_stats(
+            data_size=100,  # Simulación de datos transmitidos
+            incident_handled=True,
+            response_time=response_time
         )
+        
+        # Marcar la emergencia como completada
+        emergency.complete()
+        self.timeline.status_changed(emergency)
+        self.stats["completed_emergencies"] += 1
+        
+        # Actualizar tiempo promedio de respuesta (contadores incrementales, O(1))
+        self.stats["avg_response_time"] = self.counters.avg_response_time()
+        
+        if profiler is not None:
+            profiler.record("stats_update", perf_counter_ns() - start)
     
-        # Encontrar y validar nodo más cercano
+    def _find_nearest_resource_node(self, location, required_resources):
+        """Versión para encontrar la ruta mas cercana"""
+        # Encontrar y validar nodo más cercano a la emergencia
         target_node_id = self._find_nearest_node_id(location)
         if not target_node_id:
             return None, None
+        
+        profiler = self.profiler
+        if profiler is not None:
+            start = perf_counter_ns()
+        
+        # Estación más cercana por la red con todos los recursos: consulta O(1) al
+        # mapa de cobertura (las estaciones inalcanzables nunca son dueñas de la celda)
+        nearest_node_id, _ = self.coverage.nearest_station(required_resources, target_node_id)
+        if profiler is not None:
+            profiler.record("candidate_filter", perf_counter_ns() - start)
+        if nearest_node_id is None:
+            return None, None
+        nearest_node = self.nodes[nearest_node_id]
 
         # Calcular ruta
         _, path = self.find_shortest_path(nearest_node_id, target_node_id)
@@ -339,24 +654,79 @@ class LanSimulator:
 
     def _find_nearest_node_id(self, location):
         """Helper para encontrar nodo más cercano a una ubicación"""
+        profiler = self.profiler
+        if profiler is not None:
+            start = perf_counter_ns()
+        
         active_nodes = [(node_id, node) for node_id, node in self.nodes.items() if node.active]
         if not active_nodes:
             return None #Filtra los nodos activos
         
-        return min(
+        nearest_id = min(
             active_nodes,
             key=lambda item: self.path_finder.euclidean_distance(item[1].location, location)
         )[0] #Encuentra el nodo a la menor distacia con la funcion euclidean
+        
+        if profiler is not None:
+            profiler.record("nearest_node", perf_counter_ns() - start)
+        return nearest_id
     
     def find_shortest_path(self, start_node_id, end_node_id):
         """Versión de Dijkstra(metodo que calcula la distancia mas corta) con heap(estructura que permite organizar los nodos en orden de prioridad)"""
         if start_node_id not in self.nodes or end_node_id not in self.nodes:
             raise ValueError("Uno o ambos nodos no existen en la red")
+        
+        # Caché LRU de rutas para la época actual de la topología
+        cache = self.route_cache
+        if cache is not None:
+            cached = cache.get(start_node_id, end_node_id, self.topology_epoch)
+            if cached is not None:
+                distance, path = cached
+                return (int, []) if distance is None else (distance, path)
+        
+        # Oráculo de alcanzabilidad: evitar explorar todo un lado de la red para nada
+        if (start_node_id != end_node_id and self.nodes[start_node_id].active
+                and not self.reachability.reachable(start_node_id, end_node_id)):
+            return int, []
+        
+        profiler = self.profiler
+        if profiler is not None:
+            start = perf_counter_ns()
 
         # Inicialización
         distances = {node_id: inf for node_id in self.nodes}#inicializa todas las distancias en infinito
         distances[start_node_id] = 0 #La distancia del nodo inicial es 0
         previous_nodes = {node_id: None for node_id in self.nodes}#Almacena el nodo previo en el camino mas corto
+        
+        if profiler is None:
+            self._dijkstra(start_node_id, end_node_id, distances, previous_nodes)
+        else:
+            # Copia del ciclo con contadores: sin profiler no se paga ni un incremento
+            pushes, pops, edges_scanned = self._dijkstra_counted(start_node_id, end_node_id,
+                                                                 distances, previous_nodes)
+            profiler.record("dijkstra", perf_counter_ns() - start)
+            profiler.record_route(pushes, pops, edges_scanned)
+    
+        # Reconstrucción del camino
+        path = []
+        current = end_node_id
+    
+        if distances[end_node_id] == inf: #Si la ruta es innacesible regresa una ruta vacia
+            if cache is not None:
+                cache.put(start_node_id, end_node_id, self.topology_epoch, None, ())
+            return int, []
+        
+        while current:
+            path.append(current) # Agrega cada nodo en el camino desde el destino hasta el inicio
+            current = previous_nodes[current]
+        
+        path.reverse()#Para que vaya de inicio a destino
+        if cache is not None:
+            cache.put(start_node_id, end_node_id, self.topology_epoch, distances[end_node_id], path)
+        return distances[end_node_id], path
+    
+    def _dijkstra(self, start_node_id, end_node_id, distances, previous_nodes):
+        """Ciclo de Dijkstra: completa distances y previous_nodes hasta llegar al destino"""
         heap = [] #Estructura monticulo para manejar los nodos a evaluar
         heapq.heappush(heap, (0, start_node_id)) # Agrega el nodo inicial con distancia 0 al montículo.
     
@@ -369,7 +739,7 @@ class LanSimulator:
             if current_dist > distances[current_node]:
                 continue
             #Busca el camino mas corto en una red de conexiones
-            for neighbor, weight in self.connections[current_node]: #Compara las distancias entre los nodos, si la distancia es menor que la anterior se guarda
+            for neighbor, weight in self.connections[current_node].items(): #Compara las distancias entre los nodos, si la distancia es menor que la anterior se guarda
                 if not self.nodes[neighbor].active:
                     continue
                 
@@ -379,19 +749,42 @@ class LanSimulator:
                     previous_nodes[neighbor] = current_node
                     heapq.heappush(heap, (distance, neighbor))
     
-        # Reconstrucción del camino
-        path = []
-        current = end_node_id
-    
-        if distances[end_node_id] == inf: #Si la ruta es innacesible regresa una ruta vacia
-            return int, []
+    def _dijkstra_counted(self, start_node_id, end_node_id, distances, previous_nodes):
+        """
+        Mismo ciclo que _dijkstra pero contando el trabajo de la consulta
         
-        while current:
-            path.append(current) # Agrega cada nodo en el camino desde el destino hasta el inicio
-            current = previous_nodes[current]
+        Solo se usa con un profiler conectado; cualquier cambio en _dijkstra
+        debe repetirse aquí.
         
-        path.reverse()#Para que vaya de inicio a destino
-        return distances[end_node_id], path
+        Returns:
+            tuple: (inserciones, extracciones del montículo, aristas revisadas)
+        """
+        pushes = pops = edges_scanned = 0
+        heap = [(0, start_node_id)]
+        pushes += 1
+        
+        while heap:
+            current_dist, current_node = heapq.heappop(heap)
+            pops += 1
+            
+            if current_node == end_node_id:
+                break
+            
+            if current_dist > distances[current_node]:
+                continue
+            adjacency = self.connections[current_node]
+            edges_scanned += len(adjacency)
+            for neighbor, weight in adjacency.items():
+                if not self.nodes[neighbor].active:
+                    continue
+                
+                distance = current_dist + weight
+                if distance < distances[neighbor]:
+                    distances[neighbor] = distance
+                    previous_nodes[neighbor] = current_node
+                    heapq.heappush(heap, (distance, neighbor))
+                    pushes += 1
+        return pushes, pops, edges_scanned
     
     def simulate_node_failure(self, node_id):
         """
@@ -399,12 +792,32 @@ class LanSimulator:
         
         Args:
             node_id (str): ID del nodo que falla
+        
+        Returns:
+            list: Nodos que quedaron aislados de la parte principal de la red, o
+                  None si el índice de conectividad estaba desactualizado (por
+                  ejemplo, en una cascada de fallas); get_failure_impact lo
+                  calcula bajo demanda
         """
         if node_id not in self.nodes:
             raise ValueError(f"El nodo {node_id} no existe en la red")
         
+        # Impacto precalculado (puntos de articulación): O(k) con k nodos aislados.
+        # Si un cambio anterior dejó el índice desactualizado no se recalcula aquí:
+        # sería un Tarjan completo O(V + E) en cada falla de una cascada
+        isolated = None
+        if not self.connectivity.dirty:
+            isolated = self.connectivity.unreachable_if_failed(node_id)
+        
         self.nodes[node_id].deactivate()
-        print(f"El nodo {node_id} ha fallado. Recalculando rutas...")
+        self._topology_changed("failure", node_id)
+        if self.journal is not None:
+            self.journal.log_node_failure(node_id)
+        print(f"El nodo {node_id} ha fallado.")
+        if isolated:
+            print(f"  {len(isolated)} nodos quedaron aislados: {', '.join(isolated[:10])}"
+                  f"{'...' if len(isolated) > 10 else ''}")
+        return isolated
     
     def restore_node(self, node_id):
         """
@@ -417,47 +830,389 @@ class LanSimulator:
             raise ValueError(f"El nodo {node_id} no existe en la red")
         
         self.nodes[node_id].activate()
+        self._topology_changed("restore", node_id)
+        if self.journal is not None:
+            self.journal.log_node_restore(node_id)
         print(f"El nodo {node_id} ha sido restaurado.")
     
-    def load_topology_from_file(self, filename):
+    def notify_resources_changed(self, node_id):
+        """
+        Avisa que cambiaron los recursos de un nodo que ya está en la red
+        (por ejemplo, con add_resource o use_resource), para reparar su celda de cobertura
+        
+        Args:
+            node_id (str): ID del nodo
+        """
+        if node_id not in self.nodes:
+            raise ValueError(f"El nodo {node_id} no existe en la red")
+        self._topology_changed("stock", node_id)
+    
+    def get_failure_impact(self, node_id):
+        """
+        Consulta qué pasaría si un nodo falla, sin desactivarlo
+        
+        Args:
+            node_id (str): ID del nodo
+        
+        Returns:
+            dict: articulation (bool) y unreachable (nodos que quedarían aislados)
+        """
+        if node_id not in self.nodes:
+            raise ValueError(f"El nodo {node_id} no existe en la red")
+        return {
+            "articulation": self.connectivity.is_articulation_point(node_id),
+            "unreachable": self.connectivity.unreachable_if_failed(node_id)
+        }
+    
+    def enable_profiling(self):
+        """
+        Activa la instrumentación de las fases de despacho
+        
+        Returns:
+            DispatchProfiler: Perfilador que acumula las mediciones
+        """
+        if self.profiler is None:
+            self.profiler = DispatchProfiler()
+        return self.profiler
+    
+    def disable_profiling(self):
+        """Desactiva la instrumentación (las mediciones se descartan)"""
+        self.profiler = None
+    
+    def get_profile_report(self):
+        """
+        Obtiene el reporte de instrumentación
+        
+        Returns:
+            dict: Resumen por fase y por consulta de ruta, o None si está desactivada
+        """
+        return self.profiler.report() if self.profiler is not None else None
+    
+    def attach_journal(self, journal):
+        """
+        Asocia un diario de eventos que registrará las mutaciones del simulador
+        
+        Args:
+            journal (EventJournal): Diario abierto (None para desactivarlo)
+        """
+        self.journal = journal
+        if journal is not None:
+            journal.simulator = self
+    
+    def capture_state(self):
+        """
+        Copia superficial de las partes mutables del estado
+        
+        Es más barata que snapshot_state: copia diccionarios y listas en C y de
+        los response_times (que solo crecen) guarda el largo. snapshot_state
+        puede armar el snapshot desde la captura en otro hilo mientras el
+        simulador sigue cambiando (ver la compactación en event_journal.py).
+        
+        Returns:
+            tuple: Captura que acepta snapshot_state
+        """
+        nodes = [(node, node.active, [dict(resource) for resource in node.resources],
+                  node.stats["data_transmitted"], node.stats["incidents_handled"],
+                  node.stats["response_times"], len(node.stats["response_times"]))
+                 for node in self.nodes.values()]
+        connections = {node_id: conns.copy() for node_id, conns in self.connections.items()}
+        emergencies = [(e, e.status, e.assigned_node) for e in self.emergency_registry.values()]
+        pending = [e.emergency_id for e in self.emergencies]
+        journal_lsn = self.journal.last_lsn if self.journal is not None else 0
+        return nodes, connections, emergencies, pending, dict(self.stats), journal_lsn
+    
+    def snapshot_state(self, capture=None):
+        """
+        Obtiene el estado completo del simulador como diccionario serializable
+        
+        Args:
+            capture (tuple): Captura de capture_state (None = el estado actual)
+        
+        Returns:
+            dict: Nodos, conexiones, emergencias, cola pendiente y estadísticas
+        """
+        if capture is None:
+            capture = self.capture_state()
+        captured_nodes, captured_connections, captured_emergencies, pending, stats, journal_lsn = capture
+        
+        nodes = []
+        for node, active, resources, data_transmitted, incidents_handled, response_times, count in captured_nodes:
+            nodes.append({
+                "id": node.node_id,
+                "name": node.name,
+                "type": node.node_type,
+                "location": list(node.location),
+                "resources": resources,
+                "active": active,
+                "stats": {
+                    "data_transmitted": data_transmitted,
+                    "incidents_handled": incidents_handled,
+                    "response_times": response_times[:count]
+                }
+            })
+        
+        # Cada conexión no dirigida se guarda una sola vez (orden de inserción de nodos)
+        order = {node_id: i for i, node_id in enumerate(captured_connections)}
+        connections = [
+            {"node1": node1_id, "node2": node2_id, "weight": weight}
+            for node1_id, conns in captured_connections.items()
+            for node2_id, weight in conns.items()
+            if order[node1_id] < order[node2_id]
+        ]
+        
+        emergencies = [
+            {
+                "id": e.emergency_id,
+                "type": e.emergency_type,
+                "location": list(e.location),
+                "timestamp": e.timestamp,
+                "status": status,
+                "assigned_node": assigned_node
+            }
+            for e, status, assigned_node in captured_emergencies
+        ]
+        
+        return {
+            "nodes": nodes,
+            "connections": connections,
+            "emergencies": emergencies,
+            "pending": pending,
+            "stats": stats,
+            "journal_lsn": journal_lsn
+        }
+    
+    def restore_state(self, state):
+        """
+        Reemplaza el estado del simulador por el de un snapshot
+        
+        Args:
+            state (dict): Estado generado por snapshot_state
+        """
+        self.nodes.clear()
+        self.counters = NetworkCounters()
+        self.connections.clear()
+        self._topology_changed()
+        self.emergency_registry.clear()
+        self.zone_tree.clear()
+        
+        for node_data in state["nodes"]:
+            node = LanNode(node_data["id"], node_data["name"], node_data["type"],
+                           tuple(node_data["location"]))
+            for resource in node_data["resources"]:
+                node.add_resource(resource["type"], resource["count"])
+            node.active = node_data["active"]
+            node.load_stats(node_data["stats"])
+            self.add_node(node)
+        
+        for connection in state["connections"]:
+            self.add_connection(connection["node1"], connection["node2"], connection["weight"])
+        
+        for data in state["emergencies"]:
+            emergency = Emergency(data["id"], data["type"], tuple(data["location"]), data["timestamp"])
+            emergency.status = data["status"]
+            emergency.assigned_node = data["assigned_node"]
+            self.emergency_registry[emergency.emergency_id] = emergency
+            self.zone_tree.setdefault(self._get_zone_key(emergency.location), []).append(emergency.emergency_id)
+        
+        self.timeline.rebuild(self.emergency_registry.values())
+        self.emergencies = [self.emergency_registry[e_id] for e_id in state["pending"]]
+        heapq.heapify(self.emergencies)
+        self.stats = dict(state["stats"])
+    
+    def save_snapshot(self, filename):
+        """
+        Guarda un snapshot del simulador de forma atómica
+        
+        Args:
+            filename (str): Ruta del archivo de snapshot
+        """
+        if self.journal is not None:
+            self.journal.commit()
+        write_snapshot(filename, self.snapshot_state())
+    
+    def recover_from_journal(self, snapshot_file, journal_file):
+        """
+        Recupera el estado tras una caída: carga el último snapshot y reproduce
+        los eventos del diario posteriores a él
+        
+        Args:
+            snapshot_file (str): Ruta del snapshot (puede no existir)
+            journal_file (str): Ruta del diario de eventos
+        
+        Returns:
+            int: Número de eventos reproducidos
+        """
+        snapshot_lsn = 0
+        if os.path.exists(snapshot_file):
+            with open(snapshot_file, 'r') as file:
+                state = json.load(file)
+            self.restore_state(state)
+            snapshot_lsn = state.get("journal_lsn", 0)
+        
+        # No registrar de nuevo los eventos que se están reproduciendo
+        journal, self.journal = self.journal, None
+        replayed = 0
+        try:
+            for segment in (journal_file + ".old", journal_file):
+                for event_type, lsn, fields in read_events(segment):
+                    if lsn <= snapshot_lsn:
+                        continue
+                    self._replay_event(event_type, fields)
+                    snapshot_lsn = lsn
+                    replayed += 1
+        finally:
+            self.journal = journal
+        return replayed
+    
+    def _replay_event(self, event_type, fields):
+        """Aplica un evento del diario sobre el estado actual"""
+        if event_type == EV_EMERGENCY:
+            emergency_id, emergency_type, location, timestamp = fields
+            self.add_emergency(Emergency(emergency_id, emergency_type, location, timestamp))
+        elif event_type == EV_NODE_FAILURE:
+            self.nodes[fields[0]].deactivate()
+            self._topology_changed("failure", fields[0])
+        elif event_type == EV_NODE_RESTORE:
+            self.nodes[fields[0]].activate()
+            self._topology_changed("restore", fields[0])
+        elif event_type == EV_DISPATCH:
+            emergency_id, node_id, response_time = fields
+            emergency = self.emergency_registry.get(emergency_id)
+            if emergency is None or emergency.status != "PENDIENTE":
+                return  # Despacho repetido (por ejemplo, ya incluido en el snapshot): se ignora
+            # Normalmente es la cima del montículo; si no, se retira de donde esté
+            if self.emergencies and self.emergencies[0] is emergency:
+                heapq.heappop(self.emergencies)
+            elif emergency in self.emergencies:
+                self.emergencies.remove(emergency)
+                heapq.heapify(self.emergencies)
+            else:
+                return
+            self._complete_dispatch(emergency, self.nodes[node_id], response_time)
+    
+    def load_topology_from_file(self, filename, progress=None):
         """
         Carga la topología de la red desde un archivo JSON
         
         Args:
             filename (str): Ruta al archivo de topología
+            progress (callable): Función opcional progress(bytes_leidos, bytes_totales, nodos, conexiones)
         """
         try:
-            with open(filename, 'r') as file: #Abre el archivo como modo lectura
-                data = json.load(file) #Convierte el contenido de data en un diccionario python
-            
-            # Cargar nodos
-            for node_data in data.get("nodes", []):
+            if is_topology_binary(filename):
+                num_nodes, num_connections = self.load_topology_binary(filename)
+            else:
+                num_nodes, num_connections = self.load_topology_streaming(filename, progress)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            print(f"Error al cargar la topología: {e}")
+            return
+        
+        print(f"Topología cargada correctamente desde {filename}")
+        print(f"Nodos: {num_nodes}, Conexiones: {num_connections}")
+    
+    def load_topology_streaming(self, filename, progress=None, batch_size=65536):
+        """
+        Carga una topología JSON de forma incremental (apto para archivos de varios GB)
+        
+        Los nodos se crean a medida que se leen y las conexiones se insertan por
+        lotes con una sola pasada de validación por lote (ver add_connections).
+        
+        Args:
+            filename (str): Ruta al archivo de topología
+            progress (callable): Función opcional progress(bytes_leidos, bytes_totales, nodos, conexiones)
+            batch_size (int): Conexiones acumuladas antes de insertarlas
+        
+        Returns:
+            tuple: (nodos cargados, conexiones cargadas)
+        
+        Raises:
+            OSError: Si el archivo no se puede leer
+            ValueError: Si el JSON es inválido o una conexión usa nodos inexistentes
+            KeyError: Si a un nodo o conexión le falta un campo obligatorio
+        """
+        total_bytes = os.path.getsize(filename)
+        num_nodes = 0
+        num_connections = 0
+        pending = []  # Conexiones leídas que aún no se insertan
+        defer_connections = None
+        last_report = 0
+        
+        for key, item, bytes_read in iter_topology(filename):
+            if key == "nodes":
                 node = LanNode(
-                    node_id=node_data["id"],
-                    name=node_data["name"],
-                    node_type=node_data["type"],
-                    location=tuple(node_data["location"])
+                    node_id=sys.intern(item["id"]),
+                    name=item["name"],
+                    node_type=sys.intern(item["type"]),
+                    location=tuple(item["location"])
                 )
-                
-                # Agregar recursos al nodo
-                for resource in node_data.get("resources", []):
-                    node.add_resource(resource["type"], resource["count"])
-                
+                for resource in item.get("resources", []):
+                    node.add_resource(sys.intern(resource["type"]), resource["count"])
                 self.add_node(node)
+                num_nodes += 1
+            else:
+                if defer_connections is None:
+                    # Si las conexiones aparecen antes que los nodos, se insertan al final
+                    defer_connections = num_nodes == 0
+                pending.append((sys.intern(item["node1"]), sys.intern(item["node2"]), item["weight"]))
+                if len(pending) >= batch_size and not defer_connections:
+                    self.add_connections(pending)
+                    num_connections += len(pending)
+                    pending = []
             
-            # Cargar conexiones
-            for connection in data.get("connections", []):
-                self.add_connection(
-                    connection["node1"], 
-                    connection["node2"], 
-                    connection["weight"]
-                )
-            
-            print(f"Topología cargada correctamente desde {filename}")
-            print(f"Nodos: {len(self.nodes)}, Conexiones: {sum(len(conns) for conns in self.connections.values()) // 2}")
+            if progress is not None and bytes_read - last_report >= (1 << 20):
+                last_report = bytes_read
+                progress(bytes_read, total_bytes, num_nodes, num_connections)
         
-        except Exception as e:
-            print(f"Error al cargar la topología: {e}")
+        self.add_connections(pending)
+        num_connections += len(pending)
+        if progress is not None:
+            progress(total_bytes, total_bytes, num_nodes, num_connections)
+        return num_nodes, num_connections
+    
+    def export_topology_binary(self, filename="topology.lantopo"):
+        """
+        Exporta la topología al formato binario mapeable en memoria (ver topology_binary.py)
+        
+        Args:
+            filename (str): Nombre del archivo de salida
+        
+        Returns:
+            tuple: (nodos, conexiones) exportados
+        """
+        return write_topology_binary(self, filename)
+    
+    def load_topology_binary(self, filename):
+        """
+        Carga una topología binaria sin analizar texto
+        
+        Para enrutar sin crear ningún objeto LanNode puede usarse directamente
+        MappedTopology(filename).find_shortest_path.
+        
+        Args:
+            filename (str): Archivo generado por export_topology_binary
+        
+        Returns:
+            tuple: (nodos cargados, conexiones cargadas)
+        """
+        topology = MappedTopology(filename)
+        try:
+            node_ids = [sys.intern(topology.node_id(i)) for i in range(len(topology))]
+            offsets, targets, weights = topology.adj_offsets, topology.adj_targets, topology.adj_weights
+            connections = []
+            for i, node_id in enumerate(node_ids):
+                node = LanNode(node_id, topology.node_name(i), topology.node_type(i), topology.location(i))
+                node.resources = topology.resources(i)
+                node.active = bool(topology.active[i])
+                self.add_node(node)
+                start, end = offsets[i], offsets[i + 1]
+                # Cada conexión no dirigida una sola vez (k >= i): un lazo n1-n1 cuenta como una
+                connections.extend((node_id, node_ids[k], weight)
+                                   for k, weight in zip(targets[start:end], weights[start:end]) if k >= i)
+            # Mismo camino que las demás cargas: conexiones repetidas conservan el menor peso
+            self.add_connections(connections)
+            return len(node_ids), len(connections)
+        finally:
+            topology.close()
     
     def generate_random_topology(self, num_nodes=10, connection_density=0.3):
         """
@@ -512,7 +1267,7 @@ class LanSimulator:
             node2 = random.choice(node_ids)
             
             # Evitar conexiones a sí mismo y conexiones duplicadas
-            if node1 != node2 and not any(n == node2 for n, _ in self.connections[node1]):
+            if node1 != node2 and not self.has_connection(node1, node2):
                 weight = random.uniform(1, 10)
                 self.add_connection(node1, node2, weight)
                 connections_made += 1
@@ -539,55 +1294,122 @@ class LanSimulator:
         self.add_emergency(emergency)
         return emergency
     
-    def get_network_statistics(self):
+    def set_route_cache_size(self, size):
+        """
+        Cambia el tamaño de la caché de rutas
+        
+        Args:
+            size (int): Rutas a guardar (0 desactiva la caché)
+        """
+        if not size:
+            self.route_cache = None
+        elif self.route_cache is None:
+            self.route_cache = RouteCache(size)
+        else:
+            self.route_cache.resize(size)
+    
+    def get_route_cache_stats(self):
+        """
+        Contadores de la caché de rutas
+        
+        Returns:
+            dict: Tamaño, aciertos, fallos y desalojos (None si la caché está desactivada)
+        """
+        if self.route_cache is None:
+            return None
+        return self.route_cache.stats()
+    
+    def get_centrality(self, processes=None, sample=None, seed=None):
+        """
+        Centralidad de intermediación de los nodos activos (ver centrality.py)
+        
+        El resultado se guarda hasta el siguiente cambio de topología.
+        
+        Args:
+            processes (int): Procesos para repartir las fuentes (None = núcleos disponibles)
+            sample (int): Fuentes muestreadas (modo aproximado); None = exacto, salvo
+                          en redes de más de CENTRALITY_EXACT_LIMIT nodos activos
+            seed (int): Semilla de la muestra
+        
+        Returns:
+            dict: {node_id: puntuación normalizada}
+        """
+        if sample is None and self.counters.active_nodes > self.CENTRALITY_EXACT_LIMIT:
+            sample, seed = self.CENTRALITY_SAMPLE, 0 if seed is None else seed
+        key = (sample, seed)
+        if self.centrality is None or self.centrality[0] != key:
+            self.centrality = (key, betweenness_centrality(self, processes, sample, seed))
+        return self.centrality[1]
+    
+    def get_network_statistics(self, centrality=False, top=5):
         """
         Obtiene estadísticas de la red
         
+        Args:
+            centrality (bool): Incluir el ranking de routers y centrales por centralidad
+                               de intermediación (se calcula si la topología cambió)
+            top (int): Tamaño del ranking
+        
         Returns:
             dict: Estadísticas de la red
         """
-        active_nodes = sum(1 for node in self.nodes.values() if node.active)
-        total_data = sum(node.stats["data_transmitted"] for node in self.nodes.values())
+        counters = self.counters  # Mantenidos por los nodos: no se recorre la red
         
-        return {
-            "total_nodes": len(self.nodes),
-            "active_nodes": active_nodes,
+        stats = {
+            "total_nodes": counters.total_nodes,
+            "active_nodes": counters.active_nodes,
             "total_emergencies": self.stats["total_emergencies"],
             "completed_emergencies": self.stats["completed_emergencies"],
             "pending_emergencies": len(self.emergencies),
             "avg_response_time": self.stats["avg_response_time"],
-            "total_data_transmitted": total_data
+            "total_data_transmitted": counters.total_data_transmitted
         }
+        if self.route_cache is not None:
+            stats["route_cache_hits"] = self.route_cache.hits
+            stats["route_cache_misses"] = self.route_cache.misses
+            stats["route_cache_evictions"] = self.route_cache.evictions
+        if centrality:
+            stats["critical_nodes"] = rank_nodes(self, self.get_centrality(), top=top)
+        return stats
+    
+    def memory_report(self):
+        """
+        Desglose de memoria del simulador por estructura y por tipo de objeto
+        
+        Returns:
+            dict: Ver memory_report.memory_report
+        """
+        return memory_report(self)
     
-    def export_topology_to_graphviz(self, filename="topology.dot"):
+    def export_topology_to_graphviz(self, filename="topology.dot", zone=None, center=None, hops=1,
+                                    failed_only=False, fmt="dot"):
         """
-        Exporta la topología a formato Graphviz DOT
+        Exporta la topología a formato Graphviz DOT (o GraphML / lista de aristas)
+        
+        La escritura es incremental: cada conexión se emite una sola vez sin
+        guardar un conjunto de conexiones ya escritas (ver topology_export.py).
         
         Args:
             filename (str): Nombre del archivo de salida
+            zone (str | tuple): Exportar solo los nodos de esta zona
+            center (str): Exportar solo los nodos a `hops` saltos de este nodo
+            hops (int): Saltos para center y failed_only
+            failed_only (bool): Exportar solo los nodos caídos y su vecindario
+            fmt (str): "dot", "graphml" o "edgelist"
         """
-        with open(filename, 'w') as file: #Abre un archivo en modo escritura
-            file.write("graph LAN {\n")#Define el tipo de grafo, no dirigido
-            file.write("  node [shape=circle];\n") # Todos los nodos los deja en circulos
-            
-            # Escribir nodos
-            for node_id, node in self.nodes.items():
-                color = "green" if node.active else "red" #Color del nodo segun si esta activo o desactivado
-                file.write(f'  "{node_id}" [label="{node.name}\\n{node.node_type}", color={color}];\n')
-            
-            # Escribir conexiones
-            connections_added = set()
-            for node1_id, connections in self.connections.items():
-                for node2_id, weight in connections:
-                    # Evitar duplicados, crea un set, si la conexion no ha sido agregada, la agrega con su peso
-                    if (node1_id, node2_id) not in connections_added and (node2_id, node1_id) not in connections_added:
-                        file.write(f'  "{node1_id}" -- "{node2_id}" [label="{weight:.2f}"];\n')
-                        connections_added.add((node1_id, node2_id))
-            
-            file.write("}\n") #Cierra el archivo
+        selected = None
+        if zone is not None:
+            selected = nodes_in_zone(self, zone)
+        elif center is not None:
+            selected = nodes_within_hops(self, [center], hops)
+        elif failed_only:
+            selected = failed_neighbourhood(self, hops)
+        
+        exported = export_topology(self, filename, fmt, selected)
         
-        print(f"Topología exportada a {filename}")
-        print("Para generar una imagen, ejecute: dot -Tpng topology.dot -o topology.png")
+        print(f"Topología exportada a {filename} ({exported} nodos)")
+        if fmt == "dot":
+            print(f"Para generar una imagen, ejecute: dot -Tpng {filename} -o topology.png")
 
 
 # Clase CLI para la interfaz de usuario
@@ -611,8 +1433,11 @@ class LanSimulatorCLI:
         print("7. Simular falla de nodo")
         print("8. Restaurar nodo")
         print("9. Mostrar estadísticas")
-        print("10. Exportar topología a Graphviz")
+        print("10. Exportar topología (Graphviz, GraphML o lista de aristas)")
         print("11. Simular múltiples emergencias")
+        print("12. Instrumentación de despacho")
+        print("13. Modificar o eliminar conexión")
+        print("14. Mostrar nodos críticos (centralidad)")
         print("0. Salir")
         print("==========================================")
     
@@ -647,6 +1472,12 @@ class LanSimulatorCLI:
                     self.export_topology()
                 elif choice == "11":
                     self.simulate_multiple_emergencies()
+                elif choice == "12":
+                    self.dispatch_profiling()
+                elif choice == "13":
+                    self.edit_connection()
+                elif choice == "14":
+                    self.show_critical_nodes()
                 elif choice == "0":
                     self.running = False
                     print("¡Gracias por usar el simulador!")
@@ -659,7 +1490,12 @@ class LanSimulatorCLI:
     def load_topology(self):
         """Carga la topología desde un archivo"""
         filename = input("Ingrese el nombre del archivo de topología: ")
-        self.simulator.load_topology_from_file(filename)
+        self.simulator.load_topology_from_file(filename, progress=self._show_load_progress)
+    
+    def _show_load_progress(self, bytes_read, total_bytes, num_nodes, num_connections):
+        """Muestra el avance de la carga de una topología grande"""
+        percent = 100 * bytes_read / total_bytes if total_bytes else 100
+        print(f"  Cargando... {percent:5.1f}% ({num_nodes} nodos, {num_connections} conexiones)")
     
     def generate_topology(self):
         """Genera una topología aleatoria"""
@@ -716,6 +1552,23 @@ class LanSimulatorCLI:
         except Exception as e:
             print(f"Error: {e}")
     
+    def edit_connection(self):
+        """Cambia el peso de una conexión o la elimina"""
+        try:
+            node1_id = input("Ingrese ID del primer nodo: ")
+            node2_id = input("Ingrese ID del segundo nodo: ")
+            weight = input("Nuevo peso (vacío para eliminar la conexión): ")
+            
+            if weight.strip():
+                self.simulator.update_connection_weight(node1_id, node2_id, float(weight))
+                print(f"Conexión entre {node1_id} y {node2_id} actualizada con éxito.")
+            else:
+                self.simulator.remove_connection(node1_id, node2_id)
+                print(f"Conexión entre {node1_id} y {node2_id} eliminada.")
+        
+        except ValueError as e:
+            print(f"Error: {e}")
+    
     def simulate_emergency(self):
         """Simula una emergencia aleatoria"""
         emergency = self.simulator.generate_random_emergency()
@@ -797,13 +1650,39 @@ class LanSimulatorCLI:
             print(f"    * Datos transmitidos: {node.stats['data_transmitted']} unidades")
             print(f"    * Incidentes manejados: {node.stats['incidents_handled']}")
             if node.stats['response_times']:
-                avg_time = sum(node.stats['response_times']) / len(node.stats['response_times'])
-                print(f"    * Tiempo promedio de respuesta: {avg_time:.2f} segundos")
+                print(f"    * Tiempo promedio de respuesta: {node.get_avg_response_time():.2f} segundos")
+    
+    def show_critical_nodes(self):
+        """Muestra los routers y centrales más críticos (calcula la centralidad, O(V·E))"""
+        stats = self.simulator.get_network_statistics(centrality=True)
+        if not stats["critical_nodes"]:
+            print("No hay routers ni centrales activos.")
+            return
+        print("\nRouters y centrales más críticos (centralidad de intermediación):")
+        for node_id, score in stats["critical_nodes"]:
+            print(f"  - {node_id}: {score:.4f}")
     
     def export_topology(self):
         """Exporta la topología a formato Graphviz"""
         filename = input("Ingrese el nombre del archivo de salida (por defecto: topology.dot): ") or "topology.dot"
-        self.simulator.export_topology_to_graphviz(filename)
+        fmt = input("Formato (dot, graphml, edgelist) [dot]: ").strip().lower() or "dot"
+        scope = input("Exportar (1) toda la red, (2) una zona, (3) vecindad de un nodo, (4) nodos caídos [1]: ").strip()
+        
+        try:
+            if scope == "2":
+                x = float(input("Coordenada X dentro de la zona: "))
+                y = float(input("Coordenada Y dentro de la zona: "))
+                self.simulator.export_topology_to_graphviz(filename, zone=(x, y), fmt=fmt)
+            elif scope == "3":
+                center = input("ID del nodo central: ")
+                hops = int(input("Número de saltos: "))
+                self.simulator.export_topology_to_graphviz(filename, center=center, hops=hops, fmt=fmt)
+            elif scope == "4":
+                self.simulator.export_topology_to_graphviz(filename, failed_only=True, fmt=fmt)
+            else:
+                self.simulator.export_topology_to_graphviz(filename, fmt=fmt)
+        except ValueError as e:
+            print(f"Error: {e}")
     
     def simulate_multiple_emergencies(self):
         """Simula múltiples emergencias y las procesa"""
@@ -833,6 +1712,23 @@ class LanSimulatorCLI:
         except ValueError:
             print("Error: Ingrese un número válido de emergencias.")
             
+    def dispatch_profiling(self):
+        """Activa, muestra o desactiva la instrumentación de despacho"""
+        if self.simulator.profiler is None:
+            if input("La instrumentación está desactivada. ¿Activarla? (si/no): ").lower() == "si":
+                self.simulator.enable_profiling()
+                print("Instrumentación activada.")
+            return
+        
+        print("\n===== INSTRUMENTACIÓN DE DESPACHO =====")
+        print(self.simulator.profiler.format_report())
+        action = input("\n¿(r)einiciar mediciones, (d)esactivar o Enter para volver?: ").lower()
+        if action == "r":
+            self.simulator.profiler.reset()
+        elif action == "d":
+            self.simulator.disable_profiling()
+            print("Instrumentación desactivada.")
+    
     def find_path(self):
         node1 = input("ID del nodo origen: ")
         node2 = input("ID del nodo destino: ")
@@ -917,8 +1813,9 @@ def create_example_topology_file(filename="example_topology.json"):
 # Función principal
 def main():
     """Función principal del programa"""
-    # Crear archivo de ejemplo de topología
-    create_example_topology_file()
+    # Crear archivo de ejemplo de topología solo si no existe
+    if not os.path.exists("example_topology.json"):
+        create_example_topology_file()
     
     # Iniciar la interfaz CLI
     cli = LanSimulatorCLI()
@@ -0,0 +1,120 @@
+"""
+Caché LRU de rutas del Simulador de Red LAN
+Proyecto Final - Redes Computacionales y Análisis de Algoritmos
+
+Guarda los resultados (distancia, ruta) de find_shortest_path con la clave
+(origen, destino, época de la topología). El simulador incrementa la época en
+cada falla, restauración o cambio de conexiones, así que las rutas viejas
+dejan de coincidir sin recorrer la caché y salen por el extremo LRU.
+
+Para que muchas rutas quepan en memoria, los nodos se traducen una sola vez a
+índices enteros; la clave es un solo entero y cada ruta se guarda como un
+bloque de bytes (la distancia como double y los índices como enteros de 32
+bits), unos 220 bytes por ruta de 10 saltos incluida la entrada del diccionario.
+Por eso la caché admite a lo sumo 2^32 ids de nodo distintos: el origen y el
+destino ocupan 32 bits cada uno en la clave y la época los bits de arriba.
+"""
+
+from array import array
+from collections import OrderedDict
+from math import inf
+
+_MAX_NODES = 1 << 32  # Los índices de nodo se empaquetan en 32 bits (clave y array "I")
+
+
+class RouteCache:
+    """Caché LRU acotada de rutas más cortas"""
+
+    def __init__(self, maxsize=4096):
+        """
+        Inicializa la caché
+
+        Args:
+            maxsize (int): Número máximo de rutas guardadas
+        """
+        if maxsize <= 0:
+            raise ValueError("El tamaño de la caché de rutas debe ser positivo")
+        self.maxsize = maxsize
+        # clave (época << 64) | (origen << 32) | destino -> bytes (distancia, índices)
+        self.entries = OrderedDict()
+        self.index = {}               # id de nodo -> índice
+        self.names = []               # índice -> id de nodo
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _intern(self, node_id):
+        position = self.index.get(node_id)
+        if position is None:
+            if len(self.names) >= _MAX_NODES:
+                raise ValueError("La caché de rutas admite a lo sumo 2^32 nodos distintos")
+            position = self.index[node_id] = len(self.names)
+            self.names.append(node_id)
+        return position
+
+    def get(self, source_id, target_id, epoch):
+        """
+        Busca una ruta
+
+        Returns:
+            tuple: (distancia, lista de ids) o None si no está en la caché
+                   (distancia None indica que no hay camino)
+        """
+        source, target = self.index.get(source_id), self.index.get(target_id)
+        entry = None
+        if source is not None and target is not None:
+            key = (epoch << 64) | (source << 32) | target
+            entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        distance = array("d", entry[:8])[0]
+        if distance == inf:
+            return None, []
+        names = self.names
+        return distance, [names[position] for position in array("I", entry[8:])]
+
+    def put(self, source_id, target_id, epoch, distance, path):
+        """Guarda una ruta (distance None si no hay camino), desalojando la menos usada"""
+        intern = self._intern
+        key = (epoch << 64) | (intern(source_id) << 32) | intern(target_id)
+        record = array("d", (inf if distance is None else distance,)).tobytes()
+        self.entries[key] = record + array("I", [intern(node_id) for node_id in path]).tobytes()
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def resize(self, maxsize):
+        """Cambia el tamaño máximo, desalojando las rutas sobrantes"""
+        if maxsize <= 0:
+            raise ValueError("El tamaño de la caché de rutas debe ser positivo")
+        self.maxsize = maxsize
+        while len(self.entries) > maxsize:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        """Vacía la caché (los contadores se conservan)"""
+        self.entries.clear()
+        self.index.clear()
+        self.names.clear()
+
+    def stats(self):
+        """
+        Contadores de la caché
+
+        Returns:
+            dict: size, maxsize, hits, misses, evictions y hit_rate
+        """
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self.entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
@@ -0,0 +1,260 @@
+"""
+Resolución de sudokus con máscaras de bits y propagación de restricciones
+
+En lugar de es_valido (13Fuerzabruta.py), que recorre fila, columna y caja
+por cada número probado, se lleva una máscara de 9 bits por fila, columna y
+caja con los dígitos ya usados: los candidatos de una celda son
+~(fila | columna | caja). Antes de probar valores se propaga:
+
+- Único candidato (naked single): una celda con un solo candidato lo recibe.
+- Único lugar (hidden single): un dígito que solo cabe en una celda de una
+  fila, columna o caja va ahí.
+
+Cuando no se puede deducir más, se ramifica en la celda con menos candidatos
+(MRV). El modo por lotes reparte los sudokus de un archivo (uno por línea,
+81 caracteres con 0 o . en las vacías) entre los procesos de un pool.
+
+Uso:
+    python sudoku.py                           # resuelve el tablero de ejemplo
+    python sudoku.py sudokus.txt --salida soluciones.txt --procesos 4
+"""
+
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+
+TODOS = 0x1FF  # Dígitos 1-9 como bits 0-8
+
+FILA = [c // 9 for c in range(81)]
+COLUMNA = [c % 9 for c in range(81)]
+CAJA = [(c // 27) * 3 + (c % 9) // 3 for c in range(81)]
+UNIDADES = ([[f * 9 + c for c in range(9)] for f in range(9)]
+            + [[f * 9 + c for f in range(9)] for c in range(9)]
+            + [[c for c in range(81) if CAJA[c] == b] for b in range(9)])
+DIGITO = {1 << d: d + 1 for d in range(9)}
+BITS = [bin(m).count("1") for m in range(512)]
+
+# Con menos sudokus que esto no vale la pena crear procesos
+MIN_POR_PROCESO = 64
+
+
+def leer_tablero(texto):
+    """
+    Convierte una línea de 81 caracteres (0 o . para las vacías) en un tablero 9x9
+    """
+    celdas = [c for c in texto if not c.isspace()]
+    if len(celdas) != 81:
+        raise ValueError(f"Se esperaban 81 celdas y hay {len(celdas)}")
+    valores = [0 if c in ".0" else int(c) for c in celdas]
+    return [valores[f * 9:f * 9 + 9] for f in range(9)]
+
+
+def a_texto(tablero):
+    """Tablero 9x9 como línea de 81 dígitos (0 en las vacías)"""
+    return "".join(str(num) for fila in tablero for num in fila)
+
+
+def imprimir_tablero(tablero):
+    for fila in tablero:
+        print(" ".join(str(num) if num != 0 else "." for num in fila))
+
+
+def _colocar(t, filas, columnas, cajas, celda, bit):
+    t[celda] = DIGITO[bit]
+    filas[FILA[celda]] |= bit
+    columnas[COLUMNA[celda]] |= bit
+    cajas[CAJA[celda]] |= bit
+
+
+def _propagar(t, filas, columnas, cajas):
+    """
+    Aplica único candidato y único lugar hasta que no haya cambios
+
+    Returns:
+        False si hay contradicción, None si quedó resuelto, o (celda, candidatos)
+        de la celda vacía con menos candidatos
+    """
+    while True:
+        cambio = False
+        mejor, mejor_candidatos, mejor_cuenta = -1, 0, 10
+        for celda in range(81):
+            if t[celda]:
+                continue
+            candidatos = ~(filas[FILA[celda]] | columnas[COLUMNA[celda]] | cajas[CAJA[celda]]) & TODOS
+            if not candidatos:
+                return False
+            if not candidatos & (candidatos - 1):
+                _colocar(t, filas, columnas, cajas, celda, candidatos)
+                cambio = True
+            elif BITS[candidatos] < mejor_cuenta:
+                mejor, mejor_candidatos, mejor_cuenta = celda, candidatos, BITS[candidatos]
+        if cambio:
+            continue
+        if mejor < 0:
+            return None
+        for unidad in UNIDADES:
+            una_vez = varias = usados = 0
+            for celda in unidad:
+                if t[celda]:
+                    usados |= 1 << (t[celda] - 1)
+                    continue
+                candidatos = ~(filas[FILA[celda]] | columnas[COLUMNA[celda]] | cajas[CAJA[celda]]) & TODOS
+                varias |= una_vez & candidatos
+                una_vez |= candidatos
+            if (una_vez | usados) != TODOS:
+                return False  # Un dígito que falta no cabe en ninguna celda
+            unicos = una_vez & ~varias
+            while unicos:
+                bit = unicos & -unicos
+                unicos ^= bit
+                for celda in unidad:
+                    if not t[celda] and not (filas[FILA[celda]] | columnas[COLUMNA[celda]]
+                                             | cajas[CAJA[celda]]) & bit:
+                        _colocar(t, filas, columnas, cajas, celda, bit)
+                        cambio = True
+                        break
+                else:
+                    return False  # Otro único lugar de la misma unidad ocupó la celda
+        if not cambio:
+            return mejor, mejor_candidatos
+
+
+def _buscar(t, filas, columnas, cajas):
+    resultado = _propagar(t, filas, columnas, cajas)
+    if resultado is False:
+        return None
+    if resultado is None:
+        return t
+    celda, candidatos = resultado
+    while candidatos:
+        bit = candidatos & -candidatos
+        candidatos ^= bit
+        copia, copia_filas, copia_columnas, copia_cajas = t[:], filas[:], columnas[:], cajas[:]
+        _colocar(copia, copia_filas, copia_columnas, copia_cajas, celda, bit)
+        solucion = _buscar(copia, copia_filas, copia_columnas, copia_cajas)
+        if solucion is not None:
+            return solucion
+    return None
+
+
+def resolver(tablero):
+    """
+    Resuelve un sudoku
+
+    Args:
+        tablero (list): 9x9 con 0 en las celdas vacías (no se modifica)
+
+    Returns:
+        list: Tablero 9x9 resuelto, o None si no tiene solución
+    """
+    t = [num for fila in tablero for num in fila]
+    filas, columnas, cajas = [0] * 9, [0] * 9, [0] * 9
+    for celda, num in enumerate(t):
+        if not num:
+            continue
+        bit = 1 << (num - 1)
+        if (filas[FILA[celda]] | columnas[COLUMNA[celda]] | cajas[CAJA[celda]]) & bit:
+            return None  # Las pistas ya se contradicen
+        _colocar(t, filas, columnas, cajas, celda, bit)
+    solucion = _buscar(t, filas, columnas, cajas)
+    if solucion is None:
+        return None
+    return [solucion[f * 9:f * 9 + 9] for f in range(9)]
+
+
+def _resolver_linea(linea):
+    """
+    Resuelve un sudoku en texto
+
+    Returns:
+        str: La solución en texto, '' si no tiene o None si la línea no es un
+             tablero válido (así una línea mal escrita no detiene todo el lote)
+    """
+    try:
+        tablero = leer_tablero(linea)
+    except ValueError:
+        return None
+    solucion = resolver(tablero)
+    return a_texto(solucion) if solucion is not None else ""
+
+
+def resolver_lote(lineas, procesos=None):
+    """
+    Resuelve muchos sudokus en texto, en paralelo si son suficientes
+
+    Args:
+        lineas (list): Sudokus de 81 caracteres
+        procesos (int): Procesos del pool (None = núcleos disponibles, 1 = sin pool)
+
+    Returns:
+        list: Soluciones en texto, en el mismo orden ('' si no tiene solución,
+              None si la línea no es un tablero válido)
+    """
+    lineas = list(lineas)
+    if procesos is None:
+        procesos = os.cpu_count() or 1
+    procesos = min(procesos, max(1, len(lineas) // MIN_POR_PROCESO))
+    if procesos <= 1:
+        return [_resolver_linea(linea) for linea in lineas]
+    with multiprocessing.Pool(procesos) as pool:
+        return pool.map(_resolver_linea, lineas, chunksize=max(1, len(lineas) // (procesos * 8)))
+
+
+def resolver_archivo(entrada, salida=None, procesos=None):
+    """
+    Resuelve un archivo de sudokus (uno por línea; se ignoran las vacías y las que empiezan con #)
+
+    Returns:
+        tuple: (resueltos, total, segundos)
+    """
+    with open(entrada) as file:
+        lineas = [linea.strip() for linea in file if linea.strip() and not linea.startswith("#")]
+    inicio = time.perf_counter()
+    soluciones = resolver_lote(lineas, procesos)
+    segundos = time.perf_counter() - inicio
+    if salida:
+        with open(salida, "w") as file:
+            for solucion in soluciones:
+                if solucion is None:
+                    solucion = "entrada inválida"
+                file.write((solucion or "sin solución") + "\n")
+    return sum(1 for solucion in soluciones if solucion), len(lineas), segundos
+
+
+# Tablero de 13Fuerzabruta.py
+EJEMPLO = [
+    [5, 3, 0, 0, 7, 0, 0, 0, 0],
+    [6, 0, 0, 1, 9, 5, 0, 0, 0],
+    [0, 9, 8, 0, 0, 0, 0, 6, 0],
+    [8, 0, 0, 0, 6, 0, 0, 0, 3],
+    [4, 0, 0, 8, 0, 3, 0, 0, 1],
+    [7, 0, 0, 0, 2, 0, 0, 0, 6],
+    [0, 6, 0, 0, 0, 0, 2, 8, 0],
+    [0, 0, 0, 4, 1, 9, 0, 0, 5],
+    [0, 0, 0, 0, 8, 0, 0, 7, 9]
+]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Resolución de sudokus")
+    parser.add_argument("archivo", nargs="?", help="Archivo con un sudoku por línea")
+    parser.add_argument("--salida", help="Archivo donde escribir las soluciones")
+    parser.add_argument("--procesos", type=int, help="Procesos del pool (por defecto, los núcleos)")
+    args = parser.parse_args(argv)
+
+    if not args.archivo:
+        print("Sudoku de ejemplo:")
+        imprimir_tablero(EJEMPLO)
+        print("\nSolución:")
+        imprimir_tablero(resolver(EJEMPLO))
+        return 0
+    resueltos, total, segundos = resolver_archivo(args.archivo, args.salida, args.procesos)
+    ritmo = total / segundos if segundos else 0.0
+    print(f"{resueltos}/{total} sudokus resueltos en {segundos:.2f}s ({ritmo:.0f} por segundo)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
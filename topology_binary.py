@@ -0,0 +1,265 @@
+"""
+Formato binario de topología mapeado en memoria (mmap) para el Simulador de Red LAN
+Proyecto Final - Redes Computacionales y Análisis de Algoritmos
+
+Un solo archivo con secciones alineadas a 8 bytes: coordenadas, estado, recursos,
+identificadores y la lista de adyacencia en formato CSR (offsets + destinos + pesos).
+MappedTopology abre el archivo con mmap y lee las secciones como memoryview, sin
+analizar nada, así que se puede enrutar apenas se abre el archivo.
+"""
+
+import heapq
+import mmap
+import struct
+import sys
+from array import array
+from math import inf
+
+MAGIC = b"LANTOPO1"
+VERSION = 1
+
+# Secciones en orden fijo: (nombre, código de tipo de array)
+SECTIONS = (
+    ("coords", "d"),        # x, y de cada nodo (2 por nodo)
+    ("active", "B"),        # 1 si el nodo está activo
+    ("adj_offsets", "Q"),   # CSR: inicio de los vecinos de cada nodo (n + 1)
+    ("adj_targets", "I"),   # CSR: índice del vecino
+    ("adj_weights", "d"),   # CSR: peso de la conexión
+    ("res_offsets", "I"),   # Inicio de los recursos de cada nodo (n + 1)
+    ("res_types", "H"),     # Índice del tipo de recurso en la tabla de cadenas
+    ("res_counts", "i"),    # Cantidad disponible del recurso
+    ("id_offsets", "Q"),    # Inicio del id de cada nodo en id_blob (n + 1)
+    ("id_blob", "B"),
+    ("name_offsets", "Q"),  # Inicio del nombre de cada nodo en name_blob (n + 1)
+    ("name_blob", "B"),
+    ("node_types", "H"),    # Índice del tipo de nodo en la tabla de cadenas
+    ("table_offsets", "I"), # Tabla de cadenas compartida (tipos de nodo y recurso)
+    ("table_blob", "B"),
+    ("id_order", "I"),      # Índices de nodo ordenados por id (búsqueda binaria)
+)
+
+_HEADER = struct.Struct("<8sIIBxxxQQ")  # magic, versión, n secciones, orden de bytes, nodos, aristas
+_SECTION = struct.Struct("<QQ")  # offset, cantidad de elementos
+_LITTLE = 1 if sys.byteorder == "little" else 0
+
+
+def _blob(strings):
+    """Concatena cadenas UTF-8 y devuelve (offsets, blob)"""
+    offsets = array("Q", [0])
+    blob = bytearray()
+    for text in strings:
+        blob += text.encode("utf-8")
+        offsets.append(len(blob))
+    return offsets, array("B", blob)
+
+
+def write_topology_binary(simulator, filename):
+    """
+    Exporta la topología de un simulador al formato binario
+
+    Args:
+        simulator (LanSimulator): Simulador con nodos y conexiones
+        filename (str): Ruta del archivo de salida
+
+    Returns:
+        tuple: (nodos, conexiones no dirigidas) escritos
+    """
+    node_ids = list(simulator.nodes)
+    index = {node_id: i for i, node_id in enumerate(node_ids)}
+    table = {}  # cadena -> índice en la tabla compartida
+
+    def intern(text):
+        if text not in table:
+            table[text] = len(table)
+        return table[text]
+
+    data = {name: array(code) for name, code in SECTIONS}
+    data["adj_offsets"].append(0)
+    num_connections = 0  # Conexiones no dirigidas: un lazo aparece una sola vez en la adyacencia
+    data["res_offsets"].append(0)
+    for node_id in node_ids:
+        node = simulator.nodes[node_id]
+        data["coords"].extend((float(node.location[0]), float(node.location[1])))
+        data["active"].append(1 if node.active else 0)
+        data["node_types"].append(intern(node.node_type))
+        for resource in node.resources:
+            data["res_types"].append(intern(resource["type"]))
+            data["res_counts"].append(resource["count"])
+        data["res_offsets"].append(len(data["res_types"]))
+        for neighbor_id, weight in simulator.connections.get(node_id, {}).items():
+            data["adj_targets"].append(index[neighbor_id])
+            data["adj_weights"].append(weight)
+            if index[neighbor_id] >= index[node_id]:
+                num_connections += 1
+        data["adj_offsets"].append(len(data["adj_targets"]))
+
+    data["id_offsets"], data["id_blob"] = _blob(node_ids)
+    data["name_offsets"], data["name_blob"] = _blob(simulator.nodes[n].name for n in node_ids)
+    data["table_offsets"], data["table_blob"] = _blob(table)
+    data["table_offsets"] = array("I", data["table_offsets"])
+    data["id_order"] = array("I", sorted(range(len(node_ids)), key=node_ids.__getitem__))
+
+    # Calcular offsets alineados de cada sección
+    offset = _HEADER.size + _SECTION.size * len(SECTIONS)
+    table_entries = []
+    for name, _ in SECTIONS:
+        offset = (offset + 7) & ~7
+        table_entries.append((offset, len(data[name])))
+        offset += len(data[name]) * data[name].itemsize
+
+    with open(filename, "wb") as file:
+        file.write(_HEADER.pack(MAGIC, VERSION, len(SECTIONS), _LITTLE,
+                                len(node_ids), len(data["adj_targets"])))
+        for entry in table_entries:
+            file.write(_SECTION.pack(*entry))
+        for (name, _), (section_offset, _) in zip(SECTIONS, table_entries):
+            file.write(b"\0" * (section_offset - file.tell()))
+            data[name].tofile(file)
+
+    return len(node_ids), num_connections
+
+
+def is_topology_binary(filename):
+    """Indica si un archivo tiene el formato binario de topología"""
+    with open(filename, "rb") as file:
+        return file.read(len(MAGIC)) == MAGIC
+
+
+class MappedTopology:
+    """Topología de solo lectura respaldada por un archivo binario mapeado en memoria"""
+
+    def __init__(self, filename):
+        """
+        Abre y mapea un archivo de topología binaria
+
+        Args:
+            filename (str): Ruta del archivo generado por write_topology_binary
+
+        Raises:
+            ValueError: Si el archivo no tiene el formato esperado
+        """
+        self.filename = filename
+        with open(filename, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = view = memoryview(self._mmap)
+        if len(view) < _HEADER.size:
+            raise ValueError(f"Archivo de topología binaria inválido: {filename}")
+        magic, version, num_sections, little, self.num_nodes, self.num_edges = _HEADER.unpack_from(view, 0)
+        if magic != MAGIC or version != VERSION or num_sections != len(SECTIONS):
+            raise ValueError(f"Archivo de topología binaria inválido o de otra versión: {filename}")
+        if little != _LITTLE:
+            raise ValueError("El archivo de topología fue generado con otro orden de bytes")
+
+        for i, (name, code) in enumerate(SECTIONS):
+            offset, count = _SECTION.unpack_from(view, _HEADER.size + i * _SECTION.size)
+            size = array(code).itemsize
+            setattr(self, name, view[offset:offset + count * size].cast(code))
+
+    def close(self):
+        """Libera las vistas y el mapeo de memoria"""
+        for name, _ in SECTIONS:
+            getattr(self, name).release()
+        self._view.release()
+        self._mmap.close()
+
+    def __len__(self):
+        return self.num_nodes
+
+    def _string(self, offsets, blob, i):
+        return bytes(blob[offsets[i]:offsets[i + 1]]).decode("utf-8")
+
+    def node_id(self, i):
+        """Id del nodo con índice i"""
+        return self._string(self.id_offsets, self.id_blob, i)
+
+    def node_name(self, i):
+        """Nombre del nodo con índice i"""
+        return self._string(self.name_offsets, self.name_blob, i)
+
+    def node_type(self, i):
+        """Tipo del nodo con índice i"""
+        return self._string(self.table_offsets, self.table_blob, self.node_types[i])
+
+    def location(self, i):
+        """Coordenadas (x, y) del nodo con índice i"""
+        return self.coords[2 * i], self.coords[2 * i + 1]
+
+    def resources(self, i):
+        """Lista de recursos [{"type", "count"}] del nodo con índice i"""
+        return [
+            {"type": self._string(self.table_offsets, self.table_blob, self.res_types[k]),
+             "count": self.res_counts[k]}
+            for k in range(self.res_offsets[i], self.res_offsets[i + 1])
+        ]
+
+    def neighbors(self, i):
+        """Pares (índice vecino, peso) del nodo con índice i"""
+        start, end = self.adj_offsets[i], self.adj_offsets[i + 1]
+        return zip(self.adj_targets[start:end], self.adj_weights[start:end])
+
+    def index_of(self, node_id):
+        """
+        Índice de un nodo por su id, con búsqueda binaria sobre id_order
+
+        Returns:
+            int: Índice del nodo o None si no existe
+        """
+        target = node_id.encode("utf-8")
+        order, offsets, blob = self.id_order, self.id_offsets, self.id_blob
+        low, high = 0, self.num_nodes
+        while low < high:
+            mid = (low + high) // 2
+            i = order[mid]
+            if bytes(blob[offsets[i]:offsets[i + 1]]).decode("utf-8") < node_id:
+                low = mid + 1
+            else:
+                high = mid
+        if low < self.num_nodes:
+            i = order[low]
+            if bytes(blob[offsets[i]:offsets[i + 1]]) == target:
+                return i
+        return None
+
+    def find_shortest_path(self, start_node_id, end_node_id):
+        """
+        Dijkstra directamente sobre la adyacencia CSR mapeada
+
+        Las distancias se guardan en un diccionario disperso, así que el costo
+        depende de la parte del grafo explorada y no del total de nodos.
+
+        Returns:
+            tuple: (distancia, lista de ids del camino) o (int, []) si no hay ruta,
+                   igual que LanSimulator.find_shortest_path
+        """
+        start = self.index_of(start_node_id)
+        end = self.index_of(end_node_id)
+        if start is None or end is None:
+            raise ValueError("Uno o ambos nodos no existen en la red")
+
+        offsets, targets, weights, active = self.adj_offsets, self.adj_targets, self.adj_weights, self.active
+        distances = {start: 0.0}
+        previous = {}
+        heap = [(0.0, start)]
+        while heap:
+            current_dist, current = heapq.heappop(heap)
+            if current == end:
+                break
+            if current_dist > distances[current]:
+                continue
+            for k in range(offsets[current], offsets[current + 1]):
+                neighbor = targets[k]
+                if not active[neighbor]:
+                    continue
+                distance = current_dist + weights[k]
+                if distance < distances.get(neighbor, inf):
+                    distances[neighbor] = distance
+                    previous[neighbor] = current
+                    heapq.heappush(heap, (distance, neighbor))
+
+        if end not in distances:
+            return int, []
+        path = [end]
+        while path[-1] != start:
+            path.append(previous[path[-1]])
+        path.reverse()
+        return distances[end], [self.node_id(i) for i in path]
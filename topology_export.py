@@ -0,0 +1,167 @@
+"""
+Exportación incremental (streaming) de topologías del Simulador de Red LAN
+Proyecto Final - Redes Computacionales y Análisis de Algoritmos
+
+Escribe la red en formato Graphviz DOT, GraphML o lista de aristas sin construir
+estructuras auxiliares del tamaño del grafo: cada conexión no dirigida se emite
+una sola vez (cuando el id del origen es menor o igual que el del destino, así
+los lazos también salen) y la salida pasa por el búfer del archivo. Permite
+exportar solo una parte de la red (una zona, los nodos a k saltos de un nodo o
+el vecindario de los nodos caídos).
+"""
+
+from collections import deque
+from xml.sax.saxutils import escape, quoteattr
+
+FORMATS = ("dot", "graphml", "edgelist")
+_BUFFER_SIZE = 1 << 16  # Bytes del búfer de escritura del archivo
+
+
+def nodes_in_zone(simulator, zone_key):
+    """
+    Nodos cuya ubicación cae en una zona (misma clave que _get_zone_key)
+
+    Args:
+        simulator (LanSimulator): Simulador de origen
+        zone_key (str | tuple): Clave "x_y" o coordenadas dentro de la zona
+
+    Returns:
+        set: Ids de los nodos de la zona
+    """
+    if not isinstance(zone_key, str):
+        zone_key = simulator._get_zone_key(zone_key)
+    return {node_id for node_id, node in simulator.nodes.items()
+            if simulator._get_zone_key(node.location) == zone_key}
+
+
+def nodes_within_hops(simulator, center_ids, hops):
+    """
+    Nodos a lo sumo a `hops` saltos de alguno de los nodos centrales (BFS)
+
+    Args:
+        simulator (LanSimulator): Simulador de origen
+        center_ids (iterable): Ids de los nodos de partida
+        hops (int): Número máximo de saltos
+
+    Returns:
+        set: Ids de los nodos alcanzados (incluye los centrales)
+    """
+    selected = set()
+    queue = deque()
+    for node_id in center_ids:
+        if node_id not in simulator.nodes:
+            raise ValueError(f"El nodo {node_id} no existe en la red")
+        selected.add(node_id)
+        queue.append((node_id, 0))
+    while queue:
+        node_id, depth = queue.popleft()
+        if depth == hops:
+            continue
+        for neighbor in simulator.connections[node_id]:
+            if neighbor not in selected:
+                selected.add(neighbor)
+                queue.append((neighbor, depth + 1))
+    return selected
+
+
+def failed_neighbourhood(simulator, hops=1):
+    """Nodos caídos y los nodos a `hops` saltos de ellos"""
+    failed = [node_id for node_id, node in simulator.nodes.items() if not node.active]
+    return nodes_within_hops(simulator, failed, hops)
+
+
+def iter_edges(simulator, selected=None):
+    """
+    Recorre cada conexión no dirigida una sola vez
+
+    Args:
+        simulator (LanSimulator): Simulador de origen
+        selected (set): Limitar a conexiones entre estos nodos (None = todas)
+
+    Yields:
+        tuple: (node1_id, node2_id, weight) con node1_id <= node2_id
+    """
+    for node1_id in _ordered(simulator, selected):
+        for node2_id, weight in simulator.connections[node1_id].items():
+            if node1_id <= node2_id and (selected is None or node2_id in selected):
+                yield node1_id, node2_id, weight
+
+
+def _ordered(simulator, selected):
+    """
+    Ids a exportar
+
+    La red completa y los subgrafos grandes salen en el orden de inserción de
+    la red. Un subgrafo pequeño (menos de un cuarto de los nodos) sale ordenado
+    por id, para no recorrer toda la red solo para conservar ese orden.
+    """
+    if selected is None:
+        return simulator.nodes
+    if len(selected) * 4 < len(simulator.nodes):
+        return sorted(selected)  # Subgrafo pequeño: evitar recorrer toda la red
+    return [node_id for node_id in simulator.nodes if node_id in selected]
+
+
+def _write_dot(out, simulator, node_ids, selected):
+    out.write("graph LAN {\n")  # Grafo no dirigido
+    out.write("  node [shape=circle];\n")
+    for node_id in node_ids:
+        node = simulator.nodes[node_id]
+        color = "green" if node.active else "red"
+        out.write(f'  "{node_id}" [label="{node.name}\\n{node.node_type}", color={color}];\n')
+    for node1_id, node2_id, weight in iter_edges(simulator, selected):
+        out.write(f'  "{node1_id}" -- "{node2_id}" [label="{weight:.2f}"];\n')
+    out.write("}\n")
+
+
+def _write_graphml(out, simulator, node_ids, selected):
+    out.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+    out.write('<graphml xmlns="http://graphml.graphdrawing.org/xmlns">\n')
+    out.write('  <key id="name" for="node" attr.name="name" attr.type="string"/>\n')
+    out.write('  <key id="type" for="node" attr.name="type" attr.type="string"/>\n')
+    out.write('  <key id="active" for="node" attr.name="active" attr.type="boolean"/>\n')
+    out.write('  <key id="x" for="node" attr.name="x" attr.type="double"/>\n')
+    out.write('  <key id="y" for="node" attr.name="y" attr.type="double"/>\n')
+    out.write('  <key id="weight" for="edge" attr.name="weight" attr.type="double"/>\n')
+    out.write('  <graph id="LAN" edgedefault="undirected">\n')
+    for node_id in node_ids:
+        node = simulator.nodes[node_id]
+        out.write(f'    <node id={quoteattr(node_id)}>'
+                  f'<data key="name">{escape(node.name)}</data>'
+                  f'<data key="type">{escape(node.node_type)}</data>'
+                  f'<data key="active">{"true" if node.active else "false"}</data>'
+                  f'<data key="x">{node.location[0]}</data>'
+                  f'<data key="y">{node.location[1]}</data></node>\n')
+    for node1_id, node2_id, weight in iter_edges(simulator, selected):
+        out.write(f'    <edge source={quoteattr(node1_id)} target={quoteattr(node2_id)}>'
+                  f'<data key="weight">{weight}</data></edge>\n')
+    out.write("  </graph>\n</graphml>\n")
+
+
+def _write_edgelist(out, simulator, node_ids, selected):
+    for node1_id, node2_id, weight in iter_edges(simulator, selected):
+        out.write(f"{node1_id} {node2_id} {weight}\n")
+
+
+_WRITERS = {"dot": _write_dot, "graphml": _write_graphml, "edgelist": _write_edgelist}
+
+
+def export_topology(simulator, filename, fmt="dot", selected=None):
+    """
+    Exporta la topología (o un subgrafo) en el formato indicado
+
+    Args:
+        simulator (LanSimulator): Simulador de origen
+        filename (str): Archivo de salida
+        fmt (str): "dot", "graphml" o "edgelist"
+        selected (set): Ids de los nodos del subgrafo (None = toda la red)
+
+    Returns:
+        int: Número de nodos exportados
+    """
+    if fmt not in _WRITERS:
+        raise ValueError(f"Formato de exportación no válido: {fmt} (use {', '.join(FORMATS)})")
+    node_ids = _ordered(simulator, selected)
+    with open(filename, "w", encoding="utf-8", buffering=_BUFFER_SIZE) as file:
+        _WRITERS[fmt](file, simulator, node_ids, selected)
+    return len(node_ids)
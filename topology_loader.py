@@ -0,0 +1,143 @@
+"""
+Lector incremental (streaming) de topologías JSON para el Simulador de Red LAN
+Proyecto Final - Redes Computacionales y Análisis de Algoritmos
+
+Recorre las listas "nodes" y "connections" del archivo elemento por elemento,
+leyendo bloques de tamaño fijo, de modo que la memoria usada depende del grafo
+resultante y no del tamaño del texto JSON.
+"""
+
+import codecs
+import json
+
+_WHITESPACE = " \t\n\r"
+_TRUNCATED_TAIL = 16  # Caracteres finales donde un valor puede estar cortado ("-Infinity", "\\uXXXX")
+STREAMED_KEYS = ("nodes", "connections")  # Listas que se recorren elemento a elemento
+
+
+class _JsonStream:
+    """Búfer de texto sobre un archivo binario, con lectura por bloques"""
+
+    def __init__(self, file, chunk_size):
+        self.file = file
+        self.chunk_size = chunk_size
+        self.decoder = codecs.getincrementaldecoder("utf-8")()
+        self.json_decoder = json.JSONDecoder()
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+        self.bytes_read = 0
+
+    def fill(self):
+        """Lee el siguiente bloque; devuelve False si ya no hay más datos"""
+        if self.eof:
+            return False
+        chunk = self.file.read(self.chunk_size)
+        self.bytes_read += len(chunk)
+        if not chunk:
+            self.eof = True
+            self.buf = self.buf[self.pos:] + self.decoder.decode(b"", final=True)
+        else:
+            self.buf = self.buf[self.pos:] + self.decoder.decode(chunk)
+        self.pos = 0
+        return True
+
+    def next_char(self):
+        """Consume y devuelve el siguiente carácter que no sea espacio ('' al final)"""
+        while True:
+            buf, pos = self.buf, self.pos
+            while pos < len(buf) and buf[pos] in _WHITESPACE:
+                pos += 1
+            self.pos = pos
+            if pos < len(buf):
+                self.pos = pos + 1
+                return buf[pos]
+            if not self.fill():
+                return ""
+
+    def peek_char(self):
+        """Devuelve el siguiente carácter que no sea espacio sin consumirlo"""
+        char = self.next_char()
+        if char:
+            self.pos -= 1
+        return char
+
+    def expect(self, expected):
+        """Consume el carácter esperado o lanza ValueError"""
+        char = self.next_char()
+        if char != expected:
+            raise ValueError(
+                f"JSON inválido cerca del byte {self.bytes_read}: se esperaba "
+                f"'{expected}' y se encontró '{char or 'fin de archivo'}'")
+
+    def _truncated(self, error):
+        """
+        Indica si un error de decodificación se debe a que el valor sigue en el próximo bloque
+
+        Un valor cortado falla en los últimos caracteres del búfer o deja una
+        cadena sin cerrar; cualquier otro error es de sintaxis y no se corrige
+        leyendo más (hacerlo cargaría en memoria todo el resto del archivo).
+        """
+        return (error.pos >= len(self.buf) - _TRUNCATED_TAIL
+                or error.msg.startswith("Unterminated string"))
+
+    def value(self):
+        """Decodifica un valor JSON completo, leyendo más bloques si hace falta"""
+        self.peek_char()
+        while True:
+            try:
+                value, end = self.json_decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError as error:
+                if self._truncated(error) and self.fill():
+                    continue
+                position = self.bytes_read - (len(self.buf) - error.pos)
+                raise ValueError(f"JSON inválido cerca del byte {position}: {error.msg}") from None
+            # Un número al final del búfer podría continuar en el siguiente bloque
+            if end == len(self.buf) and self.fill():
+                continue
+            self.pos = end
+            return value
+
+
+def iter_topology(filename, chunk_size=1 << 20):
+    """
+    Recorre un archivo de topología sin cargarlo completo en memoria
+
+    Args:
+        filename (str): Ruta al archivo JSON de topología
+        chunk_size (int): Tamaño en bytes de cada bloque leído
+
+    Yields:
+        tuple: (clave, elemento, bytes leídos) con clave "nodes" o "connections"
+    """
+    with open(filename, "rb") as file:
+        stream = _JsonStream(file, chunk_size)
+        stream.expect("{")
+        if stream.peek_char() == "}":
+            return
+        while True:
+            key = stream.value()
+            if not isinstance(key, str):
+                raise ValueError(f"JSON inválido cerca del byte {stream.bytes_read}: clave no válida")
+            stream.expect(":")
+            if key in STREAMED_KEYS:
+                stream.expect("[")
+                if stream.peek_char() == "]":
+                    stream.next_char()
+                else:
+                    while True:
+                        yield key, stream.value(), stream.bytes_read
+                        char = stream.next_char()
+                        if char == "]":
+                            break
+                        if char != ",":
+                            raise ValueError(
+                                f"JSON inválido cerca del byte {stream.bytes_read}: "
+                                f"se esperaba ',' o ']' en la lista '{key}'")
+            else:
+                stream.value()  # Otras claves se ignoran
+            char = stream.next_char()
+            if char == "}":
+                return
+            if char != ",":
+                raise ValueError(f"JSON inválido cerca del byte {stream.bytes_read}: se esperaba ',' o '}}'")
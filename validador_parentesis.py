@@ -0,0 +1,265 @@
+"""
+Validador de paréntesis, corchetes y llaves por bloques
+
+Generaliza 15ejercicio.py: en vez de convertir toda la entrada en una lista,
+lee un archivo o flujo por bloques (memoria constante salvo la pila de
+aperturas pendientes) e informa la posición exacta del primer error (offset
+en bytes y línea/columna). Los pares de símbolos se pueden configurar y el
+contenido entre comillas se ignora (con \\ como escape).
+
+Camino rápido: una expresión regular precompilada quita en C los textos
+entre comillas, bytes.translate borra todo lo que no es un símbolo y solo se
+recorren los símbolos que quedan, después de cancelar en C los pares
+adyacentes como "()" (cancelarlos no cambia el resultado). Si ese recorrido
+encuentra un error, el bloque se repite con otra expresión que da la
+posición de cada símbolo.
+
+Uso:
+    python validador_parentesis.py                       # pide una ecuación, como 15ejercicio.py
+    python validador_parentesis.py codigo.c --pares "()[]{}<>"
+"""
+
+import argparse
+import re
+import sys
+import time
+
+TAMAÑO_BLOQUE = 1 << 20
+BARRA = ord("\\")  # No puede ser parte de un par: es el escape dentro de los textos
+SALTO = ord("\n")
+RONDAS = 16  # Rondas de cancelación de pares adyacentes (acota el costo con anidamientos profundos)
+
+
+class ValidadorParentesis:
+    def __init__(self, pares="()[]{}", comillas="\"'"):
+        """
+        Args:
+            pares (str): Aperturas y cierres alternados, por ejemplo "()[]{}"
+            comillas (str): Delimitadores de texto cuyo contenido se ignora ("" = ninguno)
+        """
+        pares, comillas = pares.encode("ascii"), comillas.encode("ascii")
+        if not pares or len(pares) % 2:
+            raise ValueError("Los pares deben tener una apertura y un cierre cada uno")
+        simbolos = set(pares)
+        if len(simbolos) != len(pares) or simbolos & set(comillas) or BARRA in simbolos:
+            raise ValueError("Los símbolos de los pares y las comillas no se pueden repetir")
+        self.aperturas = set(pares[0::2])
+        self.cierres = dict(zip(pares[1::2], pares[0::2]))  # cierre -> apertura
+        self._juntos = [pares[i:i + 2] for i in range(0, len(pares), 2)]
+        self.comillas = set(comillas)
+        self._solo_pares = bytes(b for b in range(256) if b not in simbolos)
+        # Un texto completo entre comillas, o un símbolo (una comilla sola abre un texto que sigue en otro bloque)
+        textos = [_texto(bytes([comilla])) for comilla in comillas]
+        self._textos = re.compile(b"|".join(textos), re.DOTALL) if textos else None
+        self._patron = re.compile(b"|".join(textos + [b"[" + re.escape(pares + comillas) + b"]"]), re.DOTALL)
+        # Todo lo que está antes del primer texto sin cerrar (textos completos y lo que no es comilla)
+        self._antes_abierto = (re.compile(b"(?:[^" + re.escape(comillas) + b"]+|" + b"|".join(textos) + b")*",
+                                          re.DOTALL) if textos else None)
+        # Resto de un texto que empezó en un bloque anterior, hasta su comilla de cierre
+        self._fin_texto = {comilla: re.compile(_texto(bytes([comilla]))[len(re.escape(bytes([comilla]))):],
+                                               re.DOTALL) for comilla in comillas}
+        self.reiniciar()
+
+    def reiniciar(self):
+        self.pila = []             # Aperturas pendientes (como enteros)
+        self.comilla = None        # Comilla del texto abierto, o None
+        self.escapar = False       # El bloque anterior terminó en una \ sin pareja dentro de un texto
+        self.offset = 0            # Bytes ya procesados
+        self.lineas = 0            # Saltos de línea ya procesados
+        self.columna = 0           # Bytes desde el último salto de línea
+        self.error = None
+
+    def alimentar(self, bloque):
+        """
+        Procesa el siguiente bloque (bytes o str; str se codifica en UTF-8)
+
+        Returns:
+            bool: False si ya se encontró un error
+        """
+        if self.error is not None:
+            return False
+        if isinstance(bloque, str):
+            bloque = bloque.encode("utf-8")
+        if not bloque:
+            return True
+        guardado = (self.pila[:], self.comilla, self.escapar)
+        if self._rapido(bloque):
+            self._avanzar(bloque)
+            return True
+        self.pila, self.comilla, self.escapar = guardado  # Se repite con posiciones para ubicar el error
+        if not self._preciso(bloque):
+            return False
+        self._avanzar(bloque)
+        return True
+
+    def _inicio(self, bloque):
+        """Posición donde termina el texto entre comillas que viene del bloque anterior (None si no termina)"""
+        if self.comilla is None:
+            return 0
+        inicio = 1 if self.escapar else 0
+        fin = self._fin_texto[self.comilla].match(bloque, inicio)
+        if fin is None:
+            self.escapar = _escape_pendiente(bloque, inicio)
+            return None
+        self.comilla = None
+        self.escapar = False
+        return fin.end()
+
+    def _rapido(self, bloque):
+        inicio = self._inicio(bloque)
+        if inicio is None:
+            return True
+        resto = bloque[inicio:] if inicio else bloque
+        if any(comilla in resto for comilla in self.comillas):
+            original = resto
+            resto = self._textos.sub(b"", resto)
+            # Una comilla que quedó abre un texto que sigue en el próximo bloque
+            corte = min((resto.index(comilla) for comilla in self.comillas if comilla in resto), default=-1)
+            if corte >= 0:
+                # El escape pendiente se mira en el bloque original: sub pudo quitar textos que
+                # en realidad están dentro del texto abierto
+                abierto = self._antes_abierto.match(original).end()
+                self.comilla = original[abierto]
+                self.escapar = _escape_pendiente(original, abierto + 1)
+                resto = resto[:corte]
+        simbolos = resto.translate(None, self._solo_pares)
+        for _ in range(RONDAS):
+            reducidos = simbolos
+            for juntos in self._juntos:
+                reducidos = reducidos.replace(juntos, b"")
+            if len(reducidos) == len(simbolos):
+                break
+            simbolos = reducidos
+        pila, cierres = self.pila, self.cierres
+        for simbolo in simbolos:
+            apertura = cierres.get(simbolo)
+            if apertura is None:
+                pila.append(simbolo)
+            elif not pila or pila.pop() != apertura:
+                return False
+        return True
+
+    def _preciso(self, bloque):
+        pila, cierres, comillas = self.pila, self.cierres, self.comillas
+        inicio = self._inicio(bloque)
+        if inicio is None:
+            return True
+        for encontrado in self._patron.finditer(bloque, inicio):
+            posicion = encontrado.start()
+            simbolo = bloque[posicion]
+            if simbolo in comillas:
+                if encontrado.end() - posicion == 1:
+                    # El texto no se cierra en este bloque
+                    self.comilla = simbolo
+                    self.escapar = _escape_pendiente(bloque, posicion + 1)
+                    return True
+            elif simbolo in cierres:
+                if not pila:
+                    self._fallar(bloque, posicion, f"'{chr(simbolo)}' sin apertura")
+                    return False
+                apertura = pila.pop()
+                if apertura != cierres[simbolo]:
+                    self._fallar(bloque, posicion,
+                                 f"Se encontró '{chr(simbolo)}' pero faltaba cerrar '{chr(apertura)}'")
+                    return False
+            else:
+                pila.append(simbolo)
+        return True
+
+    def _avanzar(self, bloque):
+        self.offset += len(bloque)
+        self.lineas += bloque.count(SALTO)
+        ultimo = bloque.rfind(SALTO)
+        self.columna = len(bloque) - ultimo - 1 if ultimo >= 0 else self.columna + len(bloque)
+
+    def _fallar(self, bloque, posicion, mensaje):
+        ultimo = bloque.rfind(SALTO, 0, posicion)
+        self.error = {
+            "correcto": False,
+            "offset": self.offset + posicion,
+            "linea": self.lineas + bloque.count(SALTO, 0, posicion) + 1,
+            "columna": posicion - ultimo if ultimo >= 0 else self.columna + posicion + 1,
+            "mensaje": mensaje,
+        }
+
+    def terminar(self):
+        """
+        Resultado final
+
+        Returns:
+            dict: correcto y, si hay error, offset (bytes), linea, columna (desde 1) y mensaje
+        """
+        if self.error is not None:
+            return self.error
+        final = {"offset": self.offset, "linea": self.lineas + 1, "columna": self.columna + 1}
+        if self.comilla is not None:
+            return dict(final, correcto=False, mensaje=f"Texto entre {chr(self.comilla)} sin cerrar")
+        if self.pila:
+            pendientes = "".join(chr(simbolo) for simbolo in self.pila[-10:])
+            return dict(final, correcto=False,
+                        mensaje=f"Error: {len(self.pila)} símbolos sin cerrar (los últimos: {pendientes})")
+        return {"correcto": True}
+
+
+def _texto(comilla):
+    """Expresión de un texto entre comillas con escapes \\ (forma desenrollada, sin retroceso)"""
+    c = re.escape(comilla)
+    return c + b"[^" + c + b"\\\\]*(?:\\\\.[^" + c + b"\\\\]*)*" + c
+
+
+def _escape_pendiente(bloque, inicio):
+    """True si bloque[inicio:] (dentro de un texto) termina en una \\ sin pareja"""
+    cola = bloque[inicio:]
+    return (len(cola) - len(cola.rstrip(b"\\"))) % 2 == 1
+
+
+def validar_flujo(flujo, tamaño_bloque=TAMAÑO_BLOQUE, **opciones):
+    """Valida un archivo abierto (en modo texto o binario) leyéndolo por bloques"""
+    validador = ValidadorParentesis(**opciones)
+    while True:
+        bloque = flujo.read(tamaño_bloque)
+        if not bloque or not validador.alimentar(bloque):
+            break
+    return validador.terminar()
+
+
+def validar_archivo(ruta, tamaño_bloque=TAMAÑO_BLOQUE, **opciones):
+    with open(ruta, "rb") as flujo:
+        return validar_flujo(flujo, tamaño_bloque, **opciones)
+
+
+def validar_texto(texto, **opciones):
+    validador = ValidadorParentesis(**opciones)
+    validador.alimentar(texto)
+    return validador.terminar()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Validador de paréntesis, corchetes y llaves")
+    parser.add_argument("archivo", nargs="?", help="Archivo a validar (sin archivo, se pide una ecuación)")
+    parser.add_argument("--pares", default="()[]{}", help="Aperturas y cierres alternados")
+    parser.add_argument("--comillas", default="\"'", help="Delimitadores de texto a ignorar")
+    parser.add_argument("--bloque", type=int, default=TAMAÑO_BLOQUE, help="Bytes por bloque")
+    args = parser.parse_args(argv)
+    opciones = {"pares": args.pares, "comillas": args.comillas}
+
+    if args.archivo is None:
+        resultado = validar_texto(input("Por favor escriba una ecuación: "), **opciones)
+    else:
+        inicio = time.perf_counter()
+        resultado = validar_archivo(args.archivo, args.bloque, **opciones)
+        segundos = time.perf_counter() - inicio
+    if resultado["correcto"]:
+        print("La ecuación está correcta" if args.archivo is None else "El archivo está correcto")
+    else:
+        print(f"{resultado['mensaje']} (línea {resultado['linea']}, columna {resultado['columna']}, "
+              f"byte {resultado['offset']})")
+    if args.archivo is not None and segundos:
+        with open(args.archivo, "rb") as flujo:
+            tamaño = flujo.seek(0, 2)
+        print(f"{tamaño / 1e6:.1f} MB en {segundos:.3f}s ({tamaño / 1e6 / segundos:.0f} MB/s)")
+    return 0 if resultado["correcto"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())